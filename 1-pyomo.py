@@ -1,6 +1,19 @@
 import pyomo.environ as pyomo
+import numpy as np
 import os
 import time
+import problems as pr
+import limits as lim
+
+# Δήλωση global μεταβλητών
+FAST = True           # True για την γρήγορη λειτουργία: ConcreteModel από τους πίνακες NumPy και persistent solver (PersistentPyomo),
+                      # False για το AbstractModel με create_instance
+VERBOSE = False       # True για εκτύπωση του μοντέλου (pprint) και της λύσης (display) στο AbstractModel, που είναι αργή για μεγάλα προβλήματα
+SOLVER = "gurobi_persistent" # persistent solver της γρήγορης λειτουργίας
+
+# Φάσεις της επίλυσης ενός αρχείου προβλήματος που χρονομετρούνται: ανάγνωση του αρχείου, δημιουργία ή ενημέρωση του μοντέλου, επίλυση και
+# ανάγνωση της λύσης
+PHASES = ("parse", "build", "solve", "extract")
 
 # Αρχικοποίηση abstract μοντέλου
 model = pyomo.AbstractModel()
@@ -45,16 +58,146 @@ def equipment_constraint(m):
     return sum(m.x[i] for i in m.Projects) <= m.P
 
 model.equipment_cstr = pyomo.Constraint(rule=equipment_constraint)
+
+# Συνάρτηση build_concrete_model για την δημιουργία του μοντέλου ως ConcreteModel απευθείας από τους πίνακες NumPy των δεδομένων (χωρίς
+# create_instance). Τα δεδομένα είναι mutable παράμετροι, ώστε το μοντέλο να μπορεί να ενημερωθεί για άλλο πρόβλημα με το ίδιο N
+def build_concrete_model(N, F, S, P, performance, cost, staff):
+
+    m = pyomo.ConcreteModel()
+    m.Projects = pyomo.RangeSet(0, N - 1)
+    m.F = pyomo.Param(initialize=float(F), mutable=True)
+    m.S = pyomo.Param(initialize=float(S), mutable=True)
+    m.P = pyomo.Param(initialize=float(P), mutable=True)
+    m.performance = pyomo.Param(m.Projects, initialize=dict(enumerate(np.asarray(performance).tolist())), mutable=True)
+    m.cost = pyomo.Param(m.Projects, initialize=dict(enumerate(np.asarray(cost).tolist())), mutable=True)
+    m.staff = pyomo.Param(m.Projects, initialize=dict(enumerate(np.asarray(staff).tolist())), mutable=True)
+    m.x = pyomo.Var(m.Projects, domain=pyomo.Binary)
+
+    m.obj = pyomo.Objective(expr=pyomo.quicksum(m.performance[i] * m.x[i] for i in m.Projects), sense=pyomo.maximize)
+    m.budget_cstr = pyomo.Constraint(expr=pyomo.quicksum(m.cost[i] * m.x[i] for i in m.Projects) <= m.F)
+    m.staff_cstr = pyomo.Constraint(expr=pyomo.quicksum(m.staff[i] * m.x[i] for i in m.Projects) <= m.S)
+    m.equipment_cstr = pyomo.Constraint(expr=pyomo.quicksum(m.x[i] for i in m.Projects) <= m.P)
+    return m
+
+# Συνάρτηση update_param για την ενημέρωση των τιμών της παραμέτρου param που άλλαξαν (από old σε new)
+# Επιστρέφει True αν άλλαξε κάποια τιμή
+def update_param(param, old, new):
+
+    new = np.asarray(new)
+    changed = np.flatnonzero(np.asarray(old) != new)
+    for i in changed.tolist():
+        param[i] = new[i].item()
+    return len(changed) > 0
+
+# Συνάρτηση termination_status για την κατάσταση τερματισμού του solver από τα αποτελέσματα results, με την ίδια ονομασία με τους
+# αλγορίθμους branch and bound (limits) για την εξάντληση του χρονικού ορίου, ώστε τα αποτελέσματα να είναι συγκρίσιμα
+def termination_status(results):
+
+    if results.solver.termination_condition == pyomo.TerminationCondition.maxTimeLimit:
+        return lim.TIME_LIMIT
+    return str(results.solver.termination_condition)
+
+# Κλάση PersistentPyomo για την επίλυση πολλών αρχείων προβλημάτων με ένα ConcreteModel και έναν persistent solver ανά μέγεθος N
+# Για ένα νέο πρόβλημα με N που έχει ήδη εμφανιστεί, ενημερώνονται μόνο οι παράμετροι που άλλαξαν, και στον solver ξαναστέλνονται μόνο οι
+# περιορισμοί (και η αντικειμενική συνάρτηση) των οποίων άλλαξαν οι συντελεστές ή το δεξί μέλος. Ο χρόνος κάθε φάσης (PHASES) της τελευταίας
+# επίλυσης αποθηκεύεται στο times
+class PersistentPyomo:
+
+    def __init__(self, solver=SOLVER):
+        self.solver_name = solver
+        self.instances = {}
+        self.times = dict.fromkeys(PHASES, 0.0)
+
+    # Συνάρτηση load για την δημιουργία του μοντέλου του προβλήματος data, ή την ενημέρωση του μοντέλου του ίδιου N
+    # Επιστρέφει τον solver και το μοντέλο
+    def load(self, data):
+
+        N, F, S, P, performance, cost, staff = data
+        if N not in self.instances:
+            m = build_concrete_model(*data)
+            solver = pyomo.SolverFactory(self.solver_name)
+            solver.set_instance(m)
+            self.instances[N] = (solver, m, data)
+            return solver, m
+
+        solver, m, old = self.instances[N]
+        _, old_F, old_S, old_P, old_performance, old_cost, old_staff = old
+        rows = ((m.budget_cstr, m.F, old_F, F, m.cost, old_cost, cost),
+                (m.staff_cstr, m.S, old_S, S, m.staff, old_staff, staff),
+                (m.equipment_cstr, m.P, old_P, P, None, None, None))
+        for constr, rhs, old_rhs, new_rhs, coeffs, old_coeffs, new_coeffs in rows:
+            changed = old_rhs != new_rhs
+            if changed:
+                rhs.set_value(float(new_rhs))
+            if coeffs is not None:
+                changed = update_param(coeffs, old_coeffs, new_coeffs) or changed
+            if changed:
+                solver.remove_constraint(constr)
+                solver.add_constraint(constr)
+        if update_param(m.performance, old_performance, performance):
+            solver.set_objective(m.obj)
+        self.instances[N] = (solver, m, data)
+        return solver, m
+
+    # Συνάρτηση solve για την επίλυση του αρχείου προβλήματος prob_file, με χρονικό όριο time_limit δευτερόλεπτα για τον solver
+    # Επιστρέφει την κατάσταση τερματισμού, την τιμή της καλύτερης λύσης και τις θέσεις των έργων που επιλέχθηκαν (None αν ο solver δεν
+    # βρήκε λύση, π.χ. πριν εξαντληθεί το χρονικό όριο)
+    def solve(self, prob_file, time_limit=None):
+
+        start = time.perf_counter()
+        data = pr.read_data_capital_budgeting(prob_file)
+        parse_time = time.perf_counter() - start
+
+        result = self.solve_data(data, time_limit)
+        self.times["parse"] = parse_time
+        return result
+
+    # Συνάρτηση solve_data για την επίλυση του προβλήματος με δεδομένα data (N, F, S, P, performance, cost, staff), π.χ. που δεν προέρχεται
+    # από αρχείο. Επιστρέφει τα ίδια στοιχεία με την solve
+    def solve_data(self, data, time_limit=None):
+
+        self.times = dict.fromkeys(PHASES, 0.0)
+        start = time.perf_counter()
+        solver, m = self.load(data)
+        self.times["build"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        # Το όριο ορίζεται σε κάθε επίλυση, καθώς ο persistent solver διατηρεί τις παραμέτρους της προηγούμενης
+        options = {"TimeLimit": float("inf") if time_limit is None else time_limit}
+        results = solver.solve(m, load_solutions=False, save_results=False, options=options)
+        self.times["solve"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        status = termination_status(results)
+        objective, selected = None, None
+        if solver.get_model_attr("SolCount") > 0:
+            solver.load_vars()
+            x = np.fromiter((m.x[i].value for i in m.Projects), dtype=float, count=data[0])
+            selected = np.flatnonzero(x > 0.5)
+            objective = float(np.asarray(data[4])[selected].sum())
+        self.times["extract"] = time.perf_counter() - start
+        return status, objective, selected
  
+# Συνάρτηση solve_all_problems_fast για την επίλυση των αρχείων προβλημάτων με την γρήγορη λειτουργία (PersistentPyomo) και την εκτύπωση
+# του χρόνου κάθε φάσης
+def solve_all_problems_fast(problem_folder):
+
+    problems = pr.find_problem_files(problem_folder)
+    fast = PersistentPyomo()
+    totals = dict.fromkeys(PHASES, 0.0)
+    for prob_file in problems:
+        status, objective, selected = fast.solve(prob_file)
+        times = ", ".join(f"{phase} {fast.times[phase]:.4f}s" for phase in PHASES)
+        print(f"{prob_file}: {status}, objective {objective}, {0 if selected is None else len(selected)} projects ({times})")
+        for phase in PHASES:
+            totals[phase] += fast.times[phase]
+    print("Total: " + ", ".join(f"{phase} {totals[phase]:.4f}s" for phase in PHASES))
+
 # Συνάρτηση solve_all_problems για την επίλυση των αρχείων προβλημάτων
 def solve_all_problems(problem_folder):
     
     # Ανάγνωση των path όλων των αρχείων προβλημάτων, εντός του φακέλου problems και αποθήκευση τους στην λίστα problems (το κάθε path στην κάθε γραμμή)
-    problems = []
-    for root, dirs, files in os.walk(problem_folder):
-        for file in files:
-            if file.endswith(".dat"):
-                problems.append(os.path.join(root, file))
+    problems = pr.find_problem_files(problem_folder)
     
     # Επιλογή του gurobi solver
     solver = pyomo.SolverFactory('gurobi')
@@ -65,10 +208,13 @@ def solve_all_problems(problem_folder):
         print(f"\nCurrently processing problem file: {prob_file}\n")
 
         # Φόρτωση δεδομένων από το αρχείο 
+        build_start = time.time()
         instance = model.create_instance(prob_file)
+        build_end = time.time()
 
         # Εκτύπωση του μοντέλου
-        instance.pprint()
+        if VERBOSE:
+            instance.pprint()
 
         # Επίλυση του μοντέλου
         start = time.time()
@@ -76,8 +222,12 @@ def solve_all_problems(problem_folder):
         end = time.time()
 
         # Εκτύπωση των αποτελεσμάτων
-        instance.display() 
+        if VERBOSE:
+            instance.display() 
+        else:
+            print(f"Objective Value: {pyomo.value(instance.obj)}")
 
+        print(f"Build time: {build_end - build_start}")
         print(f"Time Elapsed: {end - start}")
 
     """
@@ -103,5 +253,10 @@ def solve_all_problems(problem_folder):
     print(f"Time Elapsed: {end - start}")
     """
 
-# Κλήση της συνάρτησης solve_all_problems για επίλυση των αρχείων προβλημάτων του φακέλου 'problems'
-solve_all_problems("problems")
\ No newline at end of file
+if __name__ == "__main__":
+
+    # Κλήση της συνάρτησης solve_all_problems (ή solve_all_problems_fast αν FAST = True) για επίλυση των αρχείων προβλημάτων του φακέλου 'problems'
+    if FAST:
+        solve_all_problems_fast("problems")
+    else:
+        solve_all_problems("problems")
\ No newline at end of file
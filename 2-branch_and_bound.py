@@ -1,17 +1,71 @@
-import gurobipy as gp
-from gurobipy import GRB
 import numpy as np
 import time
-from collections import deque
 import problems as pr
+import lp_relaxation as lp
+import node_selection as ns
+import branching as br
+import heuristics as heur
+import presolve as ps
+import instrumentation as inst
+import checkpoint as ckpt
+import limits as lim
+import solution_pool as sp
+import lagrangian as lagr
 import os
+import sys
+
+# Το gurobipy χρειάζεται μόνο όταν LP_ENGINE = "gurobi"
+try:
+    import gurobipy as gp
+    from gurobipy import GRB
+except ImportError:
+    gp = None
+    GRB = lp.GRB
 
 # Δήλωση global μεταβλητών
 isMax = None          # True αν πρόκειται για πρόβλημα μεγιστοποίησης, False αν πρόκειται για πρόβλημα ελαχιστοποίησης
-DEBUG_MODE = True     # True για ενεργοποίηση μηνυμάτων debuging, False για απενεργοποίηση μηνυμάτων debuging
+METRICS = None        # αντικείμενο instrumentation.Metrics για την καταμέτρηση των κόμβων, την χρονομέτρηση των φάσεων και την καταγραφή γεγονότων,
+                      # None για απενεργοποίηση (χωρίς κόστος)
+LOG_SAMPLE_EVERY = 1000 # στο main: καταγραφή ενός γεγονότος κόμβου κάθε LOG_SAMPLE_EVERY κόμβους (οι μετρητές περιλαμβάνουν όλους τους κόμβους)
+EVENT_LOG = None      # στο main: αρχείο JSON lines για την καταγραφή των γεγονότων, None για μόνο γραμμή προόδου
 nodes = 0             # αριθμός των κόμβων
+memory_saved = 0      # μνήμη (σε bytes) που εξοικονομήθηκε από την συμπαγή αναπαράσταση των κόμβων
+fixed_by_reduced_cost = 0 # αριθμός μεταβλητών που σταθεροποιήθηκαν με reduced-cost fixing στους κόμβους του δέντρου
+result = None         # αποτέλεσμα (limits.Result) της τελευταίας εκτέλεσης: λόγος τερματισμού, καλύτερη λύση, bound, gap, κόμβοι και χρόνος
+incumbent_log = []    # ιστορικό βελτιώσεων της καλύτερης λύσης: (ευρετική ή "branch_and_bound", τιμή, αριθμός κόμβων)
 lower_bound = -np.inf # κάτω όριο = - άπειρο
 upper_bound = np.inf  # άνω όριο = άπειρο
+NODE_SELECTION = "depth-first" # στρατηγική επιλογής κόμβων: "depth-first", "best-bound", "best-estimate" ή "hybrid" (node_selection)
+BRANCHING = "first-fractional" # κανόνας επιλογής της μεταβλητής branching: "first-fractional", "most-fractional", "pseudocost" ή
+                      # "reliability" (branching)
+strong_branching_lps = 0 # αριθμός χαλαρώσεων LP που επιλύθηκαν από το strong branching του κανόνα "reliability"
+skipped_basis_restores = 0 # αριθμός κόμβων που επιλύθηκαν χωρίς ανανέωση της βάσης, επειδή ο πατέρας τους ήταν ο τελευταίος κόμβος που επιλύθηκε
+batch_bounded = 0     # αριθμός κόμβων των οποίων η χαλάρωση LP υπολογίστηκε σε μπλοκ (batched bounding)
+batch_pruned = 0      # αριθμός κόμβων που απορρίφθηκαν από το batched bounding χωρίς επίλυση στο μοντέλο
+lagrangian_checked = 0 # αριθμός κόμβων στους οποίους υπολογίστηκε Lagrangian bound πριν την χαλάρωση LP
+lagrangian_pruned = 0 # αριθμός κόμβων που απορρίφθηκαν με το Lagrangian bound χωρίς επίλυση της χαλάρωσης LP
+HEURISTICS = True     # True για εκτέλεση των ευρετικών (heuristics) στην ρίζα και περιοδικά στους κόμβους
+HEURISTIC_FREQUENCY = 100 # κάθε πόσους κόμβους εκτελούνται οι ευρετικές στην λύση της χαλάρωσης LP του κόμβου
+PRESOLVE = True       # True για presolve (αφαίρεση έργων που δεν χωράνε και reduced-cost fixing στην ρίζα) πριν τον branch and bound
+REDUCED_COST_FIXING = True # True για reduced-cost fixing σε κάθε κόμβο με την τρέχουσα καλύτερη λύση (ισχύει για όλο το υποδέντρο του κόμβου)
+CHECKPOINT = False    # στο main: True για περιοδική αποθήκευση της κατάστασης της αναζήτησης στο αρχείο <αρχείο προβλήματος>.checkpoint
+CHECKPOINT_INTERVAL = 600.0 # κάθε πόσα δευτερόλεπτα αποθηκεύεται η κατάσταση της αναζήτησης στο αρχείο checkpoint
+RESUME = False        # True για συνέχιση της αναζήτησης από το αρχείο checkpoint, εφόσον υπάρχει
+SOLUTION_POOL_SIZE = sp.POOL_SIZE # αριθμός των καλύτερων διαφορετικών λύσεων που κρατά το pool λύσεων (solution_pool)
+SOLUTION_POOL_FILE = "json" # στο main: μορφή του αρχείου <αρχείο προβλήματος>.solutions.<μορφή> για την εξαγωγή του pool λύσεων ("json" ή
+                      # "npz"), None για καμία εξαγωγή
+TIME_LIMIT = None     # όριο χρόνου (σε δευτερόλεπτα), None για κανένα όριο
+NODE_LIMIT = None     # όριο αριθμού κόμβων, None για κανένα όριο
+MEMORY_LIMIT = None   # όριο μνήμης των ανοιχτών κόμβων (σε MB, κατά προσέγγιση), None για κανένα όριο
+ABSOLUTE_GAP = None   # τερματισμός όταν η απόσταση της καλύτερης λύσης από το global dual bound γίνει το πολύ ABSOLUTE_GAP, None για κανένα όριο
+RELATIVE_GAP = None   # τερματισμός όταν το σχετικό gap γίνει το πολύ RELATIVE_GAP (π.χ. 0.001 για 0.1%), None για κανένα όριο
+INCUMBENT_CALLBACK = None # συνάρτηση callback(obj, x, source, nodes) που καλείται για κάθε νέα καλύτερη λύση, None για καμία
+LP_ENGINE = "gurobi"  # μηχανή επίλυσης των χαλαρώσεων LP των κόμβων: "gurobi" ή "numpy" (lp_relaxation, δεν απαιτεί άδεια Gurobi)
+BATCH_BOUNDING = False # True για τον υπολογισμό των χαλαρώσεων LP των επόμενων κόμβων της ουράς σε μπλοκ (lp_relaxation.solve_relaxation_batch)
+                      # και την απόρριψη όσων δεν βελτιώνουν την καλύτερη λύση πριν την επίλυσή τους στο μοντέλο
+BATCH_SIZE = 32       # αριθμός κόμβων της ουράς σε κάθε μπλοκ του batched bounding
+LAGRANGIAN_BOUNDING = False # True για Lagrangian bounding (lagrangian) σε κάθε κόμβο πριν την επίλυση της χαλάρωσης LP, εφόσον υπάρχει καλύτερη λύση
+LAGRANGIAN_ITERATIONS = lagr.ITERATIONS # μέγιστος αριθμός βημάτων subgradient του Lagrangian bounding ανά κόμβο
 
 # Συνάρτηση is_nearly_integer για την υπολογισμό αν μια τιμή προσεγγίζει μια ακέραια
 def is_nearly_integer(value, tolerance=1e-6):
@@ -19,54 +73,349 @@ def is_nearly_integer(value, tolerance=1e-6):
     return abs(value - round(value)) <= tolerance
 
 # Κλάση Node που αποθηκεύει πληροφορίες για τους κόμβους του δέντρου
+# Για εξοικονόμηση μνήμης ο κόμβος δεν αποθηκεύει ολόκληρους τους πίνακες ορίων, αλλά μόνο την αλλαγή ορίου σε σχέση με τον πατέρα του
+# (μεταβλητή branching, είδος ορίου "UB"/"LB" και νέα τιμή) και μια αναφορά στον πατέρα. Τα πλήρη όρια ανακατασκευάζονται με την συνάρτηση
+# get_node_bounds, ή από τα όρια του προηγούμενου κόμβου με την κλάση ModelBounds, όταν ο κόμβος αφαιρεθεί από την στοίβα. Η βάση (vbasis,
+# cbasis) της λύσης του πατέρα, από την οποία ξεκινά η επίλυση του κόμβου, αποθηκεύεται μία φορά ως πίνακες int8 (συνάρτηση read_basis) και
+# τα δύο παιδιά έχουν αναφορά στους ίδιους πίνακες. Κάθε παιδί αφήνει την αναφορά του όταν αφαιρεθεί από την στοίβα, οπότε η βάση
+# απελευθερώνεται μόλις αφαιρεθούν και τα δύο παιδιά
+# Οι μεταβλητές που σταθεροποιούνται με reduced-cost fixing στον κόμβο αποθηκεύονται ως (θέσεις, τιμές) στο fixings και ισχύουν για τα παιδιά του
+# Το κλασματικό μέρος της μεταβλητής branching των παιδιών στην λύση LP του κόμβου αποθηκεύεται στο fraction, για την ενημέρωση των pseudocosts
+# Οι πολλαπλασιαστές Lagrange από τους οποίους ξεκινά το Lagrangian bounding του κόμβου (οι δυϊκές τιμές της λύσης LP του πατέρα) αποθηκεύονται
+# στο multipliers, με τον ίδιο τρόπο που μοιράζεται η βάση
 class Node:
-    def __init__(self, ub, lb, depth, vbasis, cbasis, branching_var, label=""):
-        self.ub = ub
-        self.lb = lb
+    __slots__ = ("parent", "depth", "branching_var", "bound_type", "bound_value", "vbasis", "cbasis", "fixings", "fraction", "multipliers",
+                 "label")
+
+    def __init__(self, parent, depth, branching_var, bound_type=None, bound_value=None, label=""):
+        self.parent = parent
         self.depth = depth
-        self.vbasis = vbasis
-        self.cbasis = cbasis
         self.branching_var = branching_var
+        self.bound_type = bound_type
+        self.bound_value = bound_value
+        self.vbasis = None
+        self.cbasis = None
+        self.fixings = None
+        self.fraction = None
+        self.multipliers = None
         self.label = label
 
-# Συνάρτηση debug_print για την εκτύπωση πληροφοριών για debuging
-def debug_print(node: Node = None, x_obj=None, sol_status=None):
-
-    print("\n\n-----------------  DEBUG OUTPUT  -----------------\n\n")
-    print(f"UB:{upper_bound}")
-    print(f"LB:{lower_bound}")
+# Συνάρτηση get_node_bounds για την ανακατασκευή των πλήρων πινάκων ορίων ενός κόμβου, ξεκινώντας από τα όρια της ρίζας (ub, lb) και
+# εφαρμόζοντας τις αλλαγές ορίων του μονοπατιού από την ρίζα μέχρι τον κόμβο
+def get_node_bounds(node, ub, lb):
+
+    ub = np.array(ub, dtype=float)
+    lb = np.array(lb, dtype=float)
+
+    # Συλλογή των κόμβων από τον κόμβο προς την ρίζα και εφαρμογή των αλλαγών ορίων τους με αντίστροφη σειρά, ώστε να ισχύει η πιο πρόσφατη
+    # αλλαγή (σε κάθε κόμβο πρώτα η αλλαγή ορίου του branching και έπειτα οι σταθεροποιήσεις του, που αφορούν τα παιδιά του)
+    path = []
+    while node is not None:
+        path.append(node)
+        node = node.parent
+    for node in reversed(path):
+        if node.bound_type == "UB":
+            ub[node.branching_var] = node.bound_value
+        elif node.bound_type == "LB":
+            lb[node.branching_var] = node.bound_value
+        if node.fixings is not None:
+            fixed_vars, fixed_values = node.fixings
+            ub[fixed_vars] = fixed_values
+            lb[fixed_vars] = fixed_values
+
+    return ub, lb
+
+# Κλάση ModelBounds που παρακολουθεί τα όρια (ub, lb) των μεταβλητών που έχει το μοντέλο, δηλαδή τα όρια του τελευταίου κόμβου, ώστε κατά
+# την μετάβαση σε έναν νέο κόμβο να στέλνονται στο μοντέλο μόνο τα όρια που αλλάζουν. Τα όρια διαφέρουν μόνο στις μεταβλητές των αλλαγών
+# ορίων των κόμβων κάτω από τον κοινό πρόγονο των δύο κόμβων: οι αλλαγές του μονοπατιού προς τον τελευταίο κόμβο αναιρούνται με τις
+# προηγούμενες τιμές τους, που καταγράφονται στο trail όταν εφαρμόζονται, και εφαρμόζονται οι αλλαγές του μονοπατιού προς τον νέο κόμβο
+# Η λίστα variables των μεταβλητών του μοντέλου δίνεται μία φορά, ώστε να μην καλείται η model.getVars() σε κάθε κόμβο
+class ModelBounds:
+
+    def __init__(self, model, variables, ub, lb):
+        self.model = model
+        self.variables = variables
+        self.ub = np.array(ub, dtype=float)
+        self.lb = np.array(lb, dtype=float)
+        # Οι κόμβοι του μονοπατιού από την ρίζα μέχρι τον τελευταίο κόμβο, με το βάθος του πρώτου, και για κάθε κόμβο αν έχουν εφαρμοστεί
+        # οι σταθεροποιήσεις του (που προστίθενται μετά την επίλυσή του)
+        self.path = []
+        self.base_depth = 0
+        self.fixed = []
+        # Οι αλλαγές ορίων που έχουν εφαρμοστεί: (θέση του κόμβου στο path, θέσεις μεταβλητών, προηγούμενα ub, προηγούμενα lb)
+        self.trail = []
+        # True όταν το μοντέλο έχει τα όρια ub και lb (αλλιώς στέλνονται όλα τα όρια στην επόμενη μετάβαση)
+        self.synced = False
+
+    # Συνάρτηση set_root για την αρχικοποίηση του μονοπατιού με την ρίζα root, της οποίας τα όρια έχει ήδη το μοντέλο
+    def set_root(self, root):
+        self.path = [root]
+        self.base_depth = root.depth
+        self.fixed = [False]
+        self.synced = True
+
+    # Συνάρτηση on_path για τον έλεγχο αν ο κόμβος node ανήκει στο μονοπάτι του τελευταίου κόμβου
+    def on_path(self, node):
+        position = node.depth - self.base_depth
+        return 0 <= position < len(self.path) and self.path[position] is node
+
+    # Συνάρτηση apply για την εφαρμογή των ορίων (ub_values, lb_values) στις μεταβλητές indices, με καταγραφή των προηγούμενων τιμών στο trail
+    def apply(self, indices, ub_values, lb_values, touched):
+        self.trail.append((len(self.path) - 1, indices, self.ub[indices], self.lb[indices]))
+        self.ub[indices] = ub_values
+        self.lb[indices] = lb_values
+        touched.append(indices)
+
+    # Συνάρτηση apply_fixings για την εφαρμογή των σταθεροποιήσεων του τελευταίου κόμβου του μονοπατιού, αν έχει και δεν έχουν εφαρμοστεί
+    def apply_fixings(self, touched):
+        node = self.path[-1]
+        if node.fixings is not None and not self.fixed[-1]:
+            fixed_vars, fixed_values = node.fixings
+            self.apply(fixed_vars, fixed_values, fixed_values, touched)
+            self.fixed[-1] = True
+
+    # Συνάρτηση move_to για την μετάβαση του μοντέλου στα όρια του κόμβου node
+    # Επιστρέφει τους πίνακες ορίων (ub, lb) του κόμβου, που δεν πρέπει να τροποποιηθούν και ισχύουν μέχρι την επόμενη μετάβαση
+    def move_to(self, node):
+
+        # Οι κόμβοι από τον node μέχρι τον κοινό πρόγονο (χωρίς αυτόν), ή μέχρι την ρίζα αν δεν υπάρχει κοινός πρόγονος
+        down = []
+        while node is not None and not self.on_path(node):
+            down.append(node)
+            node = node.parent
+        keep = -1 if node is None else node.depth - self.base_depth
+
+        # Αναίρεση των αλλαγών των κόμβων κάτω από τον κοινό πρόγονο, με αντίστροφη σειρά από την εφαρμογή τους
+        touched = []
+        while self.trail and self.trail[-1][0] > keep:
+            _, indices, old_ub, old_lb = self.trail.pop()
+            self.ub[indices] = old_ub
+            self.lb[indices] = old_lb
+            touched.append(indices)
+        del self.path[keep + 1:]
+        del self.fixed[keep + 1:]
+        if not self.path:
+            self.base_depth = down[-1].depth
+
+        # Εφαρμογή των σταθεροποιήσεων του κοινού προγόνου και των αλλαγών ορίων των κόμβων προς τον node
+        if self.path:
+            self.apply_fixings(touched)
+        for node in reversed(down):
+            self.path.append(node)
+            self.fixed.append(False)
+            if node.bound_type == "UB":
+                self.apply([node.branching_var], node.bound_value, self.lb[[node.branching_var]], touched)
+            elif node.bound_type == "LB":
+                self.apply([node.branching_var], self.ub[[node.branching_var]], node.bound_value, touched)
+            self.apply_fixings(touched)
+
+        # Αποστολή στο μοντέλο μόνο των ορίων που άλλαξαν (όλων των ορίων αν το μοντέλο δεν έχει τα όρια του τελευταίου κόμβου)
+        if not self.synced:
+            self.model.setAttr("LB", self.variables, self.lb)
+            self.model.setAttr("UB", self.variables, self.ub)
+            self.synced = True
+        elif touched:
+            indices = np.unique(np.concatenate(touched))
+            variables = [self.variables[i] for i in indices]
+            self.model.setAttr("LB", variables, self.lb[indices])
+            self.model.setAttr("UB", variables, self.ub[indices])
+        return self.ub, self.lb
+
+# Συνάρτηση read_basis για την ανάγνωση της βάσης της τελευταίας επίλυσης του μοντέλου ως πίνακες int8 (οι κωδικοί VBasis και CBasis
+# είναι μικροί αρνητικοί ακέραιοι), αντί για λίστες ακεραίων Python με 8 bytes ανά στοιχείο. Οι variables και constraints είναι οι λίστες
+# των μεταβλητών και των περιορισμών του μοντέλου
+def read_basis(model, variables, constraints):
+
+    return (np.array(model.getAttr("VBasis", variables), dtype=np.int8),
+            np.array(model.getAttr("CBasis", constraints), dtype=np.int8))
+
+# Συνάρτηση bound_nodes για τον υπολογισμό των χαλαρώσεων LP των κόμβων nodes (με bounds parent_bounds στην ουρά) μαζί, ως ένα μπλοκ, με
+# τα δεδομένα batch_data = (c, A, b) του προβλήματος, ξεκινώντας από την βάση του πατέρα κάθε κόμβου. Τα όρια κάθε κόμβου ανακατασκευάζονται
+# από τα όρια της ρίζας (ub, lb). Οι κόμβοι που είναι μη εφικτοί ή δεν βελτιώνουν την καλύτερη λύση incumbent απορρίπτονται, ενώ οι υπόλοιποι
+# παίρνουν ως bound την τιμή της χαλάρωσης τους και ως βάση την βέλτιστη βάση τους (ώστε η επίλυσή τους στο μοντέλο να μην χρειάζεται
+# επαναλήψεις). Οι κόμβοι που έχουν ήδη υπολογιστεί καταγράφονται στο λεξικό bounded μαζί με το bound του πατέρα τους και δεν υπολογίζονται ξανά
+# Επιστρέφει τα νέα bounds των κόμβων και για κάθε κόμβο αν παραμένει στην ουρά
+def bound_nodes(batch_data, nodes, parent_bounds, ub, lb, incumbent, bounded):
+
+    global batch_bounded
+    new_bounds = list(parent_bounds)
+    keep = [True] * len(nodes)
+    block = [i for i, node in enumerate(nodes) if node not in bounded]
+    if not block:
+        return new_bounds, keep
+
+    c, A, b = batch_data
+    block_ub = np.empty((len(block), len(ub)))
+    block_lb = np.empty((len(block), len(lb)))
+    vbasis = np.full((len(block), len(ub)), lp.NONBASIC_LOWER, dtype=np.int8)
+    cbasis = np.full((len(block), len(b)), lp.BASIC, dtype=np.int8)
+    for row, i in enumerate(block):
+        block_ub[row], block_lb[row] = get_node_bounds(nodes[i], ub, lb)
+        if nodes[i].vbasis is not None and nodes[i].cbasis is not None:
+            vbasis[row], cbasis[row] = nodes[i].vbasis, nodes[i].cbasis
+
+    status, objective, _, block_vbasis, block_cbasis = lp.solve_relaxation_batch(c, A, b, block_lb, block_ub, vbasis, cbasis)
+    batch_bounded += len(block)
+
+    for row, i in enumerate(block):
+        if status[row] == lp.INFEASIBLE or (status[row] == lp.OPTIMAL and objective[row] <= incumbent + 1e-6):
+            keep[i] = False
+        elif status[row] == lp.OPTIMAL:
+            new_bounds[i] = float(objective[row])
+            nodes[i].vbasis, nodes[i].cbasis = block_vbasis[row], block_cbasis[row]
+            bounded[nodes[i]] = parent_bounds[i]
+    return new_bounds, keep
+
+# Συνάρτηση full_node_size για τον υπολογισμό της μνήμης (σε bytes) που θα χρειαζόταν ένας κόμβος με πλήρη αντίγραφα των πινάκων ορίων και της βάσης
+def full_node_size(num_vars, num_constrs):
+
+    # Δύο πίνακες ορίων float64 και δύο λίστες βάσης (8 bytes ανά αναφορά στοιχείου)
+    return 2 * num_vars * 8 + 2 * sys.getsizeof([]) + (num_vars + num_constrs) * 8
+
+# Συνάρτηση run_heuristics για την εκτέλεση των ευρετικών (στην ρίζα ή σε έναν κόμβο) στην λύση x_candidate της χαλάρωσης LP
+# Επιστρέφει την καλύτερη λύση ως (όνομα ευρετικής, τιμή αντικειμενικής συνάρτησης, λύση) ή None
+def run_heuristics(heuristic_data, x_candidate, at_root=False):
+
+    c, A, b = heuristic_data
+    if at_root:
+        return heur.best_result(heur.root_heuristics(c, A, b, np.asarray(x_candidate, dtype=float)))
+    return heur.best_result(heur.node_heuristics(c, A, b, np.asarray(x_candidate, dtype=float)))
+
+# Συνάρτηση fix_by_reduced_cost για το reduced-cost fixing στον κόμβο node, με τα reduced costs της λύσης x_candidate (τιμή x_obj) της χαλάρωσης
+# LP του κόμβου (μεταβλητές variables του μοντέλου) και την τιμή incumbent της καλύτερης λύσης. Οι μεταβλητές που σταθεροποιούνται αποθηκεύονται στο node.fixings
+# Επιστρέφει τον αριθμό των μεταβλητών που σταθεροποιήθηκαν
+def fix_by_reduced_cost(model, variables, node, x_candidate, x_obj, node_ub, node_lb, incumbent):
+
+    rc = model.getAttr("RC", variables)
+    at_lower, at_upper = ps.reduced_cost_fixing(rc, x_candidate, node_lb, node_ub, x_obj, incumbent, isMax)
+    fixed_vars = np.flatnonzero(at_lower | at_upper)
+    if len(fixed_vars):
+        node.fixings = (fixed_vars, np.where(at_lower, node_lb, node_ub)[fixed_vars])
+    return len(fixed_vars)
+
+# Συνάρτηση update_global_bound για την ανανέωση του global dual bound (άνω όριο για πρόβλημα μεγιστοποίησης, κάτω όριο για ελαχιστοποίησης)
+# με το καλύτερο bound των ανοιχτών κόμβων της ουράς stack, σε O(log n). Το bound δεν είναι ποτέ χειρότερο από την καλύτερη λύση, με την οποία
+# ταυτίζεται όταν δεν υπάρχουν ανοιχτοί κόμβοι
+def update_global_bound(stack):
+
+    global lower_bound, upper_bound
+    bound = stack.best_bound()
+    if isMax:
+        upper_bound = lower_bound if bound is None else max(bound, lower_bound)
+    else:
+        lower_bound = upper_bound if bound is None else min(bound, upper_bound)
 
-    if node is not None:
-        print(f"Branching Var: {node.branching_var}")
-    if node is not None:
-        print(f"Child: {node.label}")
-    if node is not None:
-        print(f"Depth: {node.depth}")
-    if x_obj is not None:
-        print(f"Simplex Objective: {x_obj}")
-    if sol_status is not None:
-        print(f"Solution status: {sol_status}")
+# Συνάρτηση current_gap για τον υπολογισμό της σχετικής απόστασης (gap) μεταξύ της καλύτερης λύσης και του global dual bound
+def current_gap():
 
-    print("\n\n--------------------------------------------------\n\n")
+    if isMax:
+        return ns.relative_gap(lower_bound, upper_bound)
+    return ns.relative_gap(upper_bound, lower_bound)
+
+# Συνάρτηση log_node για την καταγραφή του αποτελέσματος outcome ενός κόμβου στο αντικείμενο metrics, μαζί με τα τρέχοντα όρια και το gap
+def log_node(metrics, outcome, node, x_obj=None):
+
+    metrics.node(outcome, node=nodes, depth=node.depth, branching_var=node.branching_var, obj=x_obj, lower_bound=lower_bound,
+                 upper_bound=upper_bound, gap=current_gap())
+
+# Συνάρτηση record_incumbent για την καταγραφή μιας νέας καλύτερης λύσης x (τιμή obj) που βρέθηκε από την πηγή source (ευρετική ή
+# "branch_and_bound"): προσθήκη στο incumbent_log, αποστολή γεγονότος στο metrics και κλήση του incumbent_callback, αν έχει δοθεί
+def record_incumbent(metrics, incumbent_callback, source, obj, x):
+
+    incumbent_log.append((source, obj, nodes))
+    if metrics:
+        metrics.emit("incumbent", source=source, obj=obj, node=nodes)
+    if incumbent_callback is not None:
+        incumbent_callback(obj, x, source, nodes)
+
+# Συνάρτηση save_search_state για την αποθήκευση της κατάστασης της αναζήτησης (ουρά ανοιχτών κόμβων stack, λύσεις, όρια και μετρητές)
+# στο αρχείο checkpoint_file, μαζί με τους συντελεστές της αντικειμενικής συνάρτησης για τον έλεγχο του μοντέλου κατά την συνέχιση
+def save_search_state(checkpoint_file, obj_coeffs, stack, solutions, solutions_found, best_sol_idx, best_sol_obj, pseudocosts):
+
+    state = {"obj_coeffs": np.asarray(obj_coeffs, dtype=float), "stack": stack, "solutions": solutions,
+             "solutions_found": solutions_found, "best_sol_idx": best_sol_idx, "best_sol_obj": best_sol_obj,
+             "lower_bound": lower_bound, "upper_bound": upper_bound, "nodes": nodes, "memory_saved": memory_saved,
+             "fixed_by_reduced_cost": fixed_by_reduced_cost, "incumbent_log": incumbent_log, "pseudocosts": pseudocosts}
+    ckpt.save_checkpoint(checkpoint_file, state, (node for node, bound in stack), Node)
+
+# Συνάρτηση finish για την δημιουργία του αποτελέσματος της αναζήτησης (global μεταβλητή result) με λόγο τερματισμού status (αν δεν δοθεί,
+# βέλτιστη λύση ή μη εφικτό πρόβλημα ανάλογα με το αν βρέθηκαν λύσεις) και χρόνο από την στιγμή start
+# Επιστρέφει τα solutions, best_sol_idx και solutions_found, ώστε να χρησιμοποιείται στις επιστροφές της branch_and_bound
+def finish(solutions, best_sol_idx, solutions_found, start, status=None):
+
+    global result
+    if status is None:
+        status = lim.OPTIMAL if solutions else lim.INFEASIBLE
+    objective, solution = (solutions[best_sol_idx].objective, solutions[best_sol_idx].x()) if solutions else (None, None)
+    result = lim.Result(status, objective, solution, upper_bound if isMax else lower_bound, current_gap(), nodes,
+                        time.perf_counter() - start)
+    return solutions, best_sol_idx, solutions_found
 
 # Συνάρτηση branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound
-def branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth, nodes_per_depth, vbasis=[], cbasis=[], depth=0):
+# Αν δοθεί checkpoint_file, η κατάσταση της αναζήτησης αποθηκεύεται σε αυτό κάθε CHECKPOINT_INTERVAL δευτερόλεπτα, και αν RESUME = True
+# η αναζήτηση συνεχίζεται από την κατάσταση που έχει αποθηκευτεί (το μοντέλο πρέπει να είναι το ίδιο με αυτό της αρχικής εκτέλεσης)
+# Η αναζήτηση τερματίζεται νωρίτερα όταν εξαντληθεί ένα από τα όρια limits (αντικείμενο limits.Limits, από προεπιλογή με τα όρια TIME_LIMIT,
+# NODE_LIMIT, MEMORY_LIMIT, ABSOLUTE_GAP και RELATIVE_GAP), και το incumbent_callback (από προεπιλογή INCUMBENT_CALLBACK) καλείται για κάθε
+# νέα καλύτερη λύση. Η μεταβλητή branching κάθε κόμβου επιλέγεται με τον κανόνα branching (από προεπιλογή BRANCHING). Το αποτέλεσμα της
+# αναζήτησης αποθηκεύεται στην global μεταβλητή result
+def branch_and_bound(model, ub, lb, integer_var, vbasis=[], cbasis=[], depth=0, node_selection=None, checkpoint_file=None, limits=None,
+                     incumbent_callback=None, branching=None):
 
     # Αρχικοποίηση των global μεταβλητών nodes, lower_bound και upper_bound, καθώς τροποποιούνται στην κλήση της συνάρτησης για το κάθε αρχείο 
     # προβλήματος
-    global nodes, lower_bound, upper_bound
+    global nodes, lower_bound, upper_bound, memory_saved, incumbent_log, fixed_by_reduced_cost, strong_branching_lps, skipped_basis_restores, \
+        batch_bounded, batch_pruned, lagrangian_checked, lagrangian_pruned
     nodes = 0 
     lower_bound = -np.inf 
     upper_bound = np.inf 
-
-    # Δημιουργία άδειας στοίβας με την χρήση της deque() για την αποθήκευση των αντικειμένων τύπου Node
-    stack = deque()
-
-    # Δημιουργία μιας κενής λίστας για την αποθήκευση των λύσεων
-    solutions = list()
+    memory_saved = 0
+    incumbent_log = []
+    fixed_by_reduced_cost = 0
+    strong_branching_lps = 0
+    skipped_basis_restores = 0
+    batch_bounded = 0
+    batch_pruned = 0
+    lagrangian_checked = 0
+    lagrangian_pruned = 0
+    start = time.perf_counter()
+
+    # Όρια τερματισμού και callback για τις νέες καλύτερες λύσεις
+    if limits is None:
+        limits = lim.Limits(TIME_LIMIT, NODE_LIMIT, MEMORY_LIMIT, ABSOLUTE_GAP, RELATIVE_GAP)
+    else:
+        limits.start()
+    if incumbent_callback is None:
+        incumbent_callback = INCUMBENT_CALLBACK
+
+    # Αντικείμενο καταγραφής μετρικών (None αν η καταγραφή είναι απενεργοποιημένη)
+    metrics = METRICS
+    if metrics:
+        metrics.mark(inst.BOOKKEEPING)
+
+    # Δημιουργία άδειας ουράς ανοιχτών κόμβων για την αποθήκευση των αντικειμένων τύπου Node, σύμφωνα με την στρατηγική επιλογής κόμβων
+    # (στοίβα για την αναζήτηση κατά βάθος, heap για best-bound/best-estimate)
+    if node_selection is None:
+        node_selection = NODE_SELECTION
+    stack = ns.create_node_queue(node_selection, isMax)
+
+    # Κανόνας επιλογής της μεταβλητής branching, με τα pseudocosts των μεταβλητών
+    if branching is None:
+        branching = BRANCHING
+    brancher = br.Brancher(branching, len(ub), isMax)
+
+    # Οι λίστες των μεταβλητών και των περιορισμών του μοντέλου, που διαβάζονται μία φορά, και τα όρια των μεταβλητών που έχει το μοντέλο
+    variables = model.getVars()
+    constraints = model.getConstrs()
+    bounds = ModelBounds(model, variables, ub, lb)
+
+    # Συντελεστές της αντικειμενικής συνάρτησης, για τον υπολογισμό της εκτίμησης best-estimate των κόμβων
+    obj_coeffs = model.getAttr("Obj", variables)
+
+    # Δημιουργία ενός κενού pool για την αποθήκευση των SOLUTION_POOL_SIZE καλύτερων λύσεων
+    solutions = sp.SolutionPool(isMax, SOLUTION_POOL_SIZE)
     # Αρχικοποίηση ενός μετρητή που αντιπροσωπεύει τον αριθμό των λύσεων που βρέθηκαν
     solutions_found = 0
-    # Αρχικοποίηση ενός δείκτη για την αποθήκευση της θέσης της καλύτερης λύσης από τις υπάρχουσες λύσεις
+    # Η θέση της καλύτερης λύσης στο pool (οι λύσεις είναι ταξινομημένες από την καλύτερη)
     best_sol_idx = 0
 
     # Αρχικοποίηση της μεταβλητής best_sol_obj στο -άπειρο αν το πρόβλημα μας πρόκειται για πρόβλημα μεγιστοποίησης, 
@@ -77,138 +426,294 @@ def branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth, nodes_per
     else:
         best_sol_obj = np.inf
 
-    # Δημιουργία ενός αντικειμένου τύπου Node, το root_node, το οποίο αντιπροσωπεύει την ρίζα του δέντρου
-    root_node = Node(ub, lb, depth, vbasis, cbasis, -1, "root")
-
-    # Ανανέωση του πίνακα nodes_per_depth στο επίπεδο 0 (ρίζα), μείωση κατά 1, εφόσον ο κόμβος (ρίζα) εξερευνήθηκε
-    nodes_per_depth[0] -= 1
+    # Μνήμη που θα χρειαζόταν ένας κόμβος με πλήρη αντίγραφα των ορίων και της βάσης, για τον υπολογισμό της μνήμης που εξοικονομείται
+    full_size = full_node_size(len(ub), len(constraints))
+
+    # Οι ευρετικές αφορούν πρόβλημα μεγιστοποίησης με μη αρνητικούς συντελεστές, όπως το capital budgeting
+    use_heuristics = HEURISTICS and isMax
+    heuristic_data = heur.problem_data(model) if use_heuristics else None
+
+    # Τα δεδομένα (c, A, b) του batched bounding και του Lagrangian bounding, που αφορούν πρόβλημα μεγιστοποίησης με περιορισμούς <= (ένας για
+    # κάθε περιορισμό του μοντέλου), όπως το capital budgeting. Οι κόμβοι που έχουν υπολογιστεί σε μπλοκ και δεν έχουν αφαιρεθεί ακόμα από την
+    # ουρά αντιστοιχίζονται στο bound του πατέρα τους (για την ενημέρωση των pseudocosts)
+    bounding_data = heur.problem_data(model) if (BATCH_BOUNDING or LAGRANGIAN_BOUNDING) and isMax else None
+    if bounding_data is not None and len(bounding_data[2]) != len(constraints):
+        bounding_data = None
+    batch_data = bounding_data if BATCH_BOUNDING else None
+    lagrangian_data = bounding_data if LAGRANGIAN_BOUNDING else None
+    batch_parent_bounds = {}
+
+    # Ο τελευταίος κόμβος που επιλύθηκε, του οποίου την βάση έχει το μοντέλο
+    last_solved = None
+
+    # Ανάγνωση της κατάστασης της αναζήτησης από το checkpoint, αν RESUME = True και το αρχείο υπάρχει
+    state = None
+    if checkpoint_file is not None and RESUME and os.path.exists(checkpoint_file):
+        state = ckpt.load_checkpoint(checkpoint_file, Node)
+        if not np.array_equal(state["obj_coeffs"], np.asarray(obj_coeffs, dtype=float)):
+            raise ValueError(f"{checkpoint_file}: the checkpoint was written for a different model")
+
+    # Συνέχιση της αναζήτησης από την κατάσταση του checkpoint (ουρά ανοιχτών κόμβων, λύσεις, όρια και μετρητές)
+    if state is not None:
+        stack = state["stack"]
+        solutions, solutions_found = state["solutions"], state["solutions_found"]
+        best_sol_obj = state["best_sol_obj"]
+        # Τα checkpoints προηγούμενων εκδόσεων αποθηκεύουν τις λύσεις ως λίστα [x, τιμή, βάθος]
+        if not isinstance(solutions, sp.SolutionPool):
+            pool = sp.SolutionPool(isMax, SOLUTION_POOL_SIZE)
+            for x, obj, sol_depth in solutions:
+                pool.add(x, obj, sol_depth, 0.0)
+            solutions = pool
+        lower_bound, upper_bound = state["lower_bound"], state["upper_bound"]
+        nodes, memory_saved = state["nodes"], state["memory_saved"]
+        fixed_by_reduced_cost, incumbent_log = state["fixed_by_reduced_cost"], state["incumbent_log"]
+        if "pseudocosts" in state:
+            brancher.pseudocosts = state["pseudocosts"]
+        if metrics:
+            metrics.emit("resume", node=nodes, open_nodes=len(stack), lower_bound=lower_bound, upper_bound=upper_bound)
+
+    # Αλλιώς, επίλυση της ρίζας
+    else:
 
-    # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging
-    if DEBUG_MODE:
-        debug_print()
+        # Δημιουργία ενός αντικειμένου τύπου Node, το root_node, το οποίο αντιπροσωπεύει την ρίζα του δέντρου
+        root_node = Node(None, depth, -1, label="root")
 
-    # Επίλυση του μοντέλου
-    model.optimize()
+        # Αν έχει δοθεί αρχική βάση (vbasis και cbasis), γίνεται ανανέωση της βάσης του μοντέλου με αυτήν
+        if (len(vbasis) != 0) and (len(cbasis) != 0):
+            model.setAttr("VBasis", variables, vbasis)
+            model.setAttr("CBasis", constraints, cbasis)
 
-    # Στην περίπτωση που βρεθεί μη εφικτή λύση 
-    # Καλείται η συνάρτηση debug_print με sol_status = Infeasible και επιστρέφεται μια κενή λίστα, η αρχική τιμή της καλύτερης λύσης (ανάλογα με το αν
-    # πρόκειται για πρόβλημα μεγιστοποίησης ή ελαχιστοποίησης, αντίστοιχα) και το βάθος της αναζήτησης
-    if model.status != GRB.OPTIMAL:
-        if isMax:
-            if DEBUG_MODE:
-                debug_print(node=root_node, sol_status="Infeasible")
-            return [], -np.inf, depth
-        else:
-            if DEBUG_MODE:
-                debug_print(node=root_node, sol_status="Infeasible")
-            return [], np.inf, depth
-
-    # Αποθήκευση των νέων τιμών των μεταβλητών στον πίνακα x_candidate μετά την επίλυση 
-    x_candidate = model.getAttr('X', model.getVars())
-
-    # Αποθήκευση της τιμής της αντικειμενικής συνάρτησης στην μεταβλητή x_obj
-    x_obj = model.ObjVal
-
-    # Αποθήκευση της τιμής της αντικειμενικής συνάρτησης ως το καλύτερο όριο για το επίπεδο 0
-    best_bound_per_depth[0] = x_obj
-
-    # Έχουμε αρχικοποιήσει τον πίνακα integer_vals με τις μεταβλητές που πρέπει υποχρεωτικά να παίρνουν ακέραιες τιμές (έργα)
-    # Διατρέχουμε τον πίνακα integer_vals και καλούμε την συνάρτηση is_nearly_integer για την κάθε μεταβλητή για να ελέγξουμε αν είναι ακέραια 
-    # Στην περίπτωση που βρεθεί μεταβλητή που δεν είναι ακέραια αποθηκεύουμε την θέση της στην μεταβλητή selected_var_idx
-    vars_have_integer_vals = True
-    for idx, is_int_var in enumerate(integer_var):
-        if is_int_var and not is_nearly_integer(x_candidate[idx]):
-            vars_have_integer_vals = False
-            selected_var_idx = idx
-            break
+        # Επίλυση του μοντέλου
+        model.optimize()
+        last_solved = root_node
+        bounds.set_root(root_node)
 
-    # Στην περίπτωση που όλες οι μεταβλητές έχουν ακέραιες τιμές προστίθεται η λύση στην λίστα solutions, αυξάνεται ο μετρητής solution_found κατά 1, 
-    # καλείται η συνάρτηση debug_print για την εκτύπωση πληροφοριών για debuging με sol_status = Integer και επιστρέφεται η λίστα solutions, 
-    # ο δείκτης best_sol_idx και ο μετρητής solution_found
-    if vars_have_integer_vals:
+        # Στην περίπτωση που βρεθεί μη εφικτή λύση 
+        # Καταγράφεται ο κόμβος ως μη εφικτός και επιστρέφεται μια κενή λίστα, η αρχική τιμή της καλύτερης λύσης (ανάλογα με το αν
+        # πρόκειται για πρόβλημα μεγιστοποίησης ή ελαχιστοποίησης, αντίστοιχα) και το βάθος της αναζήτησης
+        if model.status != GRB.OPTIMAL:
+            if metrics:
+                metrics.mark(inst.LP)
+                log_node(metrics, inst.INFEASIBLE, root_node)
+            if isMax:
+                return finish([], -np.inf, depth, start)
+            else:
+                return finish([], np.inf, depth, start)
+
+        # Αποθήκευση των νέων τιμών των μεταβλητών στον πίνακα x_candidate μετά την επίλυση 
+        x_candidate = model.getAttr('X', variables)
+
+        # Αποθήκευση της τιμής της αντικειμενικής συνάρτησης στην μεταβλητή x_obj
+        x_obj = model.ObjVal
+
+        if metrics:
+            metrics.mark(inst.LP)
+
+        # Εκτέλεση των ευρετικών στην ρίζα (greedy fill, στρογγυλοποίηση της λύσης LP και τοπική αναζήτηση) για την εύρεση μιας αρχικής καλύτερης
+        # λύσης πριν το branching
+        if use_heuristics:
+            best = run_heuristics(heuristic_data, x_candidate, at_root=True)
+            if best is not None and best[1] > lower_bound:
+                name, h_obj, h_x = best
+                lower_bound = h_obj
+                solutions.add(h_x, h_obj, depth, time.perf_counter() - start, name)
+                solutions_found += 1
+                best_sol_obj = h_obj
+                record_incumbent(metrics, incumbent_callback, name, h_obj, h_x)
+            if metrics:
+                metrics.mark(inst.HEURISTICS)
 
-        solutions.append([x_candidate, x_obj, depth])
-        solutions_found += 1
+        # Έχουμε αρχικοποιήσει τον πίνακα integer_vals με τις μεταβλητές που πρέπει υποχρεωτικά να παίρνουν ακέραιες τιμές (έργα)
+        # Διατρέχουμε τον πίνακα integer_vals και καλούμε την συνάρτηση is_nearly_integer για την κάθε μεταβλητή για να ελέγξουμε αν είναι ακέραια 
+        vars_have_integer_vals = True
+        for idx, is_int_var in enumerate(integer_var):
+            if is_int_var and not is_nearly_integer(x_candidate[idx]):
+                vars_have_integer_vals = False
+                break
 
-        if DEBUG_MODE:
-            debug_print(node=root_node, x_obj=x_obj, sol_status="Integer")
-        return solutions, best_sol_idx, solutions_found
+        # Στην περίπτωση που όλες οι μεταβλητές έχουν ακέραιες τιμές προστίθεται η λύση στο pool solutions, αυξάνεται ο μετρητής solution_found κατά 1, 
+        # καταγράφεται ο κόμβος ως ακέραιος και επιστρέφεται το pool solutions, 
+        # ο δείκτης best_sol_idx και ο μετρητής solution_found
+        if vars_have_integer_vals:
 
-    # Αλλιώς, ανανεώνεται το άνω ή το κάτω όριο ανάλογα με το αν το πρόβλημα μας πρόκειται για μεγιστοποίησης ή ελαχιστοποίησης αντίστοιχα
-    else:
-        if isMax:
-            upper_bound = x_obj
-        else:
-            lower_bound = x_obj
+            lower_bound = upper_bound = x_obj
+            solutions.add(x_candidate, x_obj, depth, time.perf_counter() - start)
+            solutions_found += 1
+            record_incumbent(metrics, incumbent_callback, "branch_and_bound", x_obj, x_candidate)
 
-    # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Fractional
-    if DEBUG_MODE:
-        debug_print(node=root_node, x_obj=x_obj, sol_status="Fractional")
+            if metrics:
+                log_node(metrics, inst.INTEGER, root_node, x_obj)
+            return finish(solutions, best_sol_idx, solutions_found, start)
 
-    # Αποθήκευση των θέσεων των μεταβλητών που έχουν μη μηδενική τιμή και των δεικτών των περιορισμών στους πίνακες vbasis και cbasis αντίστοιχα
-    vbasis = model.getAttr("VBasis", model.getVars())
-    cbasis = model.getAttr("CBasis", model.getConstrs())
+        # Αλλιώς, ανανεώνεται το άνω ή το κάτω όριο ανάλογα με το αν το πρόβλημα μας πρόκειται για μεγιστοποίησης ή ελαχιστοποίησης αντίστοιχα
+        else:
+            if isMax:
+                upper_bound = x_obj
+            else:
+                lower_bound = x_obj
+
+        # Στην περίπτωση που η λύση των ευρετικών ταυτίζεται με την τιμή της χαλάρωσης LP της ρίζας, είναι βέλτιστη
+        if abs(lower_bound - upper_bound) < 1e-6:
+            if metrics:
+                log_node(metrics, inst.PRUNED, root_node, x_obj)
+            return finish(solutions, best_sol_idx, solutions_found, start)
+
+        # Καταγραφή του κόμβου (ρίζα) ως κόμβου branching
+        if metrics:
+            log_node(metrics, inst.BRANCHED, root_node, x_obj)
+
+        # Ανάγνωση της βάσης της ρίζας (πίνακες vbasis και cbasis) και των δυϊκών τιμών της για το Lagrangian bounding, που αποθηκεύονται μία
+        # φορά και μοιράζονται στα παιδιά της
+        vbasis, cbasis = read_basis(model, variables, constraints)
+        multipliers = np.array(model.getAttr("Pi", constraints)) if lagrangian_data is not None else None
+
+        # Reduced-cost fixing στην ρίζα, εφόσον υπάρχει καλύτερη λύση (από τις ευρετικές)
+        incumbent = lower_bound if isMax else upper_bound
+        if REDUCED_COST_FIXING and np.isfinite(incumbent):
+            fixed_by_reduced_cost += fix_by_reduced_cost(model, variables, root_node, x_candidate, x_obj, ub, lb, incumbent)
+
+        # Επιλογή της μη ακέραιας μεταβλητής για branching (selected_var_idx) με τον κανόνα branching, μετά την ανάγνωση της βάσης και των
+        # reduced costs της ρίζας (το strong branching επιλύει τις χαλαρώσεις των παιδιών στο μοντέλο, ξεκινώντας από την βάση της ρίζας)
+        selected_var_idx = brancher.select(model, x_candidate, x_obj, integer_var, vbasis, cbasis)
+        root_node.fraction = x_candidate[selected_var_idx] - np.floor(x_candidate[selected_var_idx])
+        strong_branching_lps = brancher.strong_branching_lps
+
+        # Δημιουργούμε ένα αριστερό branch στρογγυλοποιώντας προς τα κάτω την τιμή της μη ακέραιας μεταβλητής (νέο άνω όριο) και ένα δεξί branch 
+        # στρογγυλοποιώντας προς τα πάνω την τιμή της μη ακέραιας μεταβλητής (νέο κάτω όριο)
+        # Δημιουργία δυο αντικειμένων τύπου Node, που αντιπροσωπεύουν τους κόμβους παιδιά
+        left_child = Node(root_node, root_node.depth + 1, selected_var_idx, "UB", np.floor(x_candidate[selected_var_idx]), "Left")
+        right_child = Node(root_node, root_node.depth + 1, selected_var_idx, "LB", np.ceil(x_candidate[selected_var_idx]), "Right")
+        left_child.vbasis = right_child.vbasis = vbasis
+        left_child.cbasis = right_child.cbasis = cbasis
+        left_child.multipliers = right_child.multipliers = multipliers
+        memory_saved += 2 * (full_size - sys.getsizeof(left_child))
+
+        # Εισαγωγή των κόμβων παιδιών στην ουρά, με bound την τιμή της χαλάρωσης LP του πατέρα
+        estimate = ns.estimate_node(x_obj, x_candidate, integer_var, obj_coeffs, isMax)
+        stack.push(right_child, x_obj, estimate)
+        stack.push(left_child, x_obj, estimate)
+        if metrics:
+            metrics.mark(inst.BRANCHING)
+
+    # Χρονική στιγμή της επόμενης αποθήκευσης της κατάστασης της αναζήτησης στο checkpoint
+    next_checkpoint = time.perf_counter() + CHECKPOINT_INTERVAL
+
+    # Μνήμη (σε bytes) ενός ανοιχτού κόμβου κατά προσέγγιση: ο κόμβος, η εγγραφή του στην ουρά και το μισό της βάσης int8 που μοιράζεται με
+    # τον αδελφό του
+    node_memory = sys.getsizeof(Node(None, 0, -1)) + sys.getsizeof((None, None)) + (len(ub) + len(constraints)) // 2
+
+    # Λόγος τερματισμού λόγω ορίου (None αν η αναζήτηση ολοκληρωθεί)
+    termination = None
+
+    # Όσο υπάρχουν κόμβοι στην ουρά
+    while (len(stack) != 0):
 
-    # Ανάθεση των πινάκων lb και ub για την δημιουργία κάτω (0) και άνω (1) ορίων (πινάκων ορίων) για τις μεταβλητές των κόμβων παιδιών
-    left_lb = np.copy(lb)
-    left_ub = np.copy(ub)
-    right_lb = np.copy(lb)
-    right_ub = np.copy(ub)
+        # Ανανέωση του global dual bound με το καλύτερο bound των ανοιχτών κόμβων. Αν ταυτίζεται με την καλύτερη λύση, κανένας ανοιχτός κόμβος
+        # δεν μπορεί να την βελτιώσει και η αναζήτηση τερματίζεται
+        update_global_bound(stack)
+        if abs(lower_bound - upper_bound) < 1e-6:
+            break
 
-    # Έχουμε αποθηκεύσει την θέση της μη ακέραιας μεταβλητής στην μεταβλητή selected_var_idx
-    # Δημιουργούμε ένα αριστερό branch στρογγυλοποιώντας προς τα κάτω την τιμή της μη ακέραιας μεταβλητής και ένα δεξί branch στρογγυλοποιώντας 
-    # προς τα πάνω την τιμή της μη ακέραιας μεταβλητής και ανανεώνουμε τα όρια των branches για την συγκεκριμένη μεταβλητή
-    left_ub[selected_var_idx] = np.floor(x_candidate[selected_var_idx])
-    right_lb[selected_var_idx] = np.ceil(x_candidate[selected_var_idx])
+        # Έλεγχος των ορίων τερματισμού (χρόνος, κόμβοι, μνήμη των ανοιχτών κόμβων και gap)
+        termination = limits.check(nodes, len(stack) * node_memory, lower_bound if isMax else upper_bound,
+                                   upper_bound if isMax else lower_bound)
+        if termination is not None:
+            if metrics:
+                metrics.emit("limit", reason=termination, node=nodes, lower_bound=lower_bound, upper_bound=upper_bound, gap=current_gap())
+            # Αποθήκευση της κατάστασης στο checkpoint, ώστε η αναζήτηση να μπορεί να συνεχιστεί (π.χ. με μεγαλύτερο όριο χρόνου)
+            if checkpoint_file is not None:
+                save_search_state(checkpoint_file, obj_coeffs, stack, solutions, solutions_found, best_sol_idx, best_sol_obj,
+                                  brancher.pseudocosts)
+            break
 
-    # Δημιουργία δυο αντικειμένων τύπου Node, που αντιπροσωπεύουν τους κόμβους παιδιά
-    left_child = Node(left_ub, left_lb, root_node.depth + 1, vbasis.copy(), cbasis.copy(), selected_var_idx, "Left")
-    right_child = Node(right_ub, right_lb, root_node.depth + 1, vbasis.copy(), cbasis.copy(), selected_var_idx, "Right")
+        # Περιοδική αποθήκευση της κατάστασης της αναζήτησης στο checkpoint (πριν την αφαίρεση του επόμενου κόμβου από την ουρά, ώστε η
+        # κατάσταση να είναι πλήρης)
+        if checkpoint_file is not None and time.perf_counter() >= next_checkpoint:
+            save_search_state(checkpoint_file, obj_coeffs, stack, solutions, solutions_found, best_sol_idx, best_sol_obj,
+                              brancher.pseudocosts)
+            if metrics:
+                metrics.emit("checkpoint", node=nodes, open_nodes=len(stack))
+            next_checkpoint = time.perf_counter() + CHECKPOINT_INTERVAL
+
+        # Batched bounding: αν ο επόμενος κόμβος της ουράς δεν έχει υπολογιστεί, υπολογίζονται μαζί οι χαλαρώσεις LP των BATCH_SIZE επόμενων
+        # κόμβων και απορρίπτονται όσοι δεν βελτιώνουν την καλύτερη λύση, πριν την επίλυση οποιουδήποτε από αυτούς στο μοντέλο
+        if batch_data is not None and stack.peek()[0] not in batch_parent_bounds:
+            if metrics:
+                metrics.mark(inst.BOOKKEEPING)
+            incumbent = lower_bound
+            removed = stack.rebound(BATCH_SIZE, lambda block, block_bounds: bound_nodes(batch_data, block, block_bounds, ub, lb, incumbent,
+                                                                                        batch_parent_bounds))
+            batch_pruned += len(removed)
+            if metrics:
+                metrics.mark(inst.LP)
+                for node, bound in removed:
+                    log_node(metrics, inst.DISCARDED, node, bound)
+            if removed:
+                continue
 
-    # Εισαγωγή των κόμβων παιδιών στην στοίβα
-    stack.append(right_child)
-    stack.append(left_child)
+        # Ανάθεση στην μεταβλητή current_node τον επόμενο κόμβο της ουράς (τον τελευταίο που μπήκε για την αναζήτηση κατά βάθος ή αυτόν
+        # με το καλύτερο κλειδί για τις υπόλοιπες στρατηγικές), αντικείμενο τύπου Node, και αφαίρεση του από την ουρά
+        current_node, parent_obj = stack.pop()
 
-    # Όσο υπάρχουν κόμβοι στην στοίβα
-    while (len(stack) != 0):
+        # Για τους κόμβους του batched bounding, το bound της ουράς είναι η τιμή της χαλάρωσης του ίδιου του κόμβου, ενώ τα pseudocosts
+        # ενημερώνονται με την τιμή της χαλάρωσης του πατέρα
+        parent_lp_obj = batch_parent_bounds.pop(current_node, parent_obj)
 
-        print("\n********************************  NEW NODE BEING EXPLORED  ******************************** ")
+        # Στην περίπτωση που η τιμή της χαλάρωσης LP του πατέρα δεν βελτιώνει την καλύτερη λύση, ο κόμβος απορρίπτεται χωρίς επίλυση
+        if (isMax and parent_obj <= lower_bound + 1e-6) or (not isMax and parent_obj >= upper_bound - 1e-6):
+            if metrics:
+                log_node(metrics, inst.DISCARDED, current_node, parent_obj)
+            continue
 
         # Αύξηση του αριθμού των κόμβων που έχουν εξερευνηθεί κατά 1
         nodes += 1
 
-        # Ανάθεση στην μεταβλητή current_node τον τελευταίο κόμβο που μπήκε στην στοίβα, αντικείμενο τύπου Node
-        current_node = stack[-1]
-
-        # Αφαίρεση του τελευταίου κόμβου από την στοίβα
-        stack.pop()
-
-        # Ανανέωση του πίνακα nodes_per_depth στο επίπεδο του current_node, μείωση κατά 1, εφόσον ο κόμβος εξερευνήθηκε
-        nodes_per_depth[current_node.depth] -= 1
-
-        # Αν οι πίνακες vbasis και cbasis δεν είναι κενοί, γίνεται ανανέωση  τους για τις μεταβλητές του κόμβου
-        if (len(current_node.vbasis) != 0) and (len(current_node.cbasis) != 0):
-            model.setAttr("VBasis", model.getVars(), current_node.vbasis)
-            model.setAttr("CBasis", model.getConstrs(), current_node.cbasis)
+        # Ανανέωση των κάτω και άνω ορίων των μεταβλητών του μοντέλου με τα όρια του κόμβου (μόνο όσων αλλάζουν από τον τελευταίο κόμβο)
+        node_ub, node_lb = bounds.move_to(current_node)
+
+        # Lagrangian bounding: οι περιορισμοί χαλαρώνονται με τους πολλαπλασιαστές του πατέρα, που βελτιώνονται με βήματα subgradient, και
+        # ο κόμβος απορρίπτεται χωρίς επίλυση της χαλάρωσης LP αν το Lagrangian bound δεν βελτιώνει την καλύτερη λύση
+        if lagrangian_data is not None and current_node.multipliers is not None and np.isfinite(lower_bound):
+            if metrics:
+                metrics.mark(inst.BOOKKEEPING)
+            lagrangian_checked += 1
+            lagrangian_obj, _ = lagr.subgradient(*lagrangian_data, node_lb, node_ub, current_node.multipliers, lower_bound,
+                                                 LAGRANGIAN_ITERATIONS)
+            current_node.multipliers = None
+            if metrics:
+                metrics.mark(inst.LAGRANGIAN)
+            if lagrangian_obj <= lower_bound + 1e-6:
+                lagrangian_pruned += 1
+                current_node.vbasis = current_node.cbasis = None
+                if metrics:
+                    log_node(metrics, inst.PRUNED, current_node, lagrangian_obj)
+                continue
 
-        # Ανανέωση των κάτω και άνω ορίων των μεταβλητών του κόμβου
-        model.setAttr("LB", model.getVars(), current_node.lb)
-        model.setAttr("UB", model.getVars(), current_node.ub)
+        # Αν ο κόμβος έχει βάση (vbasis και cbasis, η βάση του πατέρα του ή η βέλτιστη βάση του από το batched bounding), γίνεται ανανέωση
+        # της βάσης του μοντέλου με αυτήν, εκτός αν είναι η βάση του πατέρα και ο πατέρας είναι ο τελευταίος κόμβος που επιλύθηκε, οπότε το
+        # μοντέλο έχει ήδη την βάση του. Ο κόμβος αφήνει έπειτα την αναφορά του στην βάση
+        parent = current_node.parent
+        if current_node.vbasis is not None and current_node.cbasis is not None:
+            if parent is not None and parent is last_solved and current_node.vbasis is vbasis:
+                skipped_basis_restores += 1
+            else:
+                model.setAttr("VBasis", variables, current_node.vbasis)
+                model.setAttr("CBasis", constraints, current_node.cbasis)
+            current_node.vbasis = current_node.cbasis = None
+        current_node.multipliers = None
 
         # Ενημέρωση του μοντέλου
         model.update()
-
-         # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging
-        if DEBUG_MODE:
-            debug_print()
+        if metrics:
+            metrics.mark(inst.BOOKKEEPING)
 
         # Επίλυση του μοντέλου
         model.optimize()
+        last_solved = current_node
 
         # Στην περίπτωση που βρεθεί μη εφικτή λύση 
         # Ανανεώνεται η μεταβλητή infeasible με την τιμή True και η μεταβλητή x_obj με την αρχική τιμή της καλύτερης λύσης (ανάλογα με το αν πρόκειται
-        # για πρόβλημα μεγιστοποίησης ή ελαχιστοποίησης). Στην συνέχεια, μειώνουμε τον αριθμό των κόμβων nodes_per_depth στα επόμενα επίπεδα του 
-        # δέντρου Branch and Bound
+        # για πρόβλημα μεγιστοποίησης ή ελαχιστοποίησης)
         infeasible = False
         if model.status != GRB.OPTIMAL:
             if isMax:
@@ -217,93 +722,70 @@ def branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth, nodes_per
             else:
                 infeasible = True
                 x_obj = np.inf
-            for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                nodes_per_depth[i] -= 2 * (i - current_node.depth)
 
         else:
             # Αποθήκευση των νέων τιμών των μεταβλητών στον πίνακα x_candidate μετά την επίλυση 
-            x_candidate = model.getAttr('X', model.getVars())
+            x_candidate = model.getAttr('X', variables)
 
             # Αποθήκευση της τιμής της αντικειμενικής συνάρτησης στην μεταβλητή x_obj
             x_obj = model.ObjVal
 
-            # Αν το πρόβλημα είναι μεγιστοποίησης και η τιμή της αντικειμενικής συνάρτησης (x_obj) είναι μεγαλύτερη από το προηγούμενο καλύτερο bound 
-            # σε αυτό το βάθος (best_bound_per_depth), ενημερώνουμε το best_bound_per_depth με αυτήν την τιμή
-            # Αλλιώς, αν το πρόβλημα είναι ελαχιστοποίησης και η τιμή της αντικειμενικής συνάρτησης (x_obj) είναι μικρότερη από το προηγούμενο καλύτερο
-            # bound σε αυτό το βάθος (best_bound_per_depth), ενημερώνουμε το best_bound_per_depth με αυτήν την τιμή
-            if isMax == True and x_obj > best_bound_per_depth[current_node.depth]:
-                best_bound_per_depth[current_node.depth] = x_obj
-            elif isMax == False and x_obj < best_bound_per_depth[current_node.depth]:
-                best_bound_per_depth[current_node.depth] = x_obj
-
-            # Αν δεν υπάρχει άλλος κόμβος στο επίπεδο και το πρόβλημα μας πρόκειται για πρόβλημα μεγιστοποίησης, ανανεώνουμε το άνω όριο με την τιμή 
-            # του καλύτερου bound σε αυτό το βάθος (best_bound_per_depth), αλλιώς αν το πρόβλημα μας πρόκειται για πρόβλημα ελαχιστοποίησης,
-            # ανανεώνουμε το κάτω όριο με την τιμή του καλύτερου bound σε αυτό το βάθος (best_bound_per_depth)
-            if nodes_per_depth[current_node.depth] == 0:
-                if isMax == True:
-                    upper_bound = best_bound_per_depth[current_node.depth]
-                else:
-                    lower_bound = best_bound_per_depth[current_node.depth]
-
-        # Στην περίπτωση που βρεθεί μη εφικτή λύση
-        # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Infeasible
+            # Ενημέρωση των pseudocosts της μεταβλητής branching του κόμβου με την μεταβολή της τιμής της χαλάρωσης LP από τον πατέρα
+            if parent is not None and parent.fraction is not None:
+                brancher.update(current_node.branching_var, current_node.bound_type == "LB", parent.fraction, parent_lp_obj, x_obj)
+
+        if metrics:
+            metrics.mark(inst.LP)
+
+        # Στην περίπτωση που βρεθεί μη εφικτή λύση, καταγραφή του κόμβου και εξερεύνηση του επόμενου κόμβου
         if infeasible:
-            if DEBUG_MODE:
-                debug_print(node=current_node, sol_status="Infeasible")
+            if metrics:
+                log_node(metrics, inst.INFEASIBLE, current_node)
             continue
 
         # Έχουμε αρχικοποιήσει τον πίνακα integer_vals με τις μεταβλητές που πρέπει υποχρεωτικά να παίρνουν ακέραιες τιμές (έργα)
         # Διατρέχουμε τον πίνακα integer_vals και καλούμε την συνάρτηση is_nearly_integer για την κάθε μεταβλητή για να ελέγξουμε αν είναι ακέραια 
-        # Στην περίπτωση που βρεθεί μεταβλητή που δεν είναι ακέραια αποθηκεύουμε την θέση της στην μεταβλητή selected_var_idx
         vars_have_integer_vals = True
         for idx, is_int_var in enumerate(integer_var):
             if is_int_var and not is_nearly_integer(x_candidate[idx]):
                 vars_have_integer_vals = False
-                selected_var_idx = idx
                 break
 
+        if metrics:
+            metrics.mark(inst.BRANCHING)
+
         # Στην περίπτωση που όλες οι μεταβλητές έχουν ακέραιες τιμές
         if vars_have_integer_vals: 
+            if metrics:
+                log_node(metrics, inst.INTEGER, current_node, x_obj)
             # Στην περίπτωση που το πρόβλημα είναι πρόβλημα μεγιστοποίησης
             if isMax:
                 # Στην περίπτωση που η τιμή της αντικειμενικής συνάρτησης για την ακέραια λύση είναι μεγαλύτερη από την υπάρχουσα τιμή του κάτω ορίου, 
                 # τότε η τιμή του κάτω ορίου ανανεώνεται
                 if lower_bound < x_obj: 
                     lower_bound = x_obj
+                    stack.on_incumbent(x_obj)
+                    record_incumbent(metrics, incumbent_callback, "branch_and_bound", x_obj, x_candidate)
                     # Στην περίπτωση που η τιμή του κάτω ορίου ταυτίζεται με αυτήν του άνω ορίου, τότε έχουμε βρει την βέλτιστη λύση
                     if abs(lower_bound - upper_bound) < 1e-6:
-                        # Προστίθεται η λύση στην λίστα solutions και αυξάνεται ο μετρητής solution_found κατά 1 
-                        solutions.append([x_candidate, x_obj, current_node.depth])
+                        # Προστίθεται η λύση στο pool solutions και αυξάνεται ο μετρητής solution_found κατά 1 
+                        solutions.add(x_candidate, x_obj, current_node.depth, time.perf_counter() - start)
                         solutions_found += 1
                         # Στην περίπτωση που η λύση είναι η καλύτερη λύση που έχει βρεθεί μέχρι στιγμής, ανανεώνεται η μεταβλητή best_sol_obj με την 
-                        # τιμή αυτή, η μεταβλητή best_sol_idx με την θέση της καλύτερης λύσης και καλείται η συνάρτηση debug_print για την εκτύπωση 
-                        # πληροφοριών για debuging με sol_status = Integer/Optimal
-                        if (abs(x_obj - best_sol_obj) < 1e-6) or solutions_found == 1:
+                        # τιμή αυτή
+                        if (isMax and x_obj > best_sol_obj) or (not isMax and x_obj < best_sol_obj) or solutions_found == 1:
                             best_sol_obj = x_obj
-                            best_sol_idx = solutions_found - 1
-
-                            if DEBUG_MODE:
-                                debug_print(node=current_node, x_obj=x_obj, sol_status="Integer/Optimal")
-                        return solutions, best_sol_idx, solutions_found
+                        return finish(solutions, best_sol_idx, solutions_found, start)
 
                     # Στην περίπτωση που δεν έχουμε βρει την βέλτιστη λύση 
-                    # Προστίθεται η λύση στην λίστα solutions και αυξάνεται ο μετρητής solution_found κατά 1
-                    solutions.append([x_candidate, x_obj, current_node.depth])
+                    # Προστίθεται η λύση στο pool solutions και αυξάνεται ο μετρητής solution_found κατά 1
+                    solutions.add(x_candidate, x_obj, current_node.depth, time.perf_counter() - start)
                     solutions_found += 1
                     # Στην περίπτωση που η λύση είναι η καλύτερη λύση που έχει βρεθεί μέχρι στιγμής, ανανεώνεται η μεταβλητή best_sol_obj με την τιμή 
-                    # αυτή, η μεταβλητή best_sol_idx με την θέση της καλύτερης λύσης και καλείται η συνάρτηση debug_print για την εκτύπωση πληροφοριών
-                    # για debuging με sol_status = Integer/Optimal
-                    if (abs(x_obj - best_sol_obj) <= 1e-6) or solutions_found == 1:
+                    # αυτή
+                    if (isMax and x_obj > best_sol_obj) or (not isMax and x_obj < best_sol_obj) or solutions_found == 1:
                         best_sol_obj = x_obj
-                        best_sol_idx = solutions_found - 1
 
-                    # Μείωση του αριθμού των κόμβων nodes_per_depth στα επόμενα επίπεδα του δέντρου Branch and Bound
-                    for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                        nodes_per_depth[i] -= 2 * (i - current_node.depth)
-
-                    # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Integer
-                    if DEBUG_MODE:
-                        debug_print(node=current_node, x_obj=x_obj, sol_status="Integer")
                     continue
             # Στην περίπτωση που το πρόβλημα είναι πρόβλημα ελαχιστοποίησης
             else:
@@ -311,119 +793,122 @@ def branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth, nodes_per
                 # τότε η τιμή του άνω ορίου ανανεώνεται
                 if upper_bound > x_obj: 
                     upper_bound = x_obj 
+                    stack.on_incumbent(x_obj)
+                    record_incumbent(metrics, incumbent_callback, "branch_and_bound", x_obj, x_candidate)
                     # Στην περίπτωση που η τιμή του κάτω ορίου ταυτίζεται με αυτήν του άνω ορίου, τότε έχουμε βρει την βέλτιστη λύση
                     if abs(lower_bound - upper_bound) < 1e-6: 
                         # Στην περίπτωση που δεν έχουμε βρει την βέλτιστη λύση 
-                        # Προστίθεται η λύση στην λίστα solutions και αυξάνεται ο μετρητής solution_found κατά 1
-                        solutions.append([x_candidate, x_obj, current_node.depth])
+                        # Προστίθεται η λύση στο pool solutions και αυξάνεται ο μετρητής solution_found κατά 1
+                        solutions.add(x_candidate, x_obj, current_node.depth, time.perf_counter() - start)
                         solutions_found += 1
                          # Στην περίπτωση που η λύση είναι η καλύτερη λύση που έχει βρεθεί μέχρι στιγμής, ανανεώνεται η μεταβλητή best_sol_obj με την 
-                         # τιμή αυτή, η μεταβλητή best_sol_idx με την θέση της καλύτερης λύσης και καλείται η συνάρτηση debug_print για την εκτύπωση 
-                         # πληροφοριών για debuging με sol_status = Integer/Optimal
-                        if (abs(x_obj - best_sol_obj) <= 1e-6) or solutions_found == 1:
+                         # τιμή αυτή
+                        if (isMax and x_obj > best_sol_obj) or (not isMax and x_obj < best_sol_obj) or solutions_found == 1:
                             best_sol_obj = x_obj
-                            best_sol_idx = solutions_found - 1
-                            if DEBUG_MODE:
-                                debug_print(node=current_node, x_obj=x_obj, sol_status="Integer/Optimal")
-                        return solutions, best_sol_idx, solutions_found
+                        return finish(solutions, best_sol_idx, solutions_found, start)
 
                     # Στην περίπτωση που δεν έχουμε βρει την βέλτιστη λύση 
-                    # Προστίθεται η λύση στην λίστα solutions και αυξάνεται ο μετρητής solution_found κατά 1
-                    solutions.append([x_candidate, x_obj, current_node.depth])
+                    # Προστίθεται η λύση στο pool solutions και αυξάνεται ο μετρητής solution_found κατά 1
+                    solutions.add(x_candidate, x_obj, current_node.depth, time.perf_counter() - start)
                     solutions_found += 1
                     # Στην περίπτωση που η λύση είναι η καλύτερη λύση που έχει βρεθεί μέχρι στιγμής, ανανεώνεται η μεταβλητή best_sol_obj με την τιμή 
-                    # αυτή, η μεταβλητή best_sol_idx με την θέση της καλύτερης λύσης 
-                    if (abs(x_obj - best_sol_obj) <= 1e-6) or solutions_found == 1:
+                    # αυτή
+                    if (isMax and x_obj > best_sol_obj) or (not isMax and x_obj < best_sol_obj) or solutions_found == 1:
                         best_sol_obj = x_obj
-                        best_sol_idx = solutions_found - 1
-
-                    # Μείωση του αριθμού των κόμβων nodes_per_depth στα επόμενα επίπεδα του δέντρου Branch and Bound
-                    for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                        nodes_per_depth[i] -= 2 * (i - current_node.depth)
 
-                    # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Integer
-                    if DEBUG_MODE:
-                        debug_print(node=current_node, x_obj=x_obj, sol_status="Integer")
                     continue
 
             # Στην περίπτωση που η λύση, x_obj, δεν βελτιώνει την υπάρχουσα καλύτερη, best_sol_obj (x_obj==best_sol_obj)
-            # Μείωση του αριθμού των κόμβων nodes_per_depth στα επόμενα επίπεδα του δέντρου Branch and Bound
-            for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                nodes_per_depth[i] -= 2 * (i - current_node.depth)
-
-            # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Integer (Rejected -- Doesn't improve
-            # incumbent)
-            if DEBUG_MODE:
-                debug_print(node=current_node, x_obj=x_obj,
-                            sol_status="Integer (Rejected -- Doesn't improve incumbent)")
             # Εξερεύνηση του επόμενου κόμβου
             continue
 
+        # Περιοδική εκτέλεση των ευρετικών στην λύση της χαλάρωσης LP του κόμβου (στρογγυλοποίηση και τοπική αναζήτηση)
+        if use_heuristics and nodes % HEURISTIC_FREQUENCY == 0:
+            if metrics:
+                metrics.mark(inst.BOOKKEEPING)
+            best = run_heuristics(heuristic_data, x_candidate)
+            if metrics:
+                metrics.mark(inst.HEURISTICS)
+            if best is not None and best[1] > lower_bound:
+                name, h_obj, h_x = best
+                lower_bound = h_obj
+                stack.on_incumbent(h_obj)
+                solutions.add(h_x, h_obj, current_node.depth, time.perf_counter() - start, name)
+                solutions_found += 1
+                best_sol_obj = h_obj
+                record_incumbent(metrics, incumbent_callback, name, h_obj, h_x)
+                # Στην περίπτωση που η τιμή του κάτω ορίου ταυτίζεται με αυτήν του άνω ορίου, τότε έχουμε βρει την βέλτιστη λύση
+                if abs(lower_bound - upper_bound) < 1e-6:
+                    return finish(solutions, best_sol_idx, solutions_found, start)
+
         # Στην περίπτωση που το πρόβλημα είναι πρόβλημα μεγιστοποίησης
         if isMax:
             # Στην περίπτωση που η τιμή της αντικειμενικής συνάρτησης είναι μικρότερη από την υπάρχουσα τιμή του κάτω ορίου ή σχεδόν ταυτίζονται
             if x_obj < lower_bound or abs(x_obj - lower_bound) < 1e-6: 
-                # Μείωση του αριθμού των κόμβων nodes_per_depth στα επόμενα επίπεδα του δέντρου Branch and Bound
-                for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                    nodes_per_depth[i] -= 2 * (i - current_node.depth)
-                # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Fractional -- Cut by bound
-                if DEBUG_MODE:
-                    debug_print(node=current_node, x_obj=x_obj, sol_status="Fractional -- Cut by bound")
+                # Καταγραφή του κόμβου ως κόμβου που απορρίφθηκε λόγω ορίου
+                if metrics:
+                    log_node(metrics, inst.PRUNED, current_node, x_obj)
                 # Εξερεύνηση του επόμενου κόμβου
                 continue
         # Στην περίπτωση που το πρόβλημα είναι πρόβλημα ελαχιστοποίησης
         else:
             # Στην περίπτωση που η τιμή της αντικειμενικής συνάρτησης είναι μεγαλύτερη από την υπάρχουσα τιμή του άνω ορίου ή σχεδόν ταυτίζονται
             if x_obj > upper_bound or abs(x_obj - upper_bound) < 1e-6: 
-                # Μείωση του αριθμού των κόμβων nodes_per_depth στα επόμενα επίπεδα του δέντρου Branch and Bound
-                for i in range(current_node.depth + 1, len(nodes_per_depth)):
-                    nodes_per_depth[i] -= 2 * (i - current_node.depth)
-                # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Fractional -- Cut by bound
-                if DEBUG_MODE:
-                    debug_print(node=current_node, x_obj=x_obj, sol_status="Fractional -- Cut by bound")
+                # Καταγραφή του κόμβου ως κόμβου που απορρίφθηκε λόγω ορίου
+                if metrics:
+                    log_node(metrics, inst.PRUNED, current_node, x_obj)
                 # Εξερεύνηση του επόμενου κόμβου
                 continue
 
-        # Κλήση της συνάρτησης debug_print για την εκτύπωση πληροφοριών για debuging με με sol_status = Fractional
-        if DEBUG_MODE:
-            debug_print(node=current_node, x_obj=x_obj, sol_status="Fractional")
-
-        # Αποθήκευση των θέσεων των μεταβλητών που έχουν μη μηδενική τιμή και των δεικτών των περιορισμών στους πίνακες vbasis και cbasis αντίστοιχα
-        vbasis = model.getAttr("VBasis", model.getVars())
-        cbasis = model.getAttr("CBasis", model.getConstrs())
-
-        # Ανάθεση των πινάκων lb και ub για την δημιουργία κάτω (0) και άνω (1) ορίων (πινάκων ορίων) για τις μεταβλητές των κόμβων παιδιών
-        left_lb = np.copy(current_node.lb)
-        left_ub = np.copy(current_node.ub)
-        right_lb = np.copy(current_node.lb)
-        right_ub = np.copy(current_node.ub)
-
-        # Έχουμε αποθηκεύσει την θέση της μη ακέραιας μεταβλητής στην μεταβλητή selected_var_idx
-        # Δημιουργούμε ένα αριστερό branch στρογγυλοποιώντας προς τα κάτω την τιμή της μη ακέραιας μεταβλητής και ένα δεξί branch στρογγυλοποιώντας 
-        # προς τα πάνω την τιμή της μη ακέραιας μεταβλητής και ανανεώνουμε τα όρια των branches για την συγκεκριμένη μεταβλητή
-        left_ub[selected_var_idx] = np.floor(x_candidate[selected_var_idx])
-        right_lb[selected_var_idx] = np.ceil(x_candidate[selected_var_idx])
-
+        # Καταγραφή του κόμβου ως κόμβου branching
+        if metrics:
+            log_node(metrics, inst.BRANCHED, current_node, x_obj)
+
+        # Ανάγνωση της βάσης του κόμβου (πίνακες vbasis και cbasis) και των δυϊκών τιμών του για το Lagrangian bounding, που αποθηκεύονται
+        # μία φορά και μοιράζονται στα παιδιά του
+        vbasis, cbasis = read_basis(model, variables, constraints)
+        multipliers = np.array(model.getAttr("Pi", constraints)) if lagrangian_data is not None else None
+
+        # Reduced-cost fixing στον κόμβο με την τρέχουσα καλύτερη λύση: οι σταθεροποιήσεις ισχύουν για όλο το υποδέντρο του κόμβου, ενώ κάθε
+        # βελτίωση της καλύτερης λύσης επιτρέπει περισσότερες σταθεροποιήσεις στους κόμβους που εξερευνώνται έπειτα
+        incumbent = lower_bound if isMax else upper_bound
+        if REDUCED_COST_FIXING and np.isfinite(incumbent):
+            fixed_by_reduced_cost += fix_by_reduced_cost(model, variables, current_node, x_candidate, x_obj, node_ub, node_lb, incumbent)
+
+        # Επιλογή της μη ακέραιας μεταβλητής για branching (selected_var_idx) με τον κανόνα branching, μετά την ανάγνωση της βάσης και των
+        # reduced costs του κόμβου (το strong branching επιλύει τις χαλαρώσεις των παιδιών στο μοντέλο, ξεκινώντας από την βάση του κόμβου)
+        selected_var_idx = brancher.select(model, x_candidate, x_obj, integer_var, vbasis, cbasis)
+        current_node.fraction = x_candidate[selected_var_idx] - np.floor(x_candidate[selected_var_idx])
+        strong_branching_lps = brancher.strong_branching_lps
+
+        # Δημιουργούμε ένα αριστερό branch στρογγυλοποιώντας προς τα κάτω την τιμή της μη ακέραιας μεταβλητής (νέο άνω όριο) και ένα δεξί branch 
+        # στρογγυλοποιώντας προς τα πάνω την τιμή της μη ακέραιας μεταβλητής (νέο κάτω όριο)
         # Δημιουργία δυο αντικειμένων τύπου Node, που αντιπροσωπεύουν τους κόμβους παιδιά
-        left_child = Node(left_ub, left_lb, current_node.depth + 1, vbasis.copy(), cbasis.copy(), selected_var_idx,
+        left_child = Node(current_node, current_node.depth + 1, selected_var_idx, "UB", np.floor(x_candidate[selected_var_idx]),
                           "Left")
-        right_child = Node(right_ub, right_lb, current_node.depth + 1, vbasis.copy(), cbasis.copy(), selected_var_idx,
+        right_child = Node(current_node, current_node.depth + 1, selected_var_idx, "LB", np.ceil(x_candidate[selected_var_idx]),
                            "Right")
-
-        # Εισαγωγή των κόμβων παιδιών στην στοίβα
-        stack.append(right_child)
-        stack.append(left_child)
-
-    return solutions, best_sol_idx, solutions_found
+        left_child.vbasis = right_child.vbasis = vbasis
+        left_child.cbasis = right_child.cbasis = cbasis
+        left_child.multipliers = right_child.multipliers = multipliers
+        memory_saved += 2 * (full_size - sys.getsizeof(left_child))
+
+        # Εισαγωγή των κόμβων παιδιών στην ουρά, με bound την τιμή της χαλάρωσης LP του πατέρα
+        estimate = ns.estimate_node(x_obj, x_candidate, integer_var, obj_coeffs, isMax)
+        stack.push(right_child, x_obj, estimate)
+        stack.push(left_child, x_obj, estimate)
+        if metrics:
+            metrics.mark(inst.BRANCHING)
+
+    update_global_bound(stack)
+    if metrics:
+        metrics.mark(inst.BOOKKEEPING)
+    return finish(solutions, best_sol_idx, solutions_found, start, termination)
 
 if __name__ == "__main__":
  
     # Ανάγνωση των path όλων των αρχείων προβλημάτων, εντός του φακέλου problems και αποθήκευση τους στην λίστα problems (το κάθε path στην κάθε γραμμή)
-    problems = []
-    for root, dirs, files in os.walk("problems"):
-        for file in files:
-            if file.endswith(".dat"):
-                problems.append(os.path.join(root, file))
+    problems = pr.find_problem_files("problems")
 
     # Βρόχος για επίλυση όλων των αρχείων προβλημάτων, όπου το path τους ανήκει στην λίστα problems
     for prob_file in problems:
@@ -431,95 +916,102 @@ if __name__ == "__main__":
         print(f"Currently processing problem file: {prob_file}\n")
         print("************************    Initializing structures...    ************************")
 
-        # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου
-        model, ub, lb, integer_var, num_vars, c = pr.capital_budgeting(prob_file)
+        # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου, μετά το presolve αν PRESOLVE = True
+        if PRESOLVE:
+            model, ub, lb, integer_var, num_vars, c, reduction = ps.build_presolved_model(prob_file, LP_ENGINE)
+            print(f"Presolve: {len(reduction.fixed_zero)} projects fixed to 0, {len(reduction.fixed_one)} fixed to 1, {num_vars} free")
+        else:
+            model, ub, lb, integer_var, num_vars, c = pr.build_model(prob_file, LP_ENGINE)
+            reduction = None
 
         # Πρόβλημα μεγιστοποίησης
         isMax = True 
 
-        # Αρχικοποίηση του πίνακα best_bound_per_depth στο -άπειρο αν το πρόβλημα μας πρόκειται για πρόβλημα μεγιστοποίησης, 
-        # αλλιώς αρχικοποίηση του πίνακα best_bound_per_depth στο άπειρο αν το πρόβλημα μας πρόκειται για πρόβλημα ελαχιστοποίησης
-        # Οι τιμές του best_bound_per_depth στο πρόβλημα μεγιστοποίησης είναι οι μικρότερες δυνατές επειδή ψάχνουμε να βρούμε την μεγαλύτερη τιμή
-        # για κάθε βάθος του δέντρου αναζήτησης
-        # Αντίστοιχα, οι τιμές του best_bound_per_depth στο πρόβλημα ελαχιστοποίησης είναι οι μεγαλύτερες δυνατές επειδή ψάχνουμε να βρούμε την 
-        # μικρότερη τιμή για κάθε βάθος του δέντρου αναζήτησης
-        if isMax == True:
-            best_bound_per_depth = np.array([-np.inf for i in range(num_vars)])
-        else:
-            best_bound_per_depth = np.array([np.inf for i in range(num_vars)])
-
-        # Δημιουργία του πίνακα nodes_per_depth, ο οποίος καταγράφει τον αριθμό των κόμβων σε κάθε επίπεδο του δέντρου αναζήτησης του αλγορίθμου 
-        # branch and bound
-        # Το επίπεδο 0 (ρίζα) αρχικοποείται στο 1, ενώ για κάθε επόμενο βάθος ο αριθμός των κόμβων διπλασιάζεται σε σχέση με το προηγούμενο επίπεδο
-        nodes_per_depth = np.zeros(num_vars + 1, dtype=float)
-        nodes_per_depth[0] = 1
-        for i in range(1, num_vars + 1):
-            nodes_per_depth[i] = nodes_per_depth[i - 1] * 2
+        # Καταγραφή μετρικών, με γραμμή προόδου και (αν έχει οριστεί το EVENT_LOG) αρχείο JSON lines με τα γεγονότα
+        sinks = [inst.ProgressSink()]
+        if EVENT_LOG is not None:
+            sinks.append(inst.JsonLinesSink(EVENT_LOG))
+        METRICS = inst.Metrics(sinks, sample_every=LOG_SAMPLE_EVERY)
 
         # Κλήση της συνάρτησης branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound και χρονομέτρηση του χρόνου εκτέλεσης
         print("************************    Solving problem...    ************************")
+        # Με CHECKPOINT = True η κατάσταση της αναζήτησης αποθηκεύεται περιοδικά (και όταν εξαντληθεί ένα όριο) δίπλα στο αρχείο προβλήματος
+        # και διαγράφεται όταν η αναζήτηση ολοκληρωθεί (με RESUME = True μια εκτέλεση που διακόπηκε συνεχίζεται από το τελευταίο checkpoint)
+        checkpoint_file = prob_file + ".checkpoint" if CHECKPOINT else None
         start = time.time()
-        solutions, best_sol_idx, solutions_found = branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth,
-                                                                nodes_per_depth)
+        solutions, best_sol_idx, solutions_found = branch_and_bound(model, ub, lb, integer_var, checkpoint_file=checkpoint_file)
         end = time.time()
+        if checkpoint_file is not None and os.path.exists(checkpoint_file) and result.status in (lim.OPTIMAL, lim.INFEASIBLE):
+            os.remove(checkpoint_file)
 
         # Εκτύπωση των αποτελεσμάτων
         print("========= Optimal Solutions =========")        
-        print("solutions:", solutions)
-        print("best_sol_idx:", best_sol_idx)
-        print(solutions[best_sol_idx][0])
-        print(f"Objective Value: {solutions[best_sol_idx][1]}")
-        print(f"Tree depth: {solutions[best_sol_idx][2]}")
-        print()
-        print(solutions)
+        print(f"Status: {result.status}")
+        if not solutions:
+            METRICS.close()
+            continue
+        # Μετατροπή των λύσεων του μειωμένου προβλήματος σε λύσεις του αρχικού
+        if reduction is not None:
+            solutions = solutions.expanded(reduction.expand, reduction.objective)
+        best = solutions[best_sol_idx]
+        print(f"Selected projects: {best.selected().tolist()}")
+        print(f"Objective Value: {best.objective}")
+        print(f"Tree depth: {best.depth}")
+        print(f"Solutions found: {solutions_found} ({len(solutions)} kept in the solution pool)")
+        # Εξαγωγή του pool λύσεων σε αρχείο, αντί για εκτύπωση των πλήρων λύσεων
+        if SOLUTION_POOL_FILE is not None:
+            pool_file = f"{prob_file}.solutions.{SOLUTION_POOL_FILE}"
+            solutions.save(pool_file)
+            print(f"Solution pool written to {pool_file}")
+        print(f"Parse time: {pr.parse_time}")
         print(f"Time Elapsed: {end - start}")
         print(f"Total nodes: {nodes}")
+        print(f"Gap: {current_gap():.2%}")
+        print(f"Variables fixed by reduced cost: {fixed_by_reduced_cost}")
+        print(f"Branching rule: {BRANCHING} ({strong_branching_lps} strong branching LPs)")
+        print(f"Basis restores skipped: {skipped_basis_restores}")
+        if BATCH_BOUNDING:
+            print(f"Batched bounding: {batch_bounded} nodes bounded, {batch_pruned} pruned before their LP")
+        if LAGRANGIAN_BOUNDING:
+            print(f"Lagrangian bounding: {lagrangian_pruned} of {lagrangian_checked} nodes pruned before their LP "
+                  f"({lagrangian_pruned / max(lagrangian_checked, 1):.1%})")
+        print(f"Memory saved by compact nodes: {memory_saved / 2**20:.2f} MB")
+        for name, obj, node_count in incumbent_log:
+            if reduction is not None:
+                obj = reduction.objective(obj)
+            print(f"Incumbent {obj} found by {name} after {node_count} nodes")
+        summary = METRICS.summary()
+        print("Nodes by outcome: " + ", ".join(f"{outcome} {count}" for outcome, count in summary["outcomes"].items()))
+        print("Time by phase: " + ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in summary["times"].items()))
+        METRICS.close()
 
     """
     print(f"Currently processing problem file: problems\class_1\problem_1.dat\n")
     print("************************    Initializing structures...    ************************")
 
     # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου
-    model, ub, lb, integer_var, num_vars, c = pr.capital_budgeting("problems\class_1\problem_1.dat")
+    model, ub, lb, integer_var, num_vars, c = pr.build_model("problems\class_1\problem_1.dat", LP_ENGINE)
 
     # Πρόβλημα μεγιστοποίησης
     isMax = True 
 
-    # Αρχικοποίηση του πίνακα best_bound_per_depth στο -άπειρο αν το πρόβλημα μας πρόκειται για πρόβλημα μεγιστοποίησης, 
-    # αλλιώς αρχικοποίηση του πίνακα best_bound_per_depth στο άπειρο αν το πρόβλημα μας πρόκειται για πρόβλημα ελαχιστοποίησης
-    # Οι τιμές του best_bound_per_depth στο πρόβλημα μεγιστοποίησης είναι οι μικρότερες δυνατές επειδή ψάχνουμε να βρούμε την μεγαλύτερη τιμή
-    # για κάθε βάθος του δέντρου αναζήτησης
-    # Αντίστοιχα, οι τιμές του best_bound_per_depth στο πρόβλημα ελαχιστοποίησης είναι οι μεγαλύτερες δυνατές επειδή ψάχνουμε να βρούμε την 
-    # μικρότερη τιμή για κάθε βάθος του δέντρου αναζήτησης
-    if isMax == True:
-        best_bound_per_depth = np.array([-np.inf for i in range(num_vars)])
-    else:
-        best_bound_per_depth = np.array([np.inf for i in range(num_vars)])
-
-    # Δημιουργία του πίνακα nodes_per_depth, ο οποίος καταγράφει τον αριθμό των κόμβων σε κάθε επίπεδο του δέντρου αναζήτησης του αλγορίθμου 
-    # branch and bound
-    # Το επίπεδο 0 (ρίζα) αρχικοποείται στο 1, ενώ για κάθε επόμενο βάθος ο αριθμός των κόμβων διπλασιάζεται σε σχέση με το προηγούμενο επίπεδο
-    nodes_per_depth = np.zeros(num_vars + 1, dtype=float)
-    nodes_per_depth[0] = 1
-    for i in range(1, num_vars + 1):
-        nodes_per_depth[i] = nodes_per_depth[i - 1] * 2
-
     # Κλήση της συνάρτησης branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound και χρονομέτρηση του χρόνου εκτέλεσης
     print("************************    Solving problem...    ************************")
     start = time.time()
-    solutions, best_sol_idx, solutions_found = branch_and_bound(model, ub, lb, integer_var, best_bound_per_depth,
-                                                                nodes_per_depth)
+    solutions, best_sol_idx, solutions_found = branch_and_bound(model, ub, lb, integer_var)
     end = time.time()
 
     # Εκτύπωση των αποτελεσμάτων
     print("========= Optimal Solutions =========")        
-    print("solutions:", solutions)
     print("best_sol_idx:", best_sol_idx)
-    print(solutions[best_sol_idx][0])
-    print(f"Objective Value: {solutions[best_sol_idx][1]}")
-    print(f"Tree depth: {solutions[best_sol_idx][2]}")
-    print()
-    print(solutions)
+    best = solutions[best_sol_idx]
+    print(f"Selected projects: {best.selected().tolist()}")
+    print(f"Objective Value: {best.objective}")
+    print(f"Tree depth: {best.depth}")
+    print(f"Solutions found: {solutions_found} ({len(solutions)} kept in the solution pool)")
     print(f"Time Elapsed: {end - start}")
     print(f"Total nodes: {nodes}")
+    print(f"Memory saved by compact nodes: {memory_saved / 2**20:.2f} MB")
+    for name, obj, node_count in incumbent_log:
+        print(f"Incumbent {obj} found by {name} after {node_count} nodes")
     """
\ No newline at end of file
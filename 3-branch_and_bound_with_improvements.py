@@ -1,75 +1,277 @@
-import gurobipy as gp
-from gurobipy import GRB
 import numpy as np
 import time
-from collections import deque
 import problems as pr
+import lp_relaxation as lp
+import node_selection as ns
+import branching as br
+import heuristics as heur
+import presolve as ps
+import instrumentation as inst
+import cuts as ct
+import limits as lim
+import solution_pool as sp
 import os
+import sys
+
+# Το gurobipy χρειάζεται μόνο όταν LP_ENGINE = "gurobi"
+try:
+    import gurobipy as gp
+    from gurobipy import GRB
+except ImportError:
+    gp = None
+    GRB = lp.GRB
 
 # Δήλωση global μεταβλητών
 isMax = None          # True αν πρόκειται για πρόβλημα μεγιστοποίησης, False αν πρόκειται για πρόβλημα ελαχιστοποίησης
-DEBUG_MODE = True     # True για ενεργοποίηση μηνυμάτων debuging, False για απενεργοποίηση μηνυμάτων debuging
+METRICS = None        # αντικείμενο instrumentation.Metrics για την καταμέτρηση των κόμβων, την χρονομέτρηση των φάσεων και την καταγραφή γεγονότων,
+                      # None για απενεργοποίηση (χωρίς κόστος)
 nodes = 0             # αριθμός των κόμβων
+fixed_by_reduced_cost = 0 # αριθμός μεταβλητών που σταθεροποιήθηκαν με reduced-cost fixing στους κόμβους του δέντρου
 lower_bound = -np.inf # κάτω όριο = - άπειρο
 upper_bound = np.inf  # άνω όριο = άπειρο
+NODE_SELECTION = "depth-first" # στρατηγική επιλογής κόμβων: "depth-first", "best-bound", "best-estimate" ή "hybrid" (node_selection)
+BRANCHING = "most-fractional" # κανόνας επιλογής της μεταβλητής branching: "first-fractional", "most-fractional", "pseudocost" ή
+                      # "reliability" (branching)
+strong_branching_lps = 0 # αριθμός χαλαρώσεων LP που επιλύθηκαν από το strong branching του κανόνα "reliability"
+PRESOLVE = True       # True για presolve (αφαίρεση έργων που δεν χωράνε και reduced-cost fixing στην ρίζα) πριν τον branch and bound
+REDUCED_COST_FIXING = True # True για reduced-cost fixing σε κάθε κόμβο με την τρέχουσα καλύτερη λύση (ισχύει για όλο το υποδέντρο του κόμβου)
+LP_ENGINE = "gurobi"  # μηχανή επίλυσης των χαλαρώσεων LP των κόμβων: "gurobi" ή "numpy" (lp_relaxation, δεν απαιτεί άδεια Gurobi)
+HEURISTICS = True     # True για εκτέλεση των ευρετικών (greedy, στρογγυλοποίηση LP, τοπική αναζήτηση) για την εύρεση καλών ακέραιων λύσεων
+HEURISTIC_FREQUENCY = 100 # οι ευρετικές εκτελούνται στην ρίζα και έπειτα κάθε HEURISTIC_FREQUENCY κόμβους
+INTEGRAL_OBJECTIVE = True # True για στρογγυλοποίηση των ορίων LP στον ακέραιο (προς τα κάτω για μεγιστοποίηση) όταν η αντικειμενική συνάρτηση
+                      # παίρνει μόνο ακέραιες τιμές (ακέραιοι συντελεστές στις ακέραιες μεταβλητές), ώστε να απορρίπτονται περισσότεροι κόμβοι
+CUTS = True           # True για περικοπές κάλυψης (lifted cover cuts) των περιορισμών κεφαλαίου και προσωπικού, με διαχείριση σε cut pool (cuts)
+CUT_ROUNDS_ROOT = 10  # μέγιστος αριθμός γύρων διαχωρισμού περικοπών στην ρίζα
+CUT_ROUNDS = 1        # μέγιστος αριθμός γύρων διαχωρισμού περικοπών στους υπόλοιπους κόμβους
+CUTS_PER_ROUND = 10   # μέγιστος αριθμός περικοπών που προστίθενται σε κάθε γύρο
+CUT_MAX_AGE = 10      # μια περικοπή αφαιρείται από το μοντέλο όταν δεν είναι ενεργή σε περισσότερες από CUT_MAX_AGE διαδοχικές επιλύσεις
+CUT_POOL_SIZE = 1000  # μέγιστος αριθμός global περικοπών στο cut pool
+cuts_added = 0        # αριθμός περικοπών που προστέθηκαν στο μοντέλο
+integral_objective = False # True αν η αντικειμενική συνάρτηση του τρέχοντος προβλήματος παίρνει μόνο ακέραιες τιμές (και INTEGRAL_OBJECTIVE = True)
+TIME_LIMIT = None     # όριο χρόνου (σε δευτερόλεπτα), None για κανένα όριο
+NODE_LIMIT = None     # όριο αριθμού κόμβων, None για κανένα όριο
+MEMORY_LIMIT = None   # όριο μνήμης των ανοιχτών κόμβων (σε MB, κατά προσέγγιση), None για κανένα όριο
+ABSOLUTE_GAP = None   # τερματισμός όταν η απόσταση της καλύτερης λύσης από το global dual bound γίνει το πολύ ABSOLUTE_GAP, None για κανένα όριο
+RELATIVE_GAP = None   # τερματισμός όταν το σχετικό gap γίνει το πολύ RELATIVE_GAP (π.χ. 0.001 για 0.1%), None για κανένα όριο
+INCUMBENT_CALLBACK = None # συνάρτηση callback(obj, x, source, nodes) που καλείται για κάθε νέα καλύτερη λύση, None για καμία
+result = None         # αποτέλεσμα (limits.Result) της τελευταίας εκτέλεσης: λόγος τερματισμού, καλύτερη λύση, bound, gap, κόμβοι και χρόνος
+incumbent_log = []    # λίστα με τις βελτιώσεις της καλύτερης λύσης, ως (πηγή της λύσης, τιμή αντικειμενικής συνάρτησης, αριθμός κόμβων)
+SOLUTION_POOL_SIZE = sp.POOL_SIZE # αριθμός των καλύτερων διαφορετικών λύσεων που κρατά το pool λύσεων (solution_pool)
+SOLUTION_POOL_FILE = "json" # στο main: μορφή του αρχείου <αρχείο προβλήματος>.solutions.<μορφή> για την εξαγωγή του pool λύσεων ("json" ή
+                      # "npz"), None για καμία εξαγωγή
 
 # Συνάρτηση is_nearly_integer για την υπολογισμό αν μια τιμή προσεγγίζει μια ακέραια
 def is_nearly_integer(value, tolerance=1e-6):
 
     return abs(value - round(value)) <= tolerance
 
-# Συνάρτηση select_branching_variable για την επιλογή της μεταβλητής για branching
-def select_branching_variable(x_candidate, integer_var):
+# Συνάρτηση node_bound για το όριο που δίνει η τιμή x_obj της χαλάρωσης LP ενός κόμβου για τις ακέραιες λύσεις του υποδέντρου του: η ίδια
+# τιμή, ή ο ακέραιος προς τα κάτω (πάνω για ελαχιστοποίηση) όταν η αντικειμενική συνάρτηση παίρνει μόνο ακέραιες τιμές
+def node_bound(x_obj):
 
-    # Διατρέχουμε τον πίνακα integer_var και για τις μεταβλητές που πρέπει να έχουν ακέραια τιμή, υπολογίzουμε την απόσταση τους από τους πλησιέστερους
-    # ακεραίους και κρατάμε την μικρότερη τιμή. Οι τιμές αυτές αποθηκεύονται έπειτα στην λίστα fractional_vars
-    fractional_vars = [(i, min(abs(x - np.floor(x)), abs(np.ceil(x) - x))) 
-                       for i, x in enumerate(x_candidate) if integer_var[i] and not is_nearly_integer(x)]
-    
-    # Διατρέχουμε την λίστα fractional_vars και επιστρέφουμε την μεταβλητή με την μεγαλύτερη απόσταση, αν δεν υπάρχει μεταβλητή επιστρέφεται None
-    return max(fractional_vars, key=lambda x: x[1])[0] if fractional_vars else None
+    if not integral_objective:
+        return x_obj
+    return np.floor(x_obj + 1e-6) if isMax else np.ceil(x_obj - 1e-6)
+
+# Συνάρτηση is_pruned για τον έλεγχο αν το όριο bound ενός κόμβου δεν βελτιώνει την καλύτερη λύση incumbent
+def is_pruned(bound, incumbent):
+
+    return (isMax and bound <= incumbent + 1e-6) or (not isMax and bound >= incumbent - 1e-6)
+
+# Συνάρτηση add_integer_solution για την προσθήκη της ακέραιας λύσης x_candidate (τιμή x_obj) της χαλάρωσης LP ενός κόμβου βάθους depth στο
+# pool solutions (με χρόνο από την στιγμή start) και την ανανέωση της καλύτερης λύσης, αν την βελτιώνει
+def add_integer_solution(metrics, incumbent_callback, stack, solutions, x_candidate, x_obj, depth, start):
+
+    global lower_bound, upper_bound
+    if metrics:
+        log_node(metrics, inst.INTEGER, depth, x_obj)
+    solutions.add(x_candidate, x_obj, depth, time.perf_counter() - start)
+    # Στην περίπτωση που το πρόβλημα είναι πρόβλημα μεγιστοποίησης και η τιμή της αντικειμενικής συνάρτησης για την ακέραια λύση είναι 
+    # μεγαλύτερη από την υπάρχουσα τιμή του κάτω ορίου, τότε η τιμή του κάτω ορίου ανανεώνεται
+    if isMax and x_obj > lower_bound:
+        lower_bound = x_obj
+    # Στην περίπτωση που το πρόβλημα είναι πρόβλημα ελαχιστοποίησης και η τιμή της αντικειμενικής συνάρτησης για την ακέραια λύση είναι 
+    # μικρότερη από την υπάρχουσα τιμή του άνω ορίου, τότε η τιμή του άνω ορίου ανανεώνεται
+    elif not isMax and x_obj < upper_bound:
+        upper_bound = x_obj
+    else:
+        return
+    stack.on_incumbent(x_obj)
+    record_incumbent(metrics, incumbent_callback, "branch_and_bound", x_obj, x_candidate)
+
+# Συνάρτηση separate_cuts για τους γύρους διαχωρισμού περικοπών (έως rounds) ενός κόμβου με όρια lb, ub και λύση της χαλάρωσης LP x_candidate
+# (τιμή x_obj): σε κάθε γύρο οι περικοπές που παραβιάζονται προστίθενται στο μοντέλο και η χαλάρωση επιλύεται ξανά. Οι γύροι σταματούν όταν
+# η λύση είναι ακέραια, όταν η τιμή της δεν βελτιώνει την καλύτερη λύση incumbent ή όταν δεν βρεθούν περικοπές
+# Επιστρέφει την νέα λύση, την τιμή της και τις local περικοπές που βρέθηκαν, ή None αν η χαλάρωση έγινε μη εφικτή
+def separate_cuts(model, cut_pool, x_candidate, x_obj, lb, ub, integer_var, rounds, incumbent):
+
+    global cuts_added
+    new_local_cuts = []
+    integer = np.asarray(integer_var, dtype=bool)
+    for _ in range(rounds):
+        x = np.asarray(x_candidate, dtype=float)
+        if np.all(np.abs(x - np.round(x))[integer] <= 1e-6):
+            break
+        if is_pruned(node_bound(x_obj), incumbent):
+            break
+        new_cuts = cut_pool.separate(x_candidate, lb, ub)
+        if not new_cuts:
+            break
+        cut_pool.add(model, new_cuts)
+        cuts_added += len(new_cuts)
+        new_local_cuts.extend(cut for cut in new_cuts if cut.local)
+        model.optimize()
+        if model.status != GRB.OPTIMAL:
+            return None
+        x_candidate = model.getAttr('X', model.getVars())
+        x_obj = model.ObjVal
+
+    cut_pool.age(model, x_candidate)
+    return x_candidate, x_obj, new_local_cuts
+
+# Συνάρτηση update_global_bound για την ανανέωση του global dual bound (άνω όριο για πρόβλημα μεγιστοποίησης, κάτω όριο για ελαχιστοποίησης)
+# με το καλύτερο bound των ανοιχτών κόμβων της ουράς stack
+def update_global_bound(stack):
+
+    global lower_bound, upper_bound
+    bound = stack.best_bound()
+    if isMax:
+        upper_bound = lower_bound if bound is None else max(bound, lower_bound)
+    else:
+        lower_bound = upper_bound if bound is None else min(bound, upper_bound)
+
+# Συνάρτηση current_gap για τον υπολογισμό της σχετικής απόστασης (gap) μεταξύ της καλύτερης λύσης και του global dual bound
+def current_gap():
+
+    if isMax:
+        return ns.relative_gap(lower_bound, upper_bound)
+    return ns.relative_gap(upper_bound, lower_bound)
 
-# Συνάρτηση apply_gomory_cut για την εφαρμογή Gomory Cuts
-def apply_gomory_cut(model, x_candidate, integer_var):
+# Συνάρτηση log_node για την καταγραφή του αποτελέσματος outcome ενός κόμβου στο αντικείμενο metrics, μαζί με τα τρέχοντα όρια
+def log_node(metrics, outcome, depth, x_obj=None):
 
-    # Διατρέχουμε τον πίνακα των μεταβλητών 
-    for i, x in enumerate(x_candidate):
-        # Στην περίπτωση που μια μεταβλητή πρέπει να έχει ακέραια τιμή, αλλά δεν είναι ακέραια, εισάγουμε έναν περιορισμό Gomory Cut αναγκάζοντας τη 
-        # μεταβλητή να πάρει τιμή μικρότερη ή ίση με το ακέραιο μέρος της
-        if integer_var[i] and not is_nearly_integer(x):
-            model.addConstr(model.getVars()[i] <= np.floor(x), name=f"GomoryCut_{i}")
+    metrics.node(outcome, node=nodes, depth=depth, obj=x_obj, lower_bound=lower_bound, upper_bound=upper_bound)
 
-def branch_and_bound(model, ub, lb, integer_var):
+# Συνάρτηση record_incumbent για την καταγραφή μιας νέας καλύτερης λύσης x (τιμή obj) που βρέθηκε από την πηγή source (ευρετική ή
+# "branch_and_bound"): προσθήκη στο incumbent_log, αποστολή γεγονότος στο metrics και κλήση του incumbent_callback, αν έχει δοθεί
+def record_incumbent(metrics, incumbent_callback, source, obj, x):
+
+    incumbent_log.append((source, obj, nodes))
+    if metrics:
+        metrics.emit("incumbent", source=source, obj=obj, node=nodes)
+    if incumbent_callback is not None:
+        incumbent_callback(obj, x, source, nodes)
+
+# Συνάρτηση branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound με τις βελτιώσεις (ευρετικές, reduced-cost fixing, περικοπές)
+# Η αναζήτηση τερματίζεται νωρίτερα όταν εξαντληθεί ένα από τα όρια limits (αντικείμενο limits.Limits, από προεπιλογή με τα όρια TIME_LIMIT,
+# NODE_LIMIT, MEMORY_LIMIT, ABSOLUTE_GAP και RELATIVE_GAP), και το incumbent_callback (από προεπιλογή INCUMBENT_CALLBACK) καλείται για κάθε
+# νέα καλύτερη λύση. Η μεταβλητή branching κάθε κόμβου επιλέγεται με τον κανόνα branching (από προεπιλογή BRANCHING). Το αποτέλεσμα της
+# αναζήτησης αποθηκεύεται στην global μεταβλητή result
+def branch_and_bound(model, ub, lb, integer_var, node_selection=None, limits=None, incumbent_callback=None, branching=None):
     
     # Αρχικοποίηση των global μεταβλητών nodes, lower_bound και upper_bound, καθώς τροποποιούνται στην κλήση της συνάρτησης για το κάθε αρχείο 
     # προβλήματος
-    global nodes, lower_bound, upper_bound
+    global nodes, lower_bound, upper_bound, incumbent_log, fixed_by_reduced_cost, cuts_added, integral_objective, result, strong_branching_lps
     nodes = 0 
+    fixed_by_reduced_cost = 0
+    cuts_added = 0
+    strong_branching_lps = 0
     lower_bound = -np.inf 
     upper_bound = np.inf 
+    incumbent_log = []
+    start = time.perf_counter()
+
+    # Όρια τερματισμού και callback για τις νέες καλύτερες λύσεις
+    if limits is None:
+        limits = lim.Limits(TIME_LIMIT, NODE_LIMIT, MEMORY_LIMIT, ABSOLUTE_GAP, RELATIVE_GAP)
+    else:
+        limits.start()
+    if incumbent_callback is None:
+        incumbent_callback = INCUMBENT_CALLBACK
+
+    # Αντικείμενο καταγραφής μετρικών (None αν η καταγραφή είναι απενεργοποιημένη)
+    metrics = METRICS
+    if metrics:
+        metrics.mark(inst.BOOKKEEPING)
+
+    # Δημιουργία άδειας ουράς ανοιχτών κόμβων σύμφωνα με την στρατηγική επιλογής κόμβων (στοίβα για την αναζήτηση κατά βάθος, 
+    # heap για best-bound/best-estimate)
+    if node_selection is None:
+        node_selection = NODE_SELECTION
+    stack = ns.create_node_queue(node_selection, isMax)
 
-    # Δημιουργία άδειας στοίβας με την χρήση της deque()
-    stack = deque()
+    # Κανόνας επιλογής της μεταβλητής branching, με τα pseudocosts των μεταβλητών
+    if branching is None:
+        branching = BRANCHING
+    brancher = br.Brancher(branching, len(ub), isMax)
 
-    # Δημιουργία μιας κενής λίστας για την αποθήκευση των λύσεων
-    solutions = list()
+    # Συντελεστές της αντικειμενικής συνάρτησης, για τον υπολογισμό της εκτίμησης best-estimate των κόμβων
+    obj_coeffs = model.getAttr("Obj", model.getVars())
+
+    # Η αντικειμενική συνάρτηση παίρνει μόνο ακέραιες τιμές όταν οι συντελεστές των ακέραιων μεταβλητών είναι ακέραιοι και των συνεχών μηδενικοί
+    coeffs = np.asarray(obj_coeffs, dtype=float)
+    integer = np.asarray(integer_var, dtype=bool)
+    integral_objective = INTEGRAL_OBJECTIVE and bool(np.all(coeffs[integer] == np.round(coeffs[integer])) and np.all(coeffs[~integer] == 0))
+
+    # Δημιουργία ενός κενού pool για την αποθήκευση των SOLUTION_POOL_SIZE καλύτερων λύσεων
+    solutions = sp.SolutionPool(isMax, SOLUTION_POOL_SIZE)
     # Αρχικοποίηση ενός μετρητή για τον αριθμό των λύσεων που βρέθηκαν
     solutions_found = 0
-    # Αρχικοποίηση ενός δείκτη για την αποθήκευση του βάθος της καλύτερης λύσης
+    # Η θέση της καλύτερης λύσης στο pool (οι λύσεις είναι ταξινομημένες από την καλύτερη)
     best_sol_idx = 0
 
-    # Δημιουργία ενός tuple, το root_node, το οποίο αντιπροσωπεύει την ρίζα του δέντρου και περιλαμβάνει τους πίνακες άνω και κάτω ορίων των μεταβλητών
-    # και το βάθος του κόμβου
-    root_node = (ub, lb, 0)
+    # Δεδομένα των ευρετικών (συντελεστές αντικειμενικής συνάρτησης, περιορισμών και δεξιά μέλη), πριν την προσθήκη περικοπών στο μοντέλο
+    # Οι ευρετικές υποθέτουν πρόβλημα μεγιστοποίησης με μη αρνητικούς συντελεστές (capital budgeting)
+    use_heuristics = HEURISTICS and isMax
+    if use_heuristics:
+        heuristic_data = heur.problem_data(model)
+
+    # Cut pool με τους περιορισμούς σακιδίου του μοντέλου στις δυαδικές μεταβλητές (πριν την προσθήκη περικοπών στο μοντέλο)
+    cut_pool = None
+    if CUTS:
+        c, A, b = heur.problem_data(model)
+        binary = np.asarray(integer_var, dtype=bool) & (np.asarray(lb) >= 0) & (np.asarray(ub) <= 1)
+        cut_pool = ct.CutPool(A, b, binary, CUT_POOL_SIZE, CUT_MAX_AGE, CUTS_PER_ROUND)
+
+    # Δημιουργία ενός tuple, το root_node, το οποίο αντιπροσωπεύει την ρίζα του δέντρου και περιλαμβάνει τους πίνακες άνω και κάτω ορίων των μεταβλητών,
+    # το βάθος του κόμβου, τις local περικοπές που ισχύουν στο υποδέντρο του και το branching από τον πατέρα για την ενημέρωση των pseudocosts
+    # (μεταβλητή, True για το πάνω παιδί, κλασματικό μέρος της μεταβλητής και τιμή της χαλάρωσης LP του πατέρα, None για την ρίζα)
+    root_node = (ub, lb, 0, (), None)
+
+    # Εισαγωγή των κόμβου ρίζα στην ουρά
+    stack.push(root_node)
+
+    # Μνήμη (σε bytes) ενός ανοιχτού κόμβου κατά προσέγγιση: οι πίνακες άνω και κάτω ορίων του και η εγγραφή του στην ουρά
+    node_memory = 2 * (sys.getsizeof(np.asarray(ub, dtype=float)) + 8 * len(ub)) + sys.getsizeof((None, None))
 
-    # Εισαγωγή των κόμβου ρίζα στην στοίβα
-    stack.append(root_node)
+    # Λόγος τερματισμού λόγω ορίου (None αν η αναζήτηση ολοκληρωθεί)
+    termination = None
 
-    # Όσο η στοίβα δεν είναι άδεια 
+    # Όσο η ουρά δεν είναι άδεια 
     while stack:
+
+        # Ανανέωση του global dual bound με το καλύτερο bound των ανοιχτών κόμβων. Αν ταυτίζεται με την καλύτερη λύση, κανένας ανοιχτός κόμβος
+        # δεν μπορεί να την βελτιώσει και η αναζήτηση τερματίζεται
+        update_global_bound(stack)
+        if abs(lower_bound - upper_bound) < 1e-6:
+            break
+
+        # Έλεγχος των ορίων τερματισμού (χρόνος, κόμβοι, μνήμη των ανοιχτών κόμβων και gap)
+        termination = limits.check(nodes, len(stack) * node_memory, lower_bound if isMax else upper_bound,
+                                   upper_bound if isMax else lower_bound)
+        if termination is not None:
+            if metrics:
+                metrics.emit("limit", reason=termination, node=nodes, lower_bound=lower_bound, upper_bound=upper_bound, gap=current_gap())
+            break
         
-        # Αφαίρεση του τελευταίου κόμβου από την στοίβα και αποθήκευση των στοιχείων του στις αντίστοιχες μεταβλητές
-        ub, lb, depth = stack.pop()
+        # Αφαίρεση του επόμενου κόμβου από την ουρά και αποθήκευση των στοιχείων του στις αντίστοιχες μεταβλητές
+        (ub, lb, depth, local_cuts, branch), parent_obj = stack.pop()
+
+        # Στην περίπτωση που η τιμή της χαλάρωσης LP του πατέρα δεν βελτιώνει την καλύτερη λύση, ο κόμβος απορρίπτεται χωρίς επίλυση
+        if parent_obj is not None and is_pruned(parent_obj, lower_bound if isMax else upper_bound):
+            if metrics:
+                log_node(metrics, inst.DISCARDED, depth, parent_obj)
+            continue
 
         # Αύξηση του αριθμού των κόμβων που έχουν εξερευνηθεί κατά 1
         nodes += 1
@@ -77,12 +279,19 @@ def branch_and_bound(model, ub, lb, integer_var):
         # Ανανέωση των κάτω και άνω ορίων των μεταβλητών του κόμβου
         model.setAttr("LB", model.getVars(), lb)
         model.setAttr("UB", model.getVars(), ub)
+        if cut_pool is not None:
+            cut_pool.activate(model, local_cuts)
+        if metrics:
+            metrics.mark(inst.BOOKKEEPING)
 
         # Ενημέρωση του μοντέλου
         model.optimize()
 
         # Στην περίπτωση που βρεθεί μη εφικτή λύση, εξερεύνησε τον επόμενο κόμβο
         if model.status != GRB.OPTIMAL:
+            if metrics:
+                metrics.mark(inst.LP)
+                log_node(metrics, inst.INFEASIBLE, depth)
             continue
 
         # Αποθήκευση των νέων τιμών των μεταβλητών στον πίνακα x_candidate μετά την επίλυση 
@@ -90,29 +299,91 @@ def branch_and_bound(model, ub, lb, integer_var):
 
         # Αποθήκευση της τιμής της αντικειμενικής συνάρτησης στην μεταβλητή x_obj
         x_obj = model.ObjVal
-        
-        # Στην περίπτωση που βρούμε ακέραια λύση (καλώντας την συνάρτηση is_nearly_integer για κάθε μεταβλητή) προστίθεται η λύση στην λίστα solutions
+
+        # Ενημέρωση των pseudocosts της μεταβλητής branching του κόμβου με την μεταβολή της τιμής της χαλάρωσης LP από τον πατέρα
+        if branch is not None:
+            brancher.update(*branch, x_obj)
+        if metrics:
+            metrics.mark(inst.LP)
+
+        # Στην περίπτωση που βρούμε ακέραια λύση (καλώντας την συνάρτηση is_nearly_integer για κάθε μεταβλητή) προστίθεται η λύση στο pool solutions
         # και αυξάνεται ο μετρητής solution_found κατά 1,
         if all(is_nearly_integer(x_candidate[i]) for i, is_int in enumerate(integer_var) if is_int):
-            solutions.append((x_candidate, x_obj, depth))
+            add_integer_solution(metrics, incumbent_callback, stack, solutions, x_candidate, x_obj, depth, start)
             solutions_found += 1
-            # Στην περίπτωση που το πρόβλημα είναι πρόβλημα μεγιστοποίησης και η τιμή της αντικειμενικής συνάρτησης για την ακέραια λύση είναι 
-            # μεγαλύτερη από την υπάρχουσα τιμή του κάτω ορίου, τότε η τιμή του κάτω ορίου ανανεώνεται
-            if isMax and x_obj > lower_bound:
-                lower_bound = x_obj
-            # Στην περίπτωση που το πρόβλημα είναι πρόβλημα ελαχιστοποίησης και η τιμή της αντικειμενικής συνάρτησης για την ακέραια λύση είναι 
-            # μικρότερη από την υπάρχουσα τιμή του άνω ορίου, τότε η τιμή του άνω ορίου ανανεώνεται
-            elif not isMax and x_obj < upper_bound:
-                upper_bound = x_obj
             # Εξερεύνησε τον επόμενο κόμβο
             continue  
 
-        # Στην περίπτωση που βρούμε μη ακέραια λύση, καλούμε την συνάρτηση select_branching_variable για την επιλογή της μεταβλητής για branching
-        selected_var = select_branching_variable(x_candidate, integer_var)
+        # Εκτέλεση των ευρετικών στην ρίζα και κάθε HEURISTIC_FREQUENCY κόμβους, στην λύση της χαλάρωσης LP του κόμβου
+        if use_heuristics and (nodes == 1 or nodes % HEURISTIC_FREQUENCY == 0):
+            if metrics:
+                metrics.mark(inst.BOOKKEEPING)
+            c, A, b = heuristic_data
+            if nodes == 1:
+                results = heur.root_heuristics(c, A, b, np.asarray(x_candidate, dtype=float))
+            else:
+                results = heur.node_heuristics(c, A, b, np.asarray(x_candidate, dtype=float))
+            best = heur.best_result(results)
+            if best is not None and best[1] > lower_bound:
+                name, h_obj, h_x = best
+                lower_bound = h_obj
+                solutions.add(h_x, h_obj, depth, time.perf_counter() - start, name)
+                solutions_found += 1
+                stack.on_incumbent(h_obj)
+                record_incumbent(metrics, incumbent_callback, name, h_obj, h_x)
+            if metrics:
+                metrics.mark(inst.HEURISTICS)
+            # Στην περίπτωση που η τιμή της χαλάρωσης LP του κόμβου δεν βελτιώνει την νέα καλύτερη λύση, ο κόμβος απορρίπτεται
+            if is_pruned(node_bound(x_obj), lower_bound):
+                if metrics:
+                    log_node(metrics, inst.PRUNED, depth, x_obj)
+                continue
+
+        # Γύροι διαχωρισμού περικοπών κάλυψης (CUT_ROUNDS_ROOT στην ρίζα, CUT_ROUNDS στους υπόλοιπους κόμβους), μετά τις ευρετικές ώστε να
+        # χρησιμοποιούν την καλύτερη λύση τους. Οι local περικοπές που βρίσκονται κληρονομούνται από τους κόμβους παιδιά
+        if cut_pool is not None:
+            separated = separate_cuts(model, cut_pool, x_candidate, x_obj, lb, ub, integer_var, CUT_ROUNDS_ROOT if nodes == 1 else CUT_ROUNDS,
+                                      lower_bound if isMax else upper_bound)
+            if metrics:
+                metrics.mark(inst.CUTS)
+            if separated is None:
+                if metrics:
+                    log_node(metrics, inst.INFEASIBLE, depth)
+                continue
+            x_candidate, x_obj, new_local_cuts = separated
+            if new_local_cuts:
+                local_cuts = local_cuts + tuple(new_local_cuts)
+
+            # Οι περικοπές μπορεί να οδηγήσουν σε ακέραια λύση ή σε όριο που δεν βελτιώνει την καλύτερη λύση
+            if all(is_nearly_integer(x_candidate[i]) for i, is_int in enumerate(integer_var) if is_int):
+                add_integer_solution(metrics, incumbent_callback, stack, solutions, x_candidate, x_obj, depth, start)
+                solutions_found += 1
+                continue
+            if is_pruned(node_bound(x_obj), lower_bound if isMax else upper_bound):
+                if metrics:
+                    log_node(metrics, inst.PRUNED, depth, x_obj)
+                continue
+
+        # Καταγραφή του κόμβου ως κόμβου branching
+        if metrics:
+            log_node(metrics, inst.BRANCHED, depth, x_obj)
+
+        # Reduced-cost fixing με την τρέχουσα καλύτερη λύση: οι μεταβλητές που σταθεροποιούνται αποκτούν ίσα άνω και κάτω όρια στους κόμβους παιδιά
+        # (και επομένως σε όλο το υποδέντρο του κόμβου)
+        incumbent = lower_bound if isMax else upper_bound
+        if REDUCED_COST_FIXING and np.isfinite(incumbent):
+            rc = model.getAttr("RC", model.getVars())
+            at_lower, at_upper = ps.reduced_cost_fixing(rc, x_candidate, lb, ub, x_obj, incumbent, isMax)
+            if at_lower.any() or at_upper.any():
+                ub = np.where(at_lower, lb, ub)
+                lb = np.where(at_upper, ub, lb)
+                fixed_by_reduced_cost += int(at_lower.sum() + at_upper.sum())
 
-        # Στην περίπτωση που δεν υπάρχει μεταβλητή για branching, γίνεται εξερεύνηση του επόμενου κόμβου
-        if selected_var is None:
-            continue 
+        # Επιλογή της μη ακέραιας μεταβλητής για branching με τον κανόνα branching, μετά την ανάγνωση των reduced costs (το strong branching
+        # επιλύει τις χαλαρώσεις των παιδιών στο μοντέλο)
+        selected_var = brancher.select(model, x_candidate, x_obj, integer_var)
+        strong_branching_lps = brancher.strong_branching_lps
+        fraction = x_candidate[selected_var] - np.floor(x_candidate[selected_var])
 
         # Ανάθεση των πινάκων lb και ub για την δημιουργία άνω ορίων για τον αριστερό κόμβο παιδιού και την δημιουργία κάτω ορίων για τον δεξί κόμβο 
         # παιδιού
@@ -125,48 +396,94 @@ def branch_and_bound(model, ub, lb, integer_var):
         left_ub[selected_var] = np.floor(x_candidate[selected_var])
         right_lb[selected_var] = np.ceil(x_candidate[selected_var])
         
-        # Εισαγωγή των κόμβων παιδιών στην στοίβα, εισάγοντας τους πίνακες άνω και κάτω ορίων των μεταβλητών και το βάθος των κόμβων
-        stack.append((ub, right_lb, depth + 1))
-        stack.append((left_ub, lb, depth + 1))
-
-        # Κλήση της συνάρτησης apply_gomory_cut για την εφαρμογή Gomory Cuts
-        apply_gomory_cut(model, x_candidate, integer_var)
+        # Εισαγωγή των κόμβων παιδιών στην ουρά, εισάγοντας τους πίνακες άνω και κάτω ορίων των μεταβλητών και το βάθος των κόμβων, 
+        # με bound το όριο της χαλάρωσης LP του πατέρα (node_bound)
+        estimate = ns.estimate_node(x_obj, x_candidate, integer_var, obj_coeffs, isMax)
+        stack.push((ub, right_lb, depth + 1, local_cuts, (selected_var, True, fraction, x_obj)), node_bound(x_obj), estimate)
+        stack.push((left_ub, lb, depth + 1, local_cuts, (selected_var, False, fraction, x_obj)), node_bound(x_obj), estimate)
+        if metrics:
+            metrics.mark(inst.BRANCHING)
     
+    update_global_bound(stack)
+    if cut_pool is not None:
+        cut_pool.clear(model)
+    if metrics:
+        metrics.mark(inst.BOOKKEEPING)
+
+    # Αποτέλεσμα της αναζήτησης
+    if termination is None:
+        termination = lim.OPTIMAL if solutions else lim.INFEASIBLE
+    objective, solution = (solutions[best_sol_idx].objective, solutions[best_sol_idx].x()) if solutions else (None, None)
+    result = lim.Result(termination, objective, solution, upper_bound if isMax else lower_bound, current_gap(), nodes,
+                        time.perf_counter() - start)
     return solutions, best_sol_idx, solutions_found
     
 if __name__ == "__main__":
 
     # Ανάγνωση των path όλων των αρχείων προβλημάτων, εντός του φακέλου problems και αποθήκευση τους στην λίστα problems (το κάθε path στην κάθε γραμμή)
-    problems = []
-    for root, dirs, files in os.walk("problems"):
-        for file in files:
-            if file.endswith(".dat"):
-                problems.append(os.path.join(root, file))
+    problems = pr.find_problem_files("problems")
 
     # Βρόχος για επίλυση όλων των αρχείων προβλημάτων, όπου το path τους ανήκει στην λίστα problems
     for prob_file in problems:
 
         print(f"Currently processing problem file: {prob_file}")
     
-        # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου
-        model, ub, lb, integer_var, num_vars, c = pr.capital_budgeting(prob_file)
+        # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου, μετά το presolve αν PRESOLVE = True
+        if PRESOLVE:
+            model, ub, lb, integer_var, num_vars, c, reduction = ps.build_presolved_model(prob_file, LP_ENGINE)
+            print(f"Presolve: {len(reduction.fixed_zero)} projects fixed to 0, {len(reduction.fixed_one)} fixed to 1, {num_vars} free")
+        else:
+            model, ub, lb, integer_var, num_vars, c = pr.build_model(prob_file, LP_ENGINE)
+            reduction = None
+
+        # Πρόβλημα μεγιστοποίησης
+        isMax = True
     
+        # Καταγραφή μετρικών με γραμμή προόδου
+        METRICS = inst.Metrics([inst.ProgressSink()], sample_every=1000)
+
         # Κλήση της συνάρτησης branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound και χρονομέτρηση του χρόνου εκτέλεσης
         print("************************    Running branch and bound with improvements    ************************\n\n")
         start = time.time()
         solutions, best_sol_idx, solutions_found = branch_and_bound(model, ub, lb, integer_var)
         end = time.time()
 
-        # Εκτύπωση των αποτελεσμάτων
-        print(f"Optimal Solution: {solutions[best_sol_idx]}")
+        # Εκτύπωση των αποτελεσμάτων (μετατροπή της λύσης του μειωμένου προβλήματος σε λύση του αρχικού)
+        print(f"Status: {result.status}")
+        if not solutions:
+            METRICS.close()
+            continue
+        if reduction is not None:
+            solutions = solutions.expanded(reduction.expand, reduction.objective)
+        best = solutions[best_sol_idx]
+        print(f"Optimal Solution: selected projects {best.selected().tolist()}, objective {best.objective}, depth {best.depth}")
+        print(f"Solutions found: {solutions_found} ({len(solutions)} kept in the solution pool)")
+        # Εξαγωγή του pool λύσεων σε αρχείο, αντί για εκτύπωση των πλήρων λύσεων
+        if SOLUTION_POOL_FILE is not None:
+            pool_file = f"{prob_file}.solutions.{SOLUTION_POOL_FILE}"
+            solutions.save(pool_file)
+            print(f"Solution pool written to {pool_file}")
+        print(f"Parse time: {pr.parse_time}")
         print(f"Time Elapsed: {end - start}")
         print(f"Total nodes: {nodes}")
+        print(f"Gap: {result.gap:.2%}")
+        print(f"Variables fixed by reduced cost: {fixed_by_reduced_cost}")
+        print(f"Cover cuts added: {cuts_added}")
+        print(f"Branching rule: {BRANCHING} ({strong_branching_lps} strong branching LPs)")
+        for name, obj, node_count in incumbent_log:
+            if reduction is not None:
+                obj = reduction.objective(obj)
+            print(f"Incumbent {obj} found by {name} after {node_count} nodes")
+        summary = METRICS.summary()
+        print("Nodes by outcome: " + ", ".join(f"{outcome} {count}" for outcome, count in summary["outcomes"].items()))
+        print("Time by phase: " + ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in summary["times"].items()))
+        METRICS.close()
 
     """
     print(f"Currently processing problem file: problems\class_1\problem_1.dat")
     
     # Κλήση της συνάρτησης capital_budgeting του αρχείου pr για την δημιουργία του μοντέλου
-    model, ub, lb, integer_var, num_vars, c = pr.capital_budgeting("problems\class_1\problem_1.dat")
+    model, ub, lb, integer_var, num_vars, c = pr.build_model("problems\class_1\problem_1.dat", LP_ENGINE)
     
     # Κλήση της συνάρτησης branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound και χρονομέτρηση του χρόνου εκτέλεσης
     print("************************    Running branch and bound with heuristic    ************************\n\n")
@@ -0,0 +1,455 @@
+import numpy as np
+import time
+import importlib
+import multiprocessing as mp
+import queue
+from collections import deque
+import problems as pr
+import branching as br
+import heuristics as heur
+import presolve as ps
+import limits as lim
+import node_selection as ns
+import os
+
+# Οι συναρτήσεις και η κλάση Node του αλγορίθμου branch and bound (το όνομα του αρχείου ξεκινά με αριθμό, επομένως η εισαγωγή γίνεται με
+# την importlib)
+bb = importlib.import_module("2-branch_and_bound")
+
+# Δήλωση global μεταβλητών
+isMax = None          # True αν πρόκειται για πρόβλημα μεγιστοποίησης, False αν πρόκειται για πρόβλημα ελαχιστοποίησης
+nodes = 0             # αριθμός των κόμβων (όλων των workers)
+result = None         # αποτέλεσμα της τελευταίας αναζήτησης (limits.Result), με τιμές του αρχικού προβλήματος (μαζί με τα έργα του presolve)
+NUM_WORKERS = os.cpu_count() # αριθμός των διεργασιών (workers) που εξερευνούν το δέντρο παράλληλα
+LP_ENGINE = "numpy"   # μηχανή επίλυσης των χαλαρώσεων LP των κόμβων: "gurobi" ή "numpy"
+BRANCHING = "first-fractional" # κανόνας επιλογής της μεταβλητής branching: "first-fractional", "most-fractional", "pseudocost" ή
+                               # "reliability" (branching). Κάθε worker έχει τα δικά του pseudocosts
+PRESOLVE = True       # True για presolve (αφαίρεση έργων που δεν χωράνε και reduced-cost fixing στην ρίζα) στην κύρια διεργασία, πριν τους workers
+HEURISTICS = True     # True για εκτέλεση των ευρετικών στην ρίζα, ώστε οι workers να ξεκινούν με την καλύτερη λύση τους
+REDUCED_COST_FIXING = True # True για reduced-cost fixing σε κάθε κόμβο με την κοινή καλύτερη λύση (ισχύει για όλο το υποδέντρο του κόμβου)
+TIME_LIMIT = None     # όριο χρόνου (σε δευτερόλεπτα), None για κανένα όριο
+NODE_LIMIT = None     # όριο αριθμού κόμβων (όλων των workers, όπως τους δημοσιεύουν), None για κανένα όριο
+ABSOLUTE_GAP = None   # τερματισμός όταν η απόσταση της καλύτερης λύσης από το global dual bound γίνει το πολύ ABSOLUTE_GAP, None για κανένα όριο
+RELATIVE_GAP = None   # τερματισμός όταν το σχετικό gap γίνει το πολύ RELATIVE_GAP (π.χ. 0.001 για 0.1%), None για κανένα όριο
+INITIAL_NODES_PER_WORKER = 2 # αριθμός ανοιχτών κόμβων ανά worker που δημιουργούνται από την ρίζα πριν την εκκίνηση των workers
+BOUND_UPDATE_INTERVAL = 10   # κάθε πόσους κόμβους ο κάθε worker δημοσιεύει το καλύτερο bound των ανοιχτών κόμβων του και τον αριθμό κόμβων του
+POLL_INTERVAL = 0.1          # κάθε πόσα δευτερόλεπτα η κύρια διεργασία ελέγχει το global dual bound και τα όρια τερματισμού
+PROGRESS_INTERVAL = 5.0      # κάθε πόσα δευτερόλεπτα εκτυπώνεται η πρόοδος της αναζήτησης
+
+# Συνάρτηση node_path για την μετατροπή ενός κόμβου στην λίστα αλλαγών ορίων από την ρίζα μέχρι τον κόμβο, ώστε να μπορεί να σταλεί σε
+# άλλη διεργασία. Μαζί με κάθε αλλαγή στέλνονται οι σταθεροποιήσεις του reduced-cost fixing και το κλασματικό μέρος της μεταβλητής branching
+# του κόμβου (για τα pseudocosts)
+def node_path(node):
+
+    path = []
+    while node is not None:
+        path.append((node.branching_var, node.bound_type, node.bound_value, node.fixings, node.fraction))
+        node = node.parent
+    path.reverse()
+    return path
+
+# Συνάρτηση path_node για την δημιουργία ενός κόμβου (και των προγόνων του) από την λίστα αλλαγών ορίων
+def path_node(path):
+
+    node = None
+    for var, bound_type, value, fixings, fraction in path:
+        if node is None:
+            node = bb.Node(None, 0, var, label="root")
+        else:
+            node = bb.Node(node, node.depth + 1, var, bound_type, value)
+        node.fixings = fixings
+        node.fraction = fraction
+    return node
+
+# Συνάρτηση is_better για τον έλεγχο αν η τιμή obj είναι καλύτερη από την τιμή reference
+def is_better(obj, reference, isMax):
+
+    return obj > reference + 1e-6 if isMax else obj < reference - 1e-6
+
+# Συνάρτηση is_integral για τον έλεγχο αν όλες οι ακέραιες μεταβλητές (integer_mask) έχουν ακέραιες τιμές στην λύση x_candidate
+def is_integral(x_candidate, integer_mask):
+
+    return not np.any(integer_mask & (np.abs(x_candidate - np.round(x_candidate)) > br.TOLERANCE))
+
+# Συνάρτηση selected_projects για τις θέσεις των έργων που επιλέγονται στην λύση x_candidate
+def selected_projects(x_candidate, integer_mask):
+
+    return np.flatnonzero(np.round(x_candidate[integer_mask]) == 1).tolist()
+
+# Συνάρτηση solve_node για την επίλυση της χαλάρωσης LP ενός κόμβου, ξεκινώντας από την βάση του κόμβου (την βάση του πατέρα του), εκτός
+# αν ο πατέρας είναι ο τελευταίος κόμβος last_solved που επιλύθηκε στο model, οπότε το μοντέλο έχει ήδη την βάση του
+# Επιστρέφει None αν ο κόμβος είναι μη εφικτός, αλλιώς την τιμή της αντικειμενικής συνάρτησης, τις τιμές των μεταβλητών και τα όρια του κόμβου
+def solve_node(model, node, ub, lb, last_solved=None):
+
+    if node.vbasis is not None:
+        if node.parent is None or node.parent is not last_solved:
+            model.setAttr("VBasis", model.getVars(), node.vbasis)
+            model.setAttr("CBasis", model.getConstrs(), node.cbasis)
+        node.vbasis = node.cbasis = None
+
+    node_ub, node_lb = bb.get_node_bounds(node, ub, lb)
+    model.setAttr("LB", model.getVars(), node_lb)
+    model.setAttr("UB", model.getVars(), node_ub)
+    model.update()
+    model.optimize()
+
+    if model.status != pr.GRB.OPTIMAL:
+        return None
+
+    return model.ObjVal, np.array(model.getAttr("X", model.getVars())), node_ub, node_lb
+
+# Συνάρτηση update_pseudocosts για την ενημέρωση των pseudocosts του brancher με την μεταβολή της τιμής της χαλάρωσης LP του κόμβου node
+# (x_obj) από την τιμή parent_obj του πατέρα του
+def update_pseudocosts(brancher, node, parent_obj, x_obj):
+
+    if node.parent is not None and node.parent.fraction is not None:
+        brancher.update(node.branching_var, node.bound_type == "LB", node.parent.fraction, parent_obj, x_obj)
+
+# Συνάρτηση fix_by_reduced_cost για το reduced-cost fixing στον κόμβο node, με τα reduced costs της λύσης x_candidate (τιμή x_obj) της
+# χαλάρωσης LP του κόμβου και την τιμή incumbent της καλύτερης λύσης. Οι μεταβλητές που σταθεροποιούνται αποθηκεύονται στο node.fixings
+def fix_by_reduced_cost(model, node, x_candidate, x_obj, node_ub, node_lb, incumbent, isMax):
+
+    rc = model.getAttr("RC", model.getVars())
+    at_lower, at_upper = ps.reduced_cost_fixing(rc, x_candidate, node_lb, node_ub, x_obj, incumbent, isMax)
+    fixed_vars = np.flatnonzero(at_lower | at_upper)
+    if len(fixed_vars):
+        node.fixings = (fixed_vars, np.where(at_lower, node_lb, node_ub)[fixed_vars])
+
+# Συνάρτηση branch για την δημιουργία των δύο κόμβων παιδιών ενός κόμβου, στρογγυλοποιώντας προς τα κάτω (αριστερό παιδί) και προς τα
+# πάνω (δεξί παιδί) την τιμή της μεταβλητής που επιλέγει ο brancher. Τα παιδιά μοιράζονται την βάση του κόμβου
+def branch(model, node, x_candidate, x_obj, integer_mask, brancher):
+
+    vbasis, cbasis = bb.read_basis(model, model.getVars(), model.getConstrs())
+    selected_var_idx = brancher.select(model, x_candidate, x_obj, integer_mask, vbasis, cbasis)
+    node.fraction = x_candidate[selected_var_idx] - np.floor(x_candidate[selected_var_idx])
+    left_child = bb.Node(node, node.depth + 1, selected_var_idx, "UB", np.floor(x_candidate[selected_var_idx]), "Left")
+    right_child = bb.Node(node, node.depth + 1, selected_var_idx, "LB", np.ceil(x_candidate[selected_var_idx]), "Right")
+    left_child.vbasis = right_child.vbasis = vbasis
+    left_child.cbasis = right_child.cbasis = cbasis
+    return left_child, right_child
+
+# Συνάρτηση build_local_model για την δημιουργία του τοπικού αντιγράφου του μοντέλου σε κάθε διεργασία από τα δεδομένα data του
+# (μειωμένου από το presolve) προβλήματος, χωρίς εκτυπώσεις του Gurobi
+def build_local_model(data, engine):
+
+    model, ub, lb, integer_var, num_vars, c = pr.build_model_from_arrays(*data, engine=engine)
+    if engine == "gurobi":
+        model.Params.OutputFlag = 0
+    return model, np.array(ub, dtype=float), np.array(lb, dtype=float), np.array(integer_var, dtype=bool)
+
+# Συνάρτηση worker που εκτελείται σε κάθε διεργασία και εξερευνά κατά βάθος τα υποδέντρα που παίρνει από την κοινή ουρά εργασιών
+# Ο worker κλαδεύει με την κοινή καλύτερη λύση (incumbent), και όταν υπάρχουν αδρανείς workers δίνει τους παλαιότερους (μεγαλύτερους)
+# ανοιχτούς κόμβους του στην κοινή ουρά, ώστε να τους πάρουν (work stealing)
+# Το bound των κόμβων της κοινής ουράς (queued_bound) και των workers (worker_bounds) ενημερώνεται με το lock μαζί με τους μετρητές, ώστε
+# κάθε ανοιχτός κόμβος να μετράει πάντα σε ένα από τα δύο και το global dual bound της κύριας διεργασίας να είναι έγκυρο
+def worker(worker_id, data, engine, isMax, branching, reduced_cost_fixing, work_queue, result_queue, incumbent, worker_bounds, worker_nodes,
+           queued_bound, busy, queued, stop, num_workers, lock):
+
+    model, ub, lb, integer_mask = build_local_model(data, engine)
+    brancher = br.Brancher(branching, len(ub), isMax)
+    sense = 1 if isMax else -1
+
+    local_nodes = 0
+    last_solved = None
+    stack = deque()
+    working = False
+
+    while not stop.value:
+
+        # Στην περίπτωση που δεν υπάρχουν τοπικοί κόμβοι, ο worker γίνεται αδρανής και περιμένει κόμβο από την κοινή ουρά. Η αναζήτηση
+        # τελειώνει όταν κανένας worker δεν εργάζεται και η κοινή ουρά είναι άδεια
+        if not stack:
+            if working:
+                with lock:
+                    busy.value -= 1
+                    worker_bounds[worker_id] = -sense * np.inf
+                working = False
+            try:
+                path, parent_obj = work_queue.get(timeout=0.01)
+            except queue.Empty:
+                with lock:
+                    if busy.value == 0 and queued.value == 0:
+                        break
+                continue
+            with lock:
+                queued.value -= 1
+                busy.value += 1
+                worker_bounds[worker_id] = parent_obj
+                if queued.value == 0:
+                    queued_bound.value = -sense * np.inf
+            working = True
+            stack.append((path_node(path), parent_obj))
+
+        current_node, parent_obj = stack.pop()
+
+        # Κλάδεμα του κόμβου αν το bound του πατέρα δεν βελτιώνει την κοινή καλύτερη λύση
+        if not is_better(parent_obj, incumbent.value, isMax):
+            continue
+
+        local_nodes += 1
+        solved = solve_node(model, current_node, ub, lb, last_solved)
+        last_solved = current_node
+
+        # Στην περίπτωση που βρεθεί μη εφικτή λύση, εξερεύνησε τον επόμενο κόμβο
+        if solved is None:
+            continue
+
+        x_obj, x_candidate, node_ub, node_lb = solved
+        update_pseudocosts(brancher, current_node, parent_obj, x_obj)
+
+        # Στην περίπτωση που βρεθεί ακέραια λύση, ανανεώνεται η κοινή καλύτερη λύση (αν τη βελτιώνει) και στέλνεται στην κύρια διεργασία
+        if is_integral(x_candidate, integer_mask):
+            with lock:
+                if is_better(x_obj, incumbent.value, isMax):
+                    incumbent.value = x_obj
+                    result_queue.put(("incumbent", x_obj, selected_projects(x_candidate, integer_mask), current_node.depth))
+            continue
+
+        # Κλάδεμα του κόμβου αν η τιμή της χαλάρωσης LP δεν βελτιώνει την κοινή καλύτερη λύση
+        current_incumbent = incumbent.value
+        if not is_better(x_obj, current_incumbent, isMax):
+            continue
+
+        # Reduced-cost fixing με την κοινή καλύτερη λύση, πριν την επιλογή της μεταβλητής branching (που μπορεί να επιλύσει παιδιά στο model)
+        if reduced_cost_fixing and np.isfinite(current_incumbent):
+            fix_by_reduced_cost(model, current_node, x_candidate, x_obj, node_ub, node_lb, current_incumbent, isMax)
+
+        left_child, right_child = branch(model, current_node, x_candidate, x_obj, integer_mask, brancher)
+        stack.append((right_child, x_obj))
+        stack.append((left_child, x_obj))
+
+        # Στην περίπτωση που υπάρχουν αδρανείς workers χωρίς κόμβους στην κοινή ουρά, δίνεται ο παλαιότερος ανοιχτός κόμβος
+        # Ο έλεγχος και η ενημέρωση των μετρητών γίνονται με το lock, ώστε δύο workers να μην δώσουν κόμβο για τον ίδιο αδρανή worker
+        given = None
+        if len(stack) > 1:
+            with lock:
+                if num_workers - busy.value > queued.value:
+                    given = stack.popleft()
+                    queued.value += 1
+                    queued_bound.value = sense * max(sense * queued_bound.value, sense * given[1])
+        if given is not None:
+            work_queue.put((node_path(given[0]), given[1]))
+
+        # Περιοδική δημοσίευση του καλύτερου bound των ανοιχτών κόμβων του worker και του αριθμού των κόμβων του
+        if local_nodes % BOUND_UPDATE_INTERVAL == 0:
+            worker_bounds[worker_id] = sense * max(sense * bound for _, bound in stack)
+            worker_nodes[worker_id] = local_nodes
+
+    # Όταν η αναζήτηση διακόπτεται, οι κόμβοι που έδωσε ο worker και δεν πάρθηκαν δεν χρειάζεται να σταλούν πριν τον τερματισμό του
+    if stop.value:
+        work_queue.cancel_join_thread()
+    worker_nodes[worker_id] = local_nodes
+    result_queue.put(("done", worker_id, local_nodes))
+
+# Συνάρτηση initial_frontier για την εξερεύνηση των πρώτων επιπέδων του δέντρου (κατά πλάτος) στην κύρια διεργασία, μέχρι να υπάρχουν
+# αρκετοί ανοιχτοί κόμβοι για όλους τους workers. Στην ρίζα εκτελούνται οι ευρετικές (αν HEURISTICS = True), ώστε οι workers να ξεκινούν
+# με την καλύτερη λύση τους και να κλαδεύουν από τον πρώτο κόμβο
+def initial_frontier(data, engine, isMax, size, branching, reduced_cost_fixing):
+
+    model, ub, lb, integer_mask = build_local_model(data, engine)
+    brancher = br.Brancher(branching, len(ub), isMax)
+    incumbent = -np.inf if isMax else np.inf
+    best_solution = None
+    explored = 0
+
+    frontier = deque([(bb.Node(None, 0, -1, label="root"), np.inf if isMax else -np.inf)])
+    while frontier and len(frontier) < size:
+        current_node, parent_obj = frontier.popleft()
+        if not is_better(parent_obj, incumbent, isMax):
+            continue
+        explored += 1
+        solved = solve_node(model, current_node, ub, lb)
+        if solved is None:
+            continue
+        x_obj, x_candidate, node_ub, node_lb = solved
+        update_pseudocosts(brancher, current_node, parent_obj, x_obj)
+        if is_integral(x_candidate, integer_mask):
+            if is_better(x_obj, incumbent, isMax):
+                incumbent = x_obj
+                best_solution = [selected_projects(x_candidate, integer_mask), x_obj, current_node.depth]
+            continue
+
+        # Εκτέλεση των ευρετικών στην λύση της χαλάρωσης LP της ρίζας
+        if HEURISTICS and current_node.parent is None:
+            best = bb.run_heuristics(heur.problem_data(model), x_candidate, at_root=True)
+            if best is not None and is_better(best[1], incumbent, isMax):
+                name, h_obj, h_x = best
+                incumbent = h_obj
+                best_solution = [selected_projects(np.asarray(h_x, dtype=float), integer_mask), h_obj, 0]
+
+        if not is_better(x_obj, incumbent, isMax):
+            continue
+        if reduced_cost_fixing and np.isfinite(incumbent):
+            fix_by_reduced_cost(model, current_node, x_candidate, x_obj, node_ub, node_lb, incumbent, isMax)
+        left_child, right_child = branch(model, current_node, x_candidate, x_obj, integer_mask, brancher)
+        frontier.append((left_child, x_obj))
+        frontier.append((right_child, x_obj))
+
+    frontier = [(node_path(node), bound) for node, bound in frontier if is_better(bound, incumbent, isMax)]
+    return frontier, incumbent, best_solution, explored
+
+# Συνάρτηση original_solution για την μετατροπή μιας λύσης του μειωμένου προβλήματος (επιλεγμένα έργα selected, τιμή obj και βάθος depth)
+# σε λύση του αρχικού προβλήματος, με τα έργα και την απόδοση των έργων που σταθεροποιήθηκαν στο 1 από το presolve reduction (αν έγινε)
+def original_solution(selected, obj, depth, reduction):
+
+    if reduction is None:
+        return [selected, obj, depth]
+    selected = sorted(reduction.free[selected].tolist() + reduction.fixed_one.tolist())
+    return [selected, reduction.objective(obj), depth]
+
+# Συνάρτηση global_bound για το global dual bound της αναζήτησης: το καλύτερο από τα bounds των workers, το bound των κόμβων της κοινής
+# ουράς και την καλύτερη λύση (με την οποία ταυτίζεται όταν δεν υπάρχουν ανοιχτοί κόμβοι). Διαβάζεται με το lock, ώστε ένας κόμβος που
+# μεταφέρεται από την κοινή ουρά σε έναν worker να μετράει σε ένα από τα δύο
+def global_bound(incumbent, worker_bounds, queued_bound, isMax, lock):
+
+    with lock:
+        bounds = list(worker_bounds) + [queued_bound.value, incumbent.value]
+    return max(bounds) if isMax else min(bounds)
+
+# Συνάρτηση parallel_branch_and_bound που υλοποιεί τον αλγόριθμο branch and bound παράλληλα σε num_workers διεργασίες
+# Το presolve, η εξερεύνηση των πρώτων επιπέδων και οι ευρετικές της ρίζας γίνονται μία φορά στην κύρια διεργασία, και οι workers παίρνουν
+# τα δεδομένα του μειωμένου προβλήματος. Η κύρια διεργασία παρακολουθεί το global dual bound, και η αναζήτηση τερματίζεται μόλις το bound
+# αποδείξει ότι καμία λύση δεν βελτιώνει την καλύτερη, ή νωρίτερα όταν εξαντληθεί ένα από τα όρια limits (αντικείμενο limits.Limits, από
+# προεπιλογή με τα όρια TIME_LIMIT, NODE_LIMIT, ABSOLUTE_GAP και RELATIVE_GAP). Η μεταβλητή branching κάθε κόμβου επιλέγεται με τον κανόνα
+# branching (από προεπιλογή BRANCHING). Το αποτέλεσμα της αναζήτησης αποθηκεύεται στην global μεταβλητή result
+# Επιστρέφει τις λύσεις που βρέθηκαν (ως λίστες επιλεγμένων έργων, τιμή αντικειμενικής συνάρτησης και βάθος), την θέση της καλύτερης λύσης
+# και τον αριθμό των λύσεων
+def parallel_branch_and_bound(prob_file, num_workers=None, engine=None, branching=None, limits=None):
+
+    global nodes, result
+    nodes = 0
+
+    if num_workers is None:
+        num_workers = NUM_WORKERS
+    if engine is None:
+        engine = LP_ENGINE
+    if branching is None:
+        branching = BRANCHING
+    if limits is None:
+        limits = lim.Limits(TIME_LIMIT, NODE_LIMIT, None, ABSOLUTE_GAP, RELATIVE_GAP)
+    else:
+        limits.start()
+    sense = 1 if isMax else -1
+    start = time.perf_counter()
+
+    solutions = list()
+    solutions_found = 0
+    best_sol_idx = 0
+
+    # Presolve στην κύρια διεργασία: οι λύσεις των workers αφορούν τα ελεύθερα έργα και μετατρέπονται σε λύσεις του αρχικού προβλήματος
+    data = pr.read_data_capital_budgeting(prob_file)
+    reduction = None
+    if PRESOLVE:
+        data, reduction = ps.presolve_capital_budgeting(*data)
+    offset = reduction.offset if reduction is not None else 0.0
+
+    # Εξερεύνηση των πρώτων επιπέδων του δέντρου στην κύρια διεργασία
+    frontier, start_incumbent, best_solution, explored = initial_frontier(data, engine, isMax, INITIAL_NODES_PER_WORKER * num_workers,
+                                                                          branching, REDUCED_COST_FIXING)
+    nodes += explored
+    if best_solution is not None:
+        solutions.append(original_solution(*best_solution, reduction))
+        solutions_found += 1
+
+    # Κοινή μνήμη: η καλύτερη λύση (incumbent), το καλύτερο bound των ανοιχτών κόμβων και ο αριθμός των κόμβων κάθε worker, το bound των
+    # κόμβων της κοινής ουράς, οι μετρητές των workers που εργάζονται και των κόμβων της κοινής ουράς, και η σημαία διακοπής της αναζήτησης
+    lock = mp.Lock()
+    incumbent = mp.Value("d", start_incumbent, lock=False)
+    worker_bounds = mp.Array("d", [-sense * np.inf] * num_workers, lock=False)
+    worker_nodes = mp.Array("i", [0] * num_workers, lock=False)
+    queued_bound = mp.Value("d", sense * max([sense * bound for _, bound in frontier], default=-np.inf), lock=False)
+    busy = mp.Value("i", 0, lock=False)
+    queued = mp.Value("i", len(frontier), lock=False)
+    stop = mp.Value("b", 0, lock=False)
+    work_queue = mp.Queue()
+    result_queue = mp.Queue()
+
+    for item in frontier:
+        work_queue.put(item)
+
+    workers = [mp.Process(target=worker, args=(i, data, engine, isMax, branching, REDUCED_COST_FIXING, work_queue, result_queue, incumbent,
+                                              worker_bounds, worker_nodes, queued_bound, busy, queued, stop, num_workers, lock))
+               for i in range(num_workers)]
+    for p in workers:
+        p.start()
+
+    # Συλλογή των αποτελεσμάτων των workers, μέχρι να τελειώσουν όλοι, με έλεγχο του global dual bound και των ορίων τερματισμού και
+    # περιοδική εκτύπωση της προόδου
+    status = None
+    finished = 0
+    worker_total = 0
+    last_progress = time.time()
+    while finished < num_workers:
+        try:
+            message = result_queue.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            message = None
+
+        if message is not None and message[0] == "incumbent":
+            _, x_obj, selected, depth = message
+            solutions.append(original_solution(selected, x_obj, depth, reduction))
+            solutions_found += 1
+            if solutions_found == 1 or is_better(solutions[-1][1], solutions[best_sol_idx][1], isMax):
+                best_sol_idx = solutions_found - 1
+        elif message is not None and message[0] == "done":
+            finished += 1
+            worker_total += message[2]
+
+        bound = global_bound(incumbent, worker_bounds, queued_bound, isMax, lock)
+        if not stop.value:
+            # Τερματισμός όταν το global dual bound δεν αφήνει περιθώριο βελτίωσης ή εξαντληθεί ένα από τα όρια
+            status = limits.check(nodes + sum(worker_nodes), 0, incumbent.value + offset, bound + offset)
+            if status is not None or not is_better(bound, incumbent.value, isMax):
+                stop.value = 1
+
+        if time.time() - last_progress >= PROGRESS_INTERVAL:
+            gap = ns.relative_gap(incumbent.value + offset, bound + offset)
+            print(f"Incumbent: {incumbent.value + offset}  Bound: {bound + offset}  Gap: {gap:.4%}  Busy workers: {busy.value}  "
+                  f"Queued nodes: {queued.value}")
+            last_progress = time.time()
+
+    for p in workers:
+        p.join()
+    nodes += worker_total
+
+    # Αποτέλεσμα της αναζήτησης: όταν δεν εξαντλήθηκε κάποιο όριο, η καλύτερη λύση είναι βέλτιστη και το bound ταυτίζεται με αυτήν
+    if status is None:
+        status = lim.OPTIMAL if solutions else lim.INFEASIBLE
+        bound = incumbent.value
+    objective = solutions[best_sol_idx][1] if solutions else None
+    solution = None
+    if solutions:
+        solution = np.zeros(reduction.num_projects if reduction is not None else data[0])
+        solution[solutions[best_sol_idx][0]] = 1
+    result = lim.Result(status, objective, solution, bound + offset, ns.relative_gap(incumbent.value + offset, bound + offset), nodes,
+                        time.perf_counter() - start)
+
+    return solutions, best_sol_idx, solutions_found
+
+if __name__ == "__main__":
+
+    # Ανάγνωση των path όλων των αρχείων προβλημάτων, εντός του φακέλου problems και αποθήκευση τους στην λίστα problems (το κάθε path στην κάθε γραμμή)
+    problems = pr.find_problem_files("problems")
+
+    # Πρόβλημα μεγιστοποίησης
+    isMax = True
+
+    # Βρόχος για επίλυση όλων των αρχείων προβλημάτων, όπου το path τους ανήκει στην λίστα problems
+    for prob_file in problems:
+
+        print(f"Currently processing problem file: {prob_file}")
+
+        # Κλήση της συνάρτησης parallel_branch_and_bound και χρονομέτρηση του χρόνου εκτέλεσης
+        print(f"************************    Running parallel branch and bound with {NUM_WORKERS} workers    ************************\n\n")
+        start = time.time()
+        solutions, best_sol_idx, solutions_found = parallel_branch_and_bound(prob_file)
+        end = time.time()
+
+        # Εκτύπωση των αποτελεσμάτων
+        print(f"Selected projects: {solutions[best_sol_idx][0]}")
+        print(f"Objective Value: {solutions[best_sol_idx][1]}")
+        print(f"Tree depth: {solutions[best_sol_idx][2]}")
+        print(f"Status: {result.status}  Bound: {result.bound}  Gap: {result.gap:.4%}")
+        print(f"Parse time: {pr.parse_time}")
+        print(f"Time Elapsed: {end - start}")
+        print(f"Total nodes: {nodes}")
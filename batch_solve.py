@@ -0,0 +1,272 @@
+import argparse
+import csv
+import importlib
+import multiprocessing as mp
+import multiprocessing.connection
+import os
+import time
+
+import numpy as np
+
+import branching as br
+import dynamic_programming as dp
+import limits as lim
+import node_selection as ns
+import problems as pr
+import presolve as ps
+
+# Στήλες του αρχείου αποτελεσμάτων (μία γραμμή για κάθε αρχείο προβλήματος)
+RESULT_FIELDS = ["problem", "engine", "status", "objective", "nodes", "bound", "gap", "parse_time", "wall_time"]
+
+# Όρια για την επιλογή του δυναμικού προγραμματισμού από τον αλγόριθμο "auto": μέγιστος εκτιμώμενος αριθμός ενημερώσεων καταστάσεων
+# (περίπου 10^9 ανά δευτερόλεπτο, δηλαδή λίγα δευτερόλεπτα) και μέγιστη μνήμη σε MB
+DP_MAX_UPDATES = 2e9
+DP_MAX_MEMORY = 512
+
+# Ο αλγόριθμος που χρησιμοποιεί ο "auto" όταν ο δυναμικός προγραμματισμός δεν συμφέρει ή δεν αποδεικνύει την βελτιστότητα της λύσης του
+AUTO_FALLBACK = "branch_and_bound"
+
+# Κανόνας επιλογής της μεταβλητής branching των αλγορίθμων branch and bound ("first-fractional", "most-fractional", "pseudocost" ή
+# "reliability"), None για τον προεπιλεγμένο κανόνα κάθε αλγορίθμου
+BRANCHING = None
+
+# Χρονική στιγμή (time.time()) μέχρι την οποία πρέπει να ολοκληρωθεί η επίλυση του τρέχοντος αρχείου προβλήματος, None για κανένα όριο
+# Οι αλγόριθμοι branch and bound και Pyomo τερματίζουν τότε με την καλύτερη λύση που βρήκαν
+DEADLINE = None
+
+# Χρόνος αναμονής (σε δευτερόλεπτα) μετά το χρονικό όριο, πριν τον τερματισμό μιας διεργασίας που δεν τερμάτισε μόνη της (π.χ. του
+# δυναμικού προγραμματισμού, που δεν έχει χρονικό όριο)
+KILL_GRACE = 5.0
+
+# Συνάρτηση remaining_time για τον χρόνο (σε δευτερόλεπτα) που απομένει μέχρι το DEADLINE, None αν δεν υπάρχει χρονικό όριο
+def remaining_time():
+
+    if DEADLINE is None:
+        return None
+    return max(0.0, DEADLINE - time.time())
+
+# Συνάρτηση engine_result για τα στοιχεία που επιστρέφουν οι αλγόριθμοι (κατάσταση, τιμή της καλύτερης λύσης, κόμβοι, dual bound και σχετικό
+# gap) από το αποτέλεσμα result (limits.Result) ενός αλγορίθμου, με την σταθερή απόδοση offset των έργων που σταθεροποιήθηκαν από το presolve
+# Το bound και το gap είναι None όταν δεν είναι γνωστά
+def engine_result(result, offset=0.0):
+
+    objective = None if result.objective is None else result.objective + offset
+    bound = None if result.bound is None or not np.isfinite(result.bound) else result.bound + offset
+    gap = ns.relative_gap(objective, bound)
+    return result.status, objective, result.nodes, bound, gap if np.isfinite(gap) else None
+
+# Συνάρτηση optimal_result για τα στοιχεία που επιστρέφουν οι αλγόριθμοι που δεν δίνουν dual bound: μόνο μια βέλτιστη λύση έχει γνωστό
+# bound (την τιμή της) και μηδενικό gap
+def optimal_result(status, objective, nodes):
+
+    if status == lim.OPTIMAL:
+        return status, objective, nodes, objective, 0.0
+    return status, objective, nodes, None, None
+
+# Συνάρτηση solve_pyomo για την επίλυση ενός αρχείου προβλήματος με το μοντέλο Pyomo του 1-pyomo.py και τον gurobi solver
+def solve_pyomo(prob_file):
+
+    import pyomo.environ as pyomo
+    pm = importlib.import_module("1-pyomo")
+
+    instance = pm.model.create_instance(prob_file)
+    options = {} if DEADLINE is None else {"TimeLimit": remaining_time()}
+
+    # Η λύση φορτώνεται μόνο αν ο solver βρήκε λύση, ώστε η εξάντληση του χρονικού ορίου να δίνει την καλύτερη λύση (ή καμία) αντί για σφάλμα
+    results = pyomo.SolverFactory('gurobi').solve(instance, options=options, load_solutions=False)
+    objective = None
+    if len(results.solution) > 0:
+        instance.solutions.load_from(results)
+        objective = pyomo.value(instance.obj)
+    return optimal_result(pm.termination_status(results), objective, None)
+
+# Συνάρτηση solve_pyomo_fast για την επίλυση ενός αρχείου προβλήματος με την γρήγορη λειτουργία του 1-pyomo.py (ConcreteModel από τους
+# πίνακες NumPy και persistent solver)
+def solve_pyomo_fast(prob_file):
+
+    pm = importlib.import_module("1-pyomo")
+    status, objective, selected = pm.PersistentPyomo().solve(prob_file, remaining_time())
+    return optimal_result(status, objective, None)
+
+# Συνάρτηση build_model για την δημιουργία του μοντέλου για τον αλγόριθμο bb, μετά το presolve αν bb.PRESOLVE = True
+# Επιστρέφει τα ίδια στοιχεία με την problems.build_model και την σταθερή απόδοση των έργων που σταθεροποιήθηκαν στο 1 από το presolve
+def build_model(bb, prob_file):
+
+    if bb.PRESOLVE:
+        model, ub, lb, integer_var, num_vars, c, reduction = ps.build_presolved_model(prob_file, bb.LP_ENGINE)
+        return model, ub, lb, integer_var, num_vars, c, reduction.offset
+    return pr.build_model(prob_file, bb.LP_ENGINE) + (0.0,)
+
+# Συνάρτηση solve_branch_and_bound για την επίλυση ενός αρχείου προβλήματος με τον αλγόριθμο branch and bound του 2-branch_and_bound.py
+def solve_branch_and_bound(prob_file):
+
+    bb = importlib.import_module("2-branch_and_bound")
+    bb.isMax = True
+
+    model, ub, lb, integer_var, num_vars, c, offset = build_model(bb, prob_file)
+    if DEADLINE is not None:
+        bb.TIME_LIMIT = remaining_time()
+    bb.branch_and_bound(model, ub, lb, integer_var, branching=BRANCHING)
+    return engine_result(bb.result, offset)
+
+# Συνάρτηση solve_branch_and_bound_with_improvements για την επίλυση ενός αρχείου προβλήματος με τον αλγόριθμο του
+# 3-branch_and_bound_with_improvements.py
+def solve_branch_and_bound_with_improvements(prob_file):
+
+    bb = importlib.import_module("3-branch_and_bound_with_improvements")
+    bb.isMax = True
+
+    model, ub, lb, integer_var, num_vars, c, offset = build_model(bb, prob_file)
+    if DEADLINE is not None:
+        bb.TIME_LIMIT = remaining_time()
+    bb.branch_and_bound(model, ub, lb, integer_var, branching=BRANCHING)
+    return engine_result(bb.result, offset)
+
+# Συνάρτηση solve_parallel_branch_and_bound για την επίλυση ενός αρχείου προβλήματος με τον παράλληλο αλγόριθμο του
+# 4-parallel_branch_and_bound.py
+def solve_parallel_branch_and_bound(prob_file):
+
+    pbb = importlib.import_module("4-parallel_branch_and_bound")
+    pbb.isMax = True
+
+    if DEADLINE is not None:
+        pbb.TIME_LIMIT = remaining_time()
+    pbb.parallel_branch_and_bound(prob_file, branching=BRANCHING)
+    return engine_result(pbb.result)
+
+# Συνάρτηση solve_dynamic_programming για την επίλυση ενός αρχείου προβλήματος με τον δυναμικό προγραμματισμό του dynamic_programming.py
+# (ο αριθμός κόμβων είναι ο αριθμός των επιλύσεων του δυναμικού προγραμματισμού)
+def solve_dynamic_programming(prob_file):
+
+    return engine_result(dp.dynamic_programming(*pr.read_data_capital_budgeting(prob_file)))
+
+# Συνάρτηση select_engine για την επιλογή του αλγορίθμου για ένα πρόβλημα με δεδομένα data (όπως τα επιστρέφει η
+# read_data_capital_budgeting): ο δυναμικός προγραμματισμός επιλέγεται μόνο όταν η Lagrangian χαλάρωση του είναι ακριβής (μία επίλυση
+# αποδεικνύει την βελτιστότητα) και ο πίνακας καταστάσεών του είναι αρκετά μικρός (DP_MAX_UPDATES ενημερώσεις και DP_MAX_MEMORY MB), αλλιώς
+# ο AUTO_FALLBACK. Όταν υπάρχει duality gap, το branch and bound του δυναμικού προγραμματισμού που το κλείνει χρειάζεται εκατοντάδες
+# επιλύσεις και είναι πολύ πιο αργό από το branch and bound με χαλάρωση LP
+def select_engine(data):
+
+    states, updates, memory, exact = dp.estimate(*data)
+    if exact and updates <= DP_MAX_UPDATES and memory <= DP_MAX_MEMORY * 2**20:
+        return "dynamic_programming"
+    return AUTO_FALLBACK
+
+# Συνάρτηση solve_auto για την επίλυση ενός αρχείου προβλήματος με τον αλγόριθμο της select_engine. Αν ο δυναμικός προγραμματισμός δεν
+# αποδείξει την βελτιστότητα της λύσης του (εξάντληση των κόμβων του), το πρόβλημα λύνεται με τον AUTO_FALLBACK
+def solve_auto(prob_file):
+
+    data = pr.read_data_capital_budgeting(prob_file)
+    if select_engine(data) == "dynamic_programming":
+        result = dp.dynamic_programming(*data)
+        if result.status == lim.OPTIMAL:
+            return engine_result(result)
+    return ENGINES[AUTO_FALLBACK](prob_file)
+
+# Οι διαθέσιμοι αλγόριθμοι επίλυσης, που επιστρέφουν την κατάσταση τερματισμού, την τιμή της καλύτερης λύσης, τον αριθμό των κόμβων, το
+# dual bound και το σχετικό gap (None όταν δεν είναι γνωστά)
+ENGINES = {
+    "pyomo": solve_pyomo,
+    "pyomo_fast": solve_pyomo_fast,
+    "branch_and_bound": solve_branch_and_bound,
+    "branch_and_bound_with_improvements": solve_branch_and_bound_with_improvements,
+    "parallel_branch_and_bound": solve_parallel_branch_and_bound,
+    "dynamic_programming": solve_dynamic_programming,
+    "auto": solve_auto,
+}
+
+# Συνάρτηση run_job που εκτελείται σε ξεχωριστή διεργασία για την επίλυση ενός αρχείου προβλήματος, με χρονικό όριο time_limit δευτερόλεπτα
+# Η έξοδος της διεργασίας (εκτυπώσεις των αλγορίθμων και του solver) απορρίπτεται και το αποτέλεσμα στέλνεται στο δικό της pipe connection
+def run_job(engine, prob_file, connection, cache=False, branching=None, time_limit=None):
+
+    global BRANCHING, DEADLINE
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+
+    pr.DATA_CACHE = cache
+    BRANCHING = branching
+    pr.parse_time = None
+
+    start = time.time()
+    DEADLINE = None if time_limit is None else start + time_limit
+    try:
+        status, objective, nodes, bound, gap = ENGINES[engine](prob_file)
+    except Exception as e:
+        status, objective, nodes, bound, gap = f"error: {type(e).__name__}: {e}", None, None, None, None
+    connection.send((prob_file, engine, status, objective, nodes, bound, gap, pr.parse_time, time.time() - start))
+    connection.close()
+
+# Συνάρτηση solve_batch για την επίλυση όλων των αρχείων προβλημάτων σε num_workers ταυτόχρονες διεργασίες, με χρονικό όριο time_limit
+# δευτερόλεπτα ανά αρχείο και κανόνα branching branching. Τα αποτελέσματα γράφονται στο αρχείο CSV output με την σειρά που ολοκληρώνονται
+# Το χρονικό όριο εφαρμόζεται από τους αλγορίθμους, και μια διεργασία τερματίζεται μόνο αν δεν ολοκληρωθεί KILL_GRACE δευτερόλεπτα αργότερα
+def solve_batch(problems, engine="branch_and_bound", num_workers=None, time_limit=None, output="results.csv", cache=False, branching=None):
+
+    if num_workers is None:
+        num_workers = os.cpu_count()
+
+    pending = list(problems)
+    running = {}
+    results = []
+
+    with open(output, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_FIELDS)
+
+        # Συνάρτηση record για την εγγραφή και εκτύπωση ενός αποτελέσματος
+        def record(row):
+            writer.writerow(row)
+            f.flush()
+            results.append(dict(zip(RESULT_FIELDS, row)))
+            print(", ".join(str(value) for value in row))
+
+        while pending or running:
+
+            # Εκκίνηση νέων διεργασιών, όσο υπάρχουν ελεύθεροι workers. Κάθε διεργασία στέλνει το αποτέλεσμα της σε δικό της pipe, ώστε ο
+            # τερματισμός μιας διεργασίας να μην επηρεάζει τα αποτελέσματα των υπολοίπων
+            while pending and len(running) < num_workers:
+                prob_file = pending.pop(0)
+                receiver, sender = mp.Pipe(duplex=False)
+                process = mp.Process(target=run_job, args=(engine, prob_file, sender, cache, branching, time_limit))
+                process.start()
+                sender.close()
+                running[prob_file] = (process, receiver, time.time())
+
+            # Συλλογή των αποτελεσμάτων που ολοκληρώθηκαν, και τερματισμός των διεργασιών που τερμάτισαν με σφάλμα (το pipe κλείνει χωρίς
+            # αποτέλεσμα) ή που δεν τερμάτισαν KILL_GRACE δευτερόλεπτα μετά το χρονικό όριο
+            ready = mp.connection.wait([receiver for process, receiver, start in running.values()], timeout=0.1)
+            for prob_file, (process, receiver, start) in list(running.items()):
+                elapsed = time.time() - start
+                if receiver in ready:
+                    try:
+                        row = receiver.recv()
+                    except EOFError:
+                        process.join()
+                        row = (prob_file, engine, f"crashed (exit code {process.exitcode})", None, None, None, None, None, elapsed)
+                elif time_limit is not None and elapsed > time_limit + KILL_GRACE:
+                    process.terminate()
+                    row = (prob_file, engine, lim.TIME_LIMIT, None, None, None, None, None, elapsed)
+                else:
+                    continue
+                process.join()
+                receiver.close()
+                del running[prob_file]
+                record(row)
+
+    return results
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Solve all problem files of a folder concurrently")
+    parser.add_argument("folder", nargs="?", default="problems")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="branch_and_bound")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--time-limit", type=float, default=None, help="time limit per problem file in seconds, after which the engines return their best solution")
+    parser.add_argument("--output", default="results.csv")
+    parser.add_argument("--cache", action="store_true", help="cache the parsed problem files as .npz sidecars")
+    parser.add_argument("--branching", choices=br.RULES, default=None, help="branching rule of the branch and bound engines")
+    args = parser.parse_args()
+
+    start = time.time()
+    results = solve_batch(pr.find_problem_files(args.folder), args.engine, args.workers, args.time_limit, args.output, args.cache,
+                          args.branching)
+    print(f"Solved {len(results)} problems in {time.time() - start:.2f} seconds, results written to {args.output}")
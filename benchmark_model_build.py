@@ -0,0 +1,65 @@
+import argparse
+import time
+
+import numpy as np
+import gurobipy as gp
+from gurobipy import GRB
+
+import problems as pr
+
+# Συνάρτηση capital_budgeting_quicksum που δημιουργεί το μοντέλο με τον αρχικό τρόπο (addVars και gp.quicksum ανά έργο, με την μεταβλητή z),
+# για σύγκριση με την problems.capital_budgeting_from_arrays (χωρίς την εκτύπωση model.display(), ώστε να συγκρίνεται μόνο η δημιουργία)
+def capital_budgeting_quicksum(N, F, S, P, performance, cost, staff):
+
+    num_vars = N + 1
+    model = gp.Model()
+    ub = [1 if i < num_vars-1 else np.inf for i in range(num_vars) ]
+    lb = [0 for i in range(num_vars) ]
+    x = model.addVars(num_vars, lb=lb, ub=ub, vtype=GRB.CONTINUOUS, name="x")
+    model.addConstr(gp.quicksum(cost[i] * x[i] for i in range(N)) <= F)
+    model.addConstr(gp.quicksum(staff[i] * x[i] for i in range(N)) <= S)
+    model.addConstr(gp.quicksum(x[i] for i in range(N)) <= P)
+    c = [performance[i] for i in range(num_vars - 1)] + [0]
+    model.setObjective(gp.quicksum(performance[i] * x[i] for i in range(N)))
+    model.ModelSense = GRB.MAXIMIZE
+    model.Params.method = 1
+    model.update()
+    integer_var = [True if i < num_vars-1 else False for i in range(num_vars)]
+    return model, ub, lb, integer_var, num_vars, c
+
+# Συνάρτηση random_instance για την δημιουργία τυχαίων δεδομένων N έργων (με τις κατανομές του random_generator)
+def random_instance(N, seed=0):
+
+    rng = np.random.default_rng(seed)
+    F = int(rng.integers(1, 100001))
+    S = int(rng.integers(1, 1001))
+    P = int(rng.integers(1, N + 1))
+    performance = rng.integers(1, 101, N)
+    cost = rng.integers(1, F + 1, N)
+    staff = rng.integers(1, S + 1, N)
+    return N, F, S, P, performance, cost, staff
+
+# Συνάρτηση time_build για την μέτρηση του καλύτερου χρόνου δημιουργίας του μοντέλου σε repeats επαναλήψεις
+def time_build(builder, data, repeats):
+
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model = builder(*data)[0]
+        best = min(best, time.perf_counter() - start)
+        model.dispose()
+    return best
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Compare model build times of the quicksum and matrix API constructions")
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 2000, 5000, 9000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'N':>8} {'quicksum (s)':>14} {'matrix API (s)':>16} {'speedup':>9}")
+    for N in args.sizes:
+        data = random_instance(N)
+        quicksum_time = time_build(capital_budgeting_quicksum, data, args.repeats)
+        matrix_time = time_build(pr.capital_budgeting_from_arrays, data, args.repeats)
+        print(f"{N:>8} {quicksum_time:>14.5f} {matrix_time:>16.5f} {quicksum_time / matrix_time:>8.1f}x")
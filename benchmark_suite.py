@@ -0,0 +1,196 @@
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import queue
+import sys
+import time
+
+import numpy as np
+
+import batch_solve as bs
+import branching as br
+import random_generator as rg
+
+# Το resource (peak RSS) υπάρχει μόνο σε συστήματα Unix, σε Windows η μνήμη δεν καταγράφεται
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Μεγέθη (αριθμός έργων N) των οικογενειών προβλημάτων
+SIZES = [50, 200, 1000, 5000, 9000]
+
+# Οικογένειες προβλημάτων: για κάθε οικογένεια, το ποσοστό του συνολικού κόστους, του συνολικού προσωπικού και του αριθμού των έργων που
+# είναι διαθέσιμο (F, S και P αντίστοιχα). Μικρότερο ποσοστό σημαίνει πιο "σφιχτό" περιορισμό
+FAMILIES = {
+    "loose": (0.5, 0.5, 0.5),
+    "budget": (0.1, 0.5, 0.5),
+    "staff": (0.5, 0.1, 0.5),
+    "count": (0.5, 0.5, 0.05),
+    "tight": (0.1, 0.1, 0.1),
+}
+
+# Οι αλγόριθμοι που συγκρίνονται από προεπιλογή (όλοι οι αλγόριθμοι του batch_solve.ENGINES μπορούν να επιλεγούν με το --engines)
+DEFAULT_ENGINES = ["pyomo", "branch_and_bound", "branch_and_bound_with_improvements"]
+
+# Οι αλγόριθμοι που εκτελούνται μία φορά για κάθε κανόνα branching του --branching (οι υπόλοιποι εκτελούνται μία φορά)
+BRANCHING_ENGINES = {"branch_and_bound", "branch_and_bound_with_improvements", "parallel_branch_and_bound", "auto"}
+
+# Ανοχές για τον έλεγχο παλινδρόμησης (regression) ως προς το baseline: σχετική αύξηση του χρόνου και των κόμβων, και ελάχιστη απόλυτη
+# αύξηση του χρόνου (σε δευτερόλεπτα, ο χρόνος περιλαμβάνει και την εκκίνηση της διεργασίας) ώστε οι πολύ σύντομες εκτελέσεις να μην
+# δίνουν ψευδείς παλινδρομήσεις
+TIME_TOLERANCE = 0.25
+NODE_TOLERANCE = 0.10
+MIN_TIME_DIFFERENCE = 0.25
+
+# Συνάρτηση generate_instance για την δημιουργία των δεδομένων ενός προβλήματος N έργων της οικογένειας family, από τον σπόρο seed
+def generate_instance(N, family, seed):
+
+    budget_ratio, staff_ratio, count_ratio = FAMILIES[family]
+    rng = np.random.default_rng(seed)
+    performance = rng.integers(1, 101, N)
+    cost = rng.integers(1, 1001, N)
+    staff = rng.integers(1, 101, N)
+    F = max(1, int(budget_ratio * cost.sum()))
+    S = max(1, int(staff_ratio * staff.sum()))
+    P = max(1, int(count_ratio * N))
+    return N, F, S, P, performance, cost, staff
+
+# Συνάρτηση build_suite για την δημιουργία (μόνο αν δεν υπάρχουν ήδη) των αρχείων προβλημάτων του benchmark στον φάκελο folder
+# Επιστρέφει λίστα από (όνομα προβλήματος, path, οικογένεια, N, σπόρος)
+def build_suite(folder, sizes=SIZES, families=FAMILIES, seeds=(0,)):
+
+    os.makedirs(folder, exist_ok=True)
+    instances = []
+    for family in families:
+        for N in sizes:
+            for seed in seeds:
+                name = f"{family}_n{N}_s{seed}"
+                filename = os.path.join(folder, name + ".dat")
+                if not os.path.exists(filename):
+                    rg.write_data_file(filename, *generate_instance(N, family, seed))
+                instances.append((name, filename, family, N, seed))
+    return instances
+
+# Συνάρτηση peak_rss για την μέγιστη μνήμη (σε MB) της διεργασίας και των διεργασιών παιδιών της, None αν δεν είναι διαθέσιμη
+def peak_rss():
+
+    if resource is None:
+        return None
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Το ru_maxrss δίνεται σε bytes στο macOS και σε KB στα υπόλοιπα συστήματα
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+# Συνάρτηση run_benchmark που εκτελείται σε ξεχωριστή διεργασία για την επίλυση ενός προβλήματος με τον αλγόριθμο engine, τον κανόνα
+# branching branching (None για τον προεπιλεγμένο) και χρονικό όριο time_limit δευτερόλεπτα, μετά το οποίο ο αλγόριθμος επιστρέφει την
+# καλύτερη λύση του και το gap. Η έξοδος της διεργασίας απορρίπτεται και το αποτέλεσμα στέλνεται στην ουρά result_queue
+def run_benchmark(engine, prob_file, result_queue, branching=None, time_limit=None):
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    bs.BRANCHING = branching
+
+    start = time.perf_counter()
+    bs.DEADLINE = None if time_limit is None else time.time() + time_limit
+    try:
+        status, objective, nodes, bound, gap = bs.ENGINES[engine](prob_file)
+    except Exception as e:
+        status, objective, nodes, bound, gap = f"error: {type(e).__name__}: {e}", None, None, None, None
+    result_queue.put((status, objective, nodes, bound, gap, time.perf_counter() - start, peak_rss()))
+
+# Συνάρτηση run_suite για την επίλυση όλων των προβλημάτων instances με κάθε αλγόριθμο engines (και κάθε κανόνα branching branchings για
+# τους αλγορίθμους branch and bound), ένα κάθε φορά (ώστε οι χρόνοι να μην επηρεάζονται από άλλες εκτελέσεις), με χρονικό όριο time_limit
+# δευτερόλεπτα ανά επίλυση. Η διεργασία τερματίζεται μόνο αν δεν ολοκληρωθεί batch_solve.KILL_GRACE δευτερόλεπτα μετά το χρονικό όριο
+def run_suite(instances, engines=DEFAULT_ENGINES, time_limit=60.0, branchings=(None,)):
+
+    results = []
+    runs = [(engine, branching) for engine in engines for branching in (branchings if engine in BRANCHING_ENGINES else (None,))]
+    for name, prob_file, family, N, seed in instances:
+        for engine, branching in runs:
+            result_queue = mp.Queue()
+            process = mp.Process(target=run_benchmark, args=(engine, prob_file, result_queue, branching, time_limit))
+            start = time.perf_counter()
+            process.start()
+            try:
+                status, objective, nodes, bound, gap, wall_time, rss = result_queue.get(timeout=None if time_limit is None else time_limit + bs.KILL_GRACE)
+            except queue.Empty:
+                status, objective, nodes, bound, gap, wall_time, rss = "time_limit", None, None, None, None, time.perf_counter() - start, None
+                process.terminate()
+            process.join()
+            if status != "time_limit" and process.exitcode not in (None, 0):
+                status = f"crashed (exit code {process.exitcode})"
+
+            # Το bound και το gap είναι αυτά που αποδείχθηκαν από τον αλγόριθμο (για μια εκτέλεση που σταμάτησε στο χρονικό όριο, το gap της
+            # καλύτερης λύσης που βρέθηκε), None για τους αλγορίθμους που δεν τα δίνουν
+            result = {"instance": name, "family": family, "N": N, "seed": seed, "engine": engine, "branching": branching, "status": status,
+                      "objective": objective, "bound": bound, "gap": gap, "nodes": nodes, "wall_time": round(wall_time, 6),
+                      "nodes_per_second": round(nodes / wall_time, 3) if nodes is not None and wall_time > 0 else None,
+                      "peak_rss_mb": round(rss, 3) if rss is not None else None}
+            results.append(result)
+            print(f"{name:>20} {engine:>36} {str(branching or ''):>16} {status:>12} {str(objective):>10} {str(nodes):>8} {wall_time:>9.3f}s")
+    return results
+
+# Συνάρτηση compare_with_baseline για τον έλεγχο παλινδρόμησης των αποτελεσμάτων results ως προς τα αποτελέσματα baseline (ίδιο πρόβλημα,
+# αλγόριθμος και κανόνας branching): αλλαγή της κατάστασης ή της τιμής της βέλτιστης λύσης και αύξηση του χρόνου ή των κόμβων πέρα από τις ανοχές
+# Επιστρέφει λίστα με μια περιγραφή για κάθε παλινδρόμηση
+def compare_with_baseline(results, baseline, time_tolerance=TIME_TOLERANCE, node_tolerance=NODE_TOLERANCE,
+                          min_time_difference=MIN_TIME_DIFFERENCE):
+
+    previous = {(result["instance"], result["engine"], result.get("branching")): result for result in baseline}
+    regressions = []
+    for result in results:
+        key = (result["instance"], result["engine"], result.get("branching"))
+        if key not in previous:
+            continue
+        base = previous[key]
+        label = f"{result['instance']} ({result['engine']}{', ' + result['branching'] if result.get('branching') else ''})"
+
+        if base["status"] == "optimal" and result["status"] != "optimal":
+            regressions.append(f"{label}: status {base['status']} -> {result['status']}")
+            continue
+        if result["status"] != "optimal" or base["status"] != "optimal":
+            continue
+        if abs(result["objective"] - base["objective"]) > 1e-6:
+            regressions.append(f"{label}: objective {base['objective']} -> {result['objective']}")
+        if (result["wall_time"] > base["wall_time"] * (1 + time_tolerance)
+                and result["wall_time"] - base["wall_time"] > min_time_difference):
+            regressions.append(f"{label}: wall time {base['wall_time']:.3f}s -> {result['wall_time']:.3f}s")
+        if base["nodes"] is not None and result["nodes"] is not None and result["nodes"] > base["nodes"] * (1 + node_tolerance):
+            regressions.append(f"{label}: nodes {base['nodes']} -> {result['nodes']}")
+    return regressions
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark the solvers on seeded problem families and check for regressions")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--families", nargs="+", choices=sorted(FAMILIES), default=list(FAMILIES))
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--engines", nargs="+", choices=sorted(bs.ENGINES), default=DEFAULT_ENGINES)
+    parser.add_argument("--time-limit", type=float, default=60.0, help="time limit per solve in seconds")
+    parser.add_argument("--branching", nargs="+", choices=br.RULES, default=[None],
+                        help="branching rules to compare on the branch and bound engines (default: each engine's own rule)")
+    parser.add_argument("--folder", default=os.path.join("benchmarks", "instances"))
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None, help="JSON results of a previous run to check for regressions")
+    parser.add_argument("--save-baseline", default=None, help="also write the results to this baseline file")
+    args = parser.parse_args()
+
+    instances = build_suite(args.folder, args.sizes, args.families, args.seeds)
+    results = run_suite(instances, args.engines, args.time_limit, args.branching)
+
+    report = {"python": platform.python_version(), "platform": platform.platform(), "time_limit": args.time_limit,
+              "results": results}
+    for filename in filter(None, (args.output, args.save_baseline)):
+        with open(filename, "w") as f:
+            json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(results, json.load(f)["results"])
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        print(f"{len(regressions)} regressions against {args.baseline}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,191 @@
+import numpy as np
+
+import lp_relaxation as lp
+
+# Διαθέσιμοι κανόνες επιλογής της μεταβλητής branching
+RULES = ("first-fractional", "most-fractional", "pseudocost", "reliability")
+
+# Ανοχή για τον έλεγχο ακεραιότητας των τιμών των μεταβλητών
+TOLERANCE = 1e-6
+
+# Ελάχιστο κέρδος ανά κατεύθυνση στο score (γινόμενο των κερδών των δύο παιδιών), ώστε ένα παιδί χωρίς μεταβολή της τιμής να μην μηδενίζει
+# το score της μεταβλητής
+MIN_GAIN = 1e-6
+
+# Reliability branching: τα pseudocosts μιας μεταβλητής θεωρούνται αξιόπιστα όταν έχουν υπολογιστεί από τουλάχιστον RELIABILITY παρατηρήσεις
+# σε κάθε κατεύθυνση. Για τις μη αξιόπιστες μεταβλητές γίνεται strong branching σε έως STRONG_CANDIDATES μεταβλητές ανά κόμβο, με έως
+# STRONG_ITERATIONS επαναλήψεις simplex ανά παιδί, και διακόπτεται όταν LOOKAHEAD διαδοχικές μεταβλητές δεν βελτιώσουν το καλύτερο score
+RELIABILITY = 1
+STRONG_CANDIDATES = 10
+STRONG_ITERATIONS = 20
+LOOKAHEAD = 4
+
+# Κλάση Pseudocosts με τα στατιστικά pseudocost κάθε μεταβλητής: το άθροισμα και τον αριθμό των παρατηρήσεων της μεταβολής της τιμής της
+# χαλάρωσης LP ανά μονάδα μεταβολής της μεταβλητής, για το κάτω (γραμμή 0) και το πάνω (γραμμή 1) παιδί. Τα συνολικά αθροίσματα κάθε
+# κατεύθυνσης δίνουν τον μέσο όρο που χρησιμοποιείται για τις μεταβλητές χωρίς παρατηρήσεις
+class Pseudocosts:
+
+    def __init__(self, num_vars):
+        self.sums = np.zeros((2, num_vars))
+        self.counts = np.zeros((2, num_vars), dtype=np.int64)
+        self.total_sums = np.zeros(2)
+        self.total_counts = np.zeros(2, dtype=np.int64)
+
+    # Συνάρτηση update για την καταγραφή μιας παρατήρησης: μεταβολή gain της τιμής της χαλάρωσης LP στο πάνω (up = True) ή κάτω παιδί της
+    # μεταβλητής var, όταν η μεταβλητή μετακινείται κατά distance
+    def update(self, var, up, gain, distance):
+
+        if distance <= TOLERANCE or not np.isfinite(gain):
+            return
+        unit_gain = max(gain, 0.0) / distance
+        direction = int(up)
+        self.sums[direction, var] += unit_gain
+        self.counts[direction, var] += 1
+        self.total_sums[direction] += unit_gain
+        self.total_counts[direction] += 1
+
+    # Συνάρτηση values για τα pseudocosts (κάτω, πάνω) των μεταβλητών candidates. Οι μεταβλητές χωρίς παρατηρήσεις παίρνουν τον μέσο όρο των
+    # παρατηρήσεων της κατεύθυνσης (ή 1 αν δεν υπάρχουν, οπότε ο κανόνας ταυτίζεται με την επιλογή της πιο κλασματικής μεταβλητής)
+    def values(self, candidates):
+
+        values = []
+        for direction in (0, 1):
+            counts = self.counts[direction, candidates]
+            total = self.total_counts[direction]
+            average = self.total_sums[direction] / total if total else 1.0
+            values.append(np.where(counts > 0, self.sums[direction, candidates] / np.maximum(counts, 1), average))
+        return values
+
+    # Συνάρτηση reliable για τον έλεγχο ποιες από τις μεταβλητές candidates έχουν τουλάχιστον reliability παρατηρήσεις σε κάθε κατεύθυνση
+    def reliable(self, candidates, reliability):
+        return np.minimum(self.counts[0, candidates], self.counts[1, candidates]) >= reliability
+
+# Συνάρτηση product_score για το score των μεταβλητών από τα (εκτιμώμενα) κέρδη του κάτω και του πάνω παιδιού τους
+def product_score(down_gains, up_gains):
+
+    return np.maximum(down_gains, MIN_GAIN) * np.maximum(up_gains, MIN_GAIN)
+
+# Κλάση Brancher που επιλέγει την μεταβλητή branching ενός κόμβου με τον κανόνα rule:
+#   "first-fractional": η πρώτη μη ακέραια μεταβλητή
+#   "most-fractional":  η μεταβλητή με το κλασματικό μέρος πιο κοντά στο 0.5
+#   "pseudocost":       η μεταβλητή με το μεγαλύτερο score από τα pseudocosts, που ενημερώνονται από τις επιλύσεις των κόμβων παιδιών
+#   "reliability":      όπως ο "pseudocost", με strong branching για τις μεταβλητές με μη αξιόπιστα pseudocosts
+# Οι αλγόριθμοι branch and bound καλούν την update για κάθε κόμβο παιδί που επιλύεται, ώστε τα pseudocosts να ενημερώνονται για όλους τους
+# κανόνες (και να μπορούν να αποθηκευτούν με την κατάσταση της αναζήτησης)
+class Brancher:
+
+    def __init__(self, rule, num_vars, isMax=True, reliability=RELIABILITY, max_candidates=STRONG_CANDIDATES,
+                 iteration_limit=STRONG_ITERATIONS, lookahead=LOOKAHEAD):
+
+        if rule not in RULES:
+            raise ValueError(f"Unknown branching rule: {rule}")
+        self.rule = rule
+        self.isMax = isMax
+        self.pseudocosts = Pseudocosts(num_vars)
+        self.reliability = reliability
+        self.max_candidates = max_candidates
+        self.iteration_limit = iteration_limit
+        self.lookahead = lookahead
+        self.strong_branching_lps = 0
+
+    # Συνάρτηση gain για την μεταβολή (μη αρνητική για έγκυρα όρια) από την τιμή parent_obj της χαλάρωσης LP του πατέρα στην τιμή child_obj
+    # του παιδιού
+    def gain(self, parent_obj, child_obj):
+        return parent_obj - child_obj if self.isMax else child_obj - parent_obj
+
+    # Συνάρτηση update για την ενημέρωση των pseudocosts από την επίλυση του πάνω (up = True) ή κάτω παιδιού της μεταβλητής var, όταν το
+    # κλασματικό μέρος της μεταβλητής στην λύση του πατέρα (τιμή parent_obj) είναι fraction και η τιμή του παιδιού child_obj
+    def update(self, var, up, fraction, parent_obj, child_obj):
+        self.pseudocosts.update(var, up, self.gain(parent_obj, child_obj), 1 - fraction if up else fraction)
+
+    # Συνάρτηση select για την επιλογή της μεταβλητής branching στην λύση x_candidate (τιμή x_obj) της χαλάρωσης LP του κόμβου
+    # Το μοντέλο model πρέπει να έχει τα όρια του κόμβου. Ο κανόνας "reliability" επιλύει τις χαλαρώσεις LP παιδιών στο model, ξεκινώντας από
+    # την βάση (vbasis, cbasis) του κόμβου αν έχει αποθηκευτεί (αλλιώς από την βάση της προηγούμενης επίλυσης), και επαναφέρει τα όρια του
+    # κόμβου και την βάση του, αν δόθηκε, αλλά όχι την λύση του (τιμές, reduced costs), που πρέπει να έχει διαβαστεί πριν την κλήση
+    # Επιστρέφει την θέση της μεταβλητής ή None αν η λύση είναι ακέραια
+    def select(self, model, x_candidate, x_obj, integer_var, vbasis=None, cbasis=None):
+
+        x = np.asarray(x_candidate, dtype=float)
+        candidates = np.flatnonzero(np.asarray(integer_var, dtype=bool) & (np.abs(x - np.round(x)) > TOLERANCE))
+        if len(candidates) == 0:
+            return None
+        if self.rule == "first-fractional":
+            return int(candidates[0])
+
+        fractions = x[candidates] - np.floor(x[candidates])
+        if self.rule == "most-fractional":
+            return int(candidates[np.argmax(np.minimum(fractions, 1 - fractions))])
+
+        down, up = self.pseudocosts.values(candidates)
+        down_gains = down * fractions
+        up_gains = up * (1 - fractions)
+        if self.rule == "pseudocost":
+            return int(candidates[np.argmax(product_score(down_gains, up_gains))])
+        return self.reliability_branching(model, x, x_obj, candidates, fractions, down_gains, up_gains, vbasis, cbasis)
+
+    # Συνάρτηση reliability_branching για την επιλογή μεταβλητής με reliability branching: οι μεταβλητές με αξιόπιστα pseudocosts
+    # αξιολογούνται με το pseudocost score, ενώ για τις υπόλοιπες (με σειρά pseudocost score) γίνεται strong branching με όριο επαναλήψεων.
+    # Τα κέρδη του strong branching ενημερώνουν και τα pseudocosts
+    def reliability_branching(self, model, x, x_obj, candidates, fractions, down_gains, up_gains, vbasis, cbasis):
+
+        scores = product_score(down_gains, up_gains)
+        unreliable = ~self.pseudocosts.reliable(candidates, self.reliability)
+        if not unreliable.any():
+            return int(candidates[np.argmax(scores)])
+
+        best = None if unreliable.all() else int(np.argmax(np.where(unreliable, -np.inf, scores)))
+        best_score = -np.inf if best is None else scores[best]
+        order = [i for i in np.argsort(-scores, kind="stable") if unreliable[i]][:self.max_candidates]
+
+        variables = model.getVars()
+        iteration_limit = model.Params.IterationLimit
+        model.Params.IterationLimit = self.iteration_limit
+
+        no_improvement = 0
+        for i in order:
+            var = int(candidates[i])
+            down_obj = self.solve_child(model, variables[var], "UB", np.floor(x[var]), vbasis, cbasis)
+            up_obj = self.solve_child(model, variables[var], "LB", np.ceil(x[var]), vbasis, cbasis)
+
+            # Τα παιδιά που δεν επιλύθηκαν εντός του ορίου επαναλήψεων διατηρούν το εκτιμώμενο κέρδος τους
+            if down_obj is not None:
+                down_gains[i] = self.gain(x_obj, down_obj)
+                self.update(var, False, fractions[i], x_obj, down_obj)
+            if up_obj is not None:
+                up_gains[i] = self.gain(x_obj, up_obj)
+                self.update(var, True, fractions[i], x_obj, up_obj)
+
+            score = product_score(down_gains[i], up_gains[i])
+            if score > best_score:
+                best, best_score = i, score
+                no_improvement = 0
+            else:
+                no_improvement += 1
+                if no_improvement >= self.lookahead:
+                    break
+
+        model.Params.IterationLimit = iteration_limit
+        if vbasis is not None:
+            model.setAttr("VBasis", variables, vbasis)
+            model.setAttr("CBasis", model.getConstrs(), cbasis)
+        return int(candidates[best])
+
+    # Συνάρτηση solve_child για την επίλυση της χαλάρωσης LP ενός παιδιού με το όριο bound ("UB" ή "LB") της μεταβλητής var ίσο με value,
+    # ξεκινώντας από την βάση (vbasis, cbasis) του κόμβου, αν έχει δοθεί. Το όριο επαναφέρεται μετά την επίλυση
+    # Επιστρέφει την τιμή της χαλάρωσης, - άπειρο (άπειρο για ελαχιστοποίηση) αν το παιδί είναι μη εφικτό, ή None αν η επίλυση δεν ολοκληρώθηκε
+    def solve_child(self, model, var, bound, value, vbasis, cbasis):
+
+        original = model.getAttr(bound, [var])[0]
+        model.setAttr(bound, [var], [value])
+        if vbasis is not None:
+            model.setAttr("VBasis", model.getVars(), vbasis)
+            model.setAttr("CBasis", model.getConstrs(), cbasis)
+        model.optimize()
+        self.strong_branching_lps += 1
+        status = model.status
+        obj = model.ObjVal if status == lp.OPTIMAL else None
+        model.setAttr(bound, [var], [original])
+
+        if status == lp.INFEASIBLE:
+            return -np.inf if self.isMax else np.inf
+        return obj
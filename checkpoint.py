@@ -0,0 +1,91 @@
+import io
+import os
+import pickle
+
+import numpy as np
+
+# Έκδοση της μορφής των αρχείων checkpoint
+VERSION = 1
+
+# Κλάση NodePickler που αντικαθιστά κατά την αποθήκευση κάθε κόμβο του πίνακα κόμβων με την θέση του στον πίνακα (persistent id), ώστε
+# οι κόμβοι να μην αποθηκεύονται αναδρομικά μέσω των αναφορών στον πατέρα τους
+class NodePickler(pickle.Pickler):
+
+    def __init__(self, file, node_ids):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.node_ids = node_ids
+
+    def persistent_id(self, obj):
+        return self.node_ids.get(id(obj))
+
+# Κλάση NodeUnpickler που αντικαθιστά κατά την ανάγνωση τις θέσεις του πίνακα κόμβων με τους κόμβους που ανακατασκευάστηκαν
+class NodeUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, nodes):
+        super().__init__(file)
+        self.nodes = nodes
+
+    def persistent_load(self, pid):
+        return self.nodes[pid]
+
+# Συνάρτηση node_table για την συμπαγή αναπαράσταση των ανοιχτών κόμβων open_nodes και των προγόνων τους ως πίνακα: ένας πίνακας NumPy με
+# την θέση του πατέρα κάθε κόμβου (-1 για την ρίζα) και μία στήλη για κάθε άλλο πεδίο (__slots__) των κόμβων
+# Επιστρέφει τον πίνακα και ένα λεξικό από το id κάθε κόμβου στην θέση του
+def node_table(open_nodes, node_class):
+
+    nodes = []
+    node_ids = {}
+    for node in open_nodes:
+        while node is not None and id(node) not in node_ids:
+            node_ids[id(node)] = len(nodes)
+            nodes.append(node)
+            node = node.parent
+
+    fields = [field for field in node_class.__slots__ if field != "parent"]
+    table = {field: [getattr(node, field) for node in nodes] for field in fields}
+    table["parent"] = np.array([-1 if node.parent is None else node_ids[id(node.parent)] for node in nodes], dtype=np.int64)
+    return table, node_ids
+
+# Συνάρτηση restore_nodes για την ανακατασκευή των κόμβων (αντικείμενα node_class) από τον πίνακα κόμβων
+def restore_nodes(table, node_class):
+
+    nodes = [node_class.__new__(node_class) for _ in range(len(table["parent"]))]
+    # Τα πεδία που δεν υπάρχουν στον πίνακα (checkpoint προηγούμενης έκδοσης των κόμβων) παίρνουν την τιμή None
+    for field in node_class.__slots__:
+        if field not in table:
+            for node in nodes:
+                setattr(node, field, None)
+    for field, values in table.items():
+        if field == "parent":
+            values = [None if parent < 0 else nodes[parent] for parent in values]
+        for node, value in zip(nodes, values):
+            setattr(node, field, value)
+    return nodes
+
+# Συνάρτηση save_checkpoint για την αποθήκευση της κατάστασης state της αναζήτησης (λεξικό με την ουρά των ανοιχτών κόμβων, την καλύτερη
+# λύση, τα όρια και τους μετρητές) στο αρχείο filename. Οι ανοιχτοί κόμβοι open_nodes και οι πρόγονοί τους (αντικείμενα node_class)
+# αποθηκεύονται ως πίνακας, και οι αναφορές σε αυτούς μέσα στο state ως θέσεις του πίνακα
+# Η εγγραφή είναι ατομική: γίνεται σε προσωρινό αρχείο, το οποίο αντικαθιστά το filename μόνο αφού γραφτεί ολόκληρο στον δίσκο
+def save_checkpoint(filename, state, open_nodes, node_class):
+
+    table, node_ids = node_table(open_nodes, node_class)
+    buffer = io.BytesIO()
+    NodePickler(buffer, node_ids).dump(state)
+
+    tmp_file = filename + ".tmp"
+    with open(tmp_file, "wb") as f:
+        pickle.dump({"version": VERSION, "nodes": table, "state": buffer.getvalue()}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, filename)
+
+# Συνάρτηση load_checkpoint για την ανάγνωση της κατάστασης της αναζήτησης από το αρχείο filename
+def load_checkpoint(filename, node_class):
+
+    with open(filename, "rb") as f:
+        checkpoint = pickle.load(f)
+    if checkpoint.get("version") != VERSION:
+        raise ValueError(f"{filename}: unsupported checkpoint version {checkpoint.get('version')}")
+
+    nodes = restore_nodes(checkpoint["nodes"], node_class)
+    return NodeUnpickler(io.BytesIO(checkpoint["state"]), nodes).load()
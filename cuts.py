@@ -0,0 +1,223 @@
+import numpy as np
+
+import lp_relaxation as lp
+
+# Το gurobipy χρειάζεται μόνο για την προσθήκη περικοπών σε μοντέλο του Gurobi
+try:
+    import gurobipy as gp
+except ImportError:
+    gp = None
+
+# Ανοχή για τις συγκρίσεις των τιμών των μεταβλητών και των περιορισμών
+TOLERANCE = 1e-6
+
+# Ελάχιστη παραβίαση (κανονικοποιημένη με το μέτρο των συντελεστών) για να προστεθεί μια περικοπή στο μοντέλο
+MIN_EFFICACY = 1e-4
+
+# Κλάση Cut που αντιπροσωπεύει μια περικοπή sum(coeffs * x[indices]) <= rhs: local = True αν ισχύει μόνο στο υποδέντρο του κόμβου όπου
+# βρέθηκε (εξαρτάται από τις σταθεροποιήσεις μεταβλητών του κόμβου), age ο αριθμός των διαδοχικών επιλύσεων στις οποίες δεν ήταν ενεργή
+# και constr ο περιορισμός του μοντέλου (None αν η περικοπή δεν είναι στο μοντέλο)
+class Cut:
+    __slots__ = ("indices", "coeffs", "rhs", "norm", "local", "age", "constr")
+
+    def __init__(self, indices, coeffs, rhs, local=False):
+        self.indices = indices
+        self.coeffs = coeffs
+        self.rhs = rhs
+        self.norm = float(np.linalg.norm(coeffs))
+        self.local = local
+        self.age = 0
+        self.constr = None
+
+    # Κλειδί της περικοπής για τον εντοπισμό διπλότυπων
+    def key(self):
+        return (self.indices.tobytes(), self.coeffs.tobytes(), self.rhs)
+
+    # Συνάρτηση violation για τον υπολογισμό της παραβίασης της περικοπής από την λύση x (θετική αν παραβιάζεται)
+    def violation(self, x):
+        return float(self.coeffs @ x[self.indices]) - self.rhs
+
+    # Συνάρτηση efficacy για τον υπολογισμό της παραβίασης κανονικοποιημένης με το μέτρο των συντελεστών (απόσταση της x από την περικοπή)
+    def efficacy(self, x):
+        return self.violation(x) / self.norm
+
+# Συνάρτηση knapsack_rows για την επιλογή των γραμμών του πίνακα A (περιορισμοί <=) που είναι περιορισμοί σακιδίου στις δυαδικές
+# μεταβλητές binary: μη αρνητικοί συντελεστές και όχι όλοι ίσοι, αφού τότε οι περικοπές κάλυψης ταυτίζονται με τον ίδιο τον περιορισμό
+# (π.χ. ο περιορισμός του αριθμού των έργων)
+def knapsack_rows(A, b, binary):
+
+    rows = []
+    for a, rhs in zip(A, b):
+        a = np.where(binary, a, 0.0)
+        positive = a[a > 0]
+        if np.all(a >= 0) and len(positive) and positive.min() < positive.max():
+            rows.append((a, float(rhs)))
+    return rows
+
+# Συνάρτηση lifted_cover για τον διαχωρισμό μιας lifted cover περικοπής του περιορισμού σακιδίου a*x <= capacity για την λύση x, μόνο στις
+# μεταβλητές free. Η κάλυψη (cover) C επιλέγεται άπληστα από τις μεταβλητές με θετική τιμή, με αύξουσα σειρά του (1 - x_j) / a_j, και
+# γίνεται ελάχιστη. Οι υπόλοιπες μεταβλητές παίρνουν συντελεστή h όταν mu_h <= a_j < mu_(h+1), όπου mu_h το άθροισμα των h μεγαλύτερων
+# συντελεστών της κάλυψης (lifting του Balas). Επιστρέφει (δείκτες, συντελεστές, δεξί μέλος) ή None αν δεν υπάρχει κάλυψη
+def lifted_cover(a, capacity, x, free):
+
+    support = np.flatnonzero(free & (x > TOLERANCE) & (a > 0))
+    order = support[np.argsort((1 - x[support]) / a[support], kind="stable")]
+    k = int(np.searchsorted(np.cumsum(a[order]), capacity + TOLERANCE, side="right"))
+    if k >= len(order):
+        return None
+    cover = order[:k + 1]
+
+    # Ελάχιστη κάλυψη: αφαίρεση των μεταβλητών με την μεγαλύτερη τιμή 1 - x_j, όσο το άθροισμα ξεπερνά την χωρητικότητα
+    excess = float(a[cover].sum()) - capacity
+    keep = np.ones(len(cover), dtype=bool)
+    for i in np.argsort(x[cover], kind="stable"):
+        if excess - a[cover[i]] > TOLERANCE:
+            excess -= a[cover[i]]
+            keep[i] = False
+    cover = np.sort(cover[keep])
+
+    # Lifting των μεταβλητών εκτός κάλυψης
+    mu = np.cumsum(np.sort(a[cover])[::-1])
+    others = np.flatnonzero(free & (a > 0))
+    others = others[~np.isin(others, cover)]
+    lifted = np.searchsorted(mu, a[others] + TOLERANCE, side="right").astype(float)
+    others, lifted = others[lifted > 0], lifted[lifted > 0]
+
+    indices = np.concatenate([cover, others])
+    coeffs = np.concatenate([np.ones(len(cover)), lifted])
+    order = np.argsort(indices, kind="stable")
+    return indices[order], coeffs[order], float(len(cover) - 1)
+
+# Συνάρτηση add_to_model για την προσθήκη της περικοπής cut στο μοντέλο (του Gurobi ή του lp_relaxation)
+def add_to_model(model, cut, name):
+
+    if isinstance(model, lp.CapitalBudgetingLP):
+        return model.addConstr((dict(zip(cut.indices.tolist(), cut.coeffs.tolist())), cut.rhs), name=name)
+    variables = model.getVars()
+    return model.addConstr(gp.LinExpr(cut.coeffs.tolist(), [variables[i] for i in cut.indices]) <= cut.rhs, name=name)
+
+# Κλάση CutPool που διαχειρίζεται τις περικοπές κάλυψης των περιορισμών σακιδίου (κεφάλαιο, προσωπικό) ενός μοντέλου
+# Οι global περικοπές (έγκυρες σε όλο το δέντρο) αποθηκεύονται χωρίς διπλότυπα στο pool, ενώ οι local περικοπές (έγκυρες μόνο στο υποδέντρο
+# του κόμβου όπου βρέθηκαν) αποθηκεύονται στους κόμβους και προστίθενται στο μοντέλο μόνο όσο εξερευνάται το υποδέντρο τους
+# Μια περικοπή που δεν είναι ενεργή (έχει slack) σε περισσότερες από max_age διαδοχικές επιλύσεις αφαιρείται από το μοντέλο (οι global
+# παραμένουν στο pool και προστίθενται ξανά αν παραβιαστούν), ώστε οι χαλαρώσεις LP να μην μεγαλώνουν. Το pool κρατά το πολύ max_size
+# global περικοπές (αφαιρούνται πρώτα οι περικοπές εκτός μοντέλου με την μεγαλύτερη ηλικία)
+class CutPool:
+
+    def __init__(self, A, b, binary, max_size=1000, max_age=10, max_cuts=10):
+        self.rows = knapsack_rows(np.asarray(A, dtype=float), np.asarray(b, dtype=float), np.asarray(binary, dtype=bool))
+        self.binary = np.asarray(binary, dtype=bool)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_cuts = max_cuts
+        self.pool = {}
+        self.in_model = {}
+        self.added = 0
+        self._stacked = None
+
+    # Συνάρτηση pool_efficacy για τον υπολογισμό της efficacy όλων των περικοπών του pool για την λύση x με μία διανυσματική πράξη, πάνω
+    # στους συνενωμένους πίνακες δεικτών και συντελεστών των περικοπών (που δημιουργούνται ξανά μόνο όταν αλλάξει το pool)
+    # Επιστρέφει την λίστα των περικοπών και τον πίνακα των efficacy τους
+    def pool_efficacy(self, x):
+
+        if self._stacked is None:
+            cuts = list(self.pool.values())
+            rows = np.repeat(np.arange(len(cuts)), [len(cut.indices) for cut in cuts])
+            self._stacked = (cuts, rows,
+                             np.concatenate([cut.indices for cut in cuts]) if cuts else np.zeros(0, dtype=np.int64),
+                             np.concatenate([cut.coeffs for cut in cuts]) if cuts else np.zeros(0),
+                             np.array([cut.rhs for cut in cuts]), np.array([cut.norm for cut in cuts]))
+        cuts, rows, indices, coeffs, rhs, norms = self._stacked
+        lhs = np.bincount(rows, coeffs * x[indices], minlength=len(cuts))
+        return cuts, (lhs - rhs) / np.maximum(norms, TOLERANCE)
+
+    # Συνάρτηση separate για τον διαχωρισμό περικοπών που παραβιάζονται από την λύση x του κόμβου με όρια lb, ub: πρώτα από το pool,
+    # έπειτα νέες global περικοπές (με όλες τις δυαδικές μεταβλητές ελεύθερες) και, αν δεν βρεθούν, νέες local περικοπές (με τις
+    # σταθεροποιήσεις του κόμβου). Επιστρέφει λίστα με το πολύ max_cuts περικοπές, με φθίνουσα σειρά παραβίασης
+    def separate(self, x, lb, ub):
+
+        x = np.asarray(x, dtype=float)
+        pool_cuts, efficacy = self.pool_efficacy(x)
+        found = {cut.key(): cut for cut, value in zip(pool_cuts, efficacy) if value > MIN_EFFICACY and cut.constr is None}
+
+        for local in (False, True):
+            if local and found:
+                break
+            if local:
+                free = self.binary & (np.asarray(lb) < 0.5) & (np.asarray(ub) > 0.5)
+                ones = self.binary & (np.asarray(lb) > 0.5)
+            for a, rhs in self.rows:
+                if local:
+                    separated = lifted_cover(a, rhs - float(a[ones].sum()), x, free)
+                else:
+                    separated = lifted_cover(a, rhs, x, self.binary)
+                if separated is None:
+                    continue
+                cut = Cut(*separated, local=local)
+                key = cut.key()
+                if key in found or (not local and key in self.pool) or cut.efficacy(x) <= MIN_EFFICACY:
+                    continue
+                found[key] = cut
+
+        cuts = sorted(found.values(), key=lambda cut: -cut.efficacy(x))[:self.max_cuts]
+        for cut in cuts:
+            cut.age = 0
+            if not cut.local and cut.key() not in self.pool:
+                self.pool[cut.key()] = cut
+                self._stacked = None
+        self.trim()
+        return cuts
+
+    # Συνάρτηση trim για τον περιορισμό του μεγέθους του pool σε max_size περικοπές
+    def trim(self):
+
+        if len(self.pool) <= self.max_size:
+            return
+        outside = sorted((cut for cut in self.pool.values() if cut.constr is None), key=lambda cut: -cut.age)
+        for cut in outside[:len(self.pool) - self.max_size]:
+            del self.pool[cut.key()]
+        self._stacked = None
+
+    # Συνάρτηση add για την προσθήκη των περικοπών cuts στο μοντέλο
+    def add(self, model, cuts):
+
+        for cut in cuts:
+            if cut.constr is None:
+                self.added += 1
+                cut.constr = add_to_model(model, cut, f"{'Local' if cut.local else ''}CoverCut_{self.added}")
+                self.in_model[id(cut)] = cut
+
+    # Συνάρτηση remove για την αφαίρεση των περικοπών cuts από το μοντέλο
+    def remove(self, model, cuts):
+
+        cuts = [cut for cut in cuts if cut.constr is not None]
+        if cuts:
+            model.remove([cut.constr for cut in cuts])
+            for cut in cuts:
+                cut.constr = None
+                del self.in_model[id(cut)]
+
+    # Συνάρτηση activate για την προετοιμασία του μοντέλου για την επίλυση ενός κόμβου με local περικοπές local_cuts: αφαιρούνται οι local
+    # περικοπές άλλων κόμβων και προστίθενται όσες από τις local_cuts δεν έχουν γεράσει
+    def activate(self, model, local_cuts):
+
+        wanted = {id(cut) for cut in local_cuts}
+        self.remove(model, [cut for cut in self.in_model.values() if cut.local and id(cut) not in wanted])
+        self.add(model, [cut for cut in local_cuts if cut.age <= self.max_age])
+
+    # Συνάρτηση age για την ενημέρωση της ηλικίας των περικοπών του μοντέλου με την λύση x: οι ενεργές περικοπές (χωρίς slack) μηδενίζουν
+    # την ηλικία τους, οι υπόλοιπες την αυξάνουν, και όσες ξεπεράσουν την max_age αφαιρούνται από το μοντέλο
+    def age(self, model, x):
+
+        x = np.asarray(x, dtype=float)
+        expired = []
+        for cut in self.in_model.values():
+            cut.age = 0 if cut.violation(x) >= -TOLERANCE else cut.age + 1
+            if cut.age > self.max_age:
+                expired.append(cut)
+        self.remove(model, expired)
+
+    # Συνάρτηση clear για την αφαίρεση όλων των περικοπών από το μοντέλο, στο τέλος της αναζήτησης
+    def clear(self, model):
+
+        self.remove(model, list(self.in_model.values()))
@@ -0,0 +1,258 @@
+import time
+
+import numpy as np
+
+import heuristics as heur
+import limits as lim
+import node_selection as ns
+import presolve as ps
+
+# Ανοχή για την σύγκριση του Lagrangian bound με την καλύτερη λύση και των τιμών της Lagrangian συνάρτησης
+TOLERANCE = 1e-6
+
+# Μέγιστος αριθμός επιλύσεων του δυναμικού προγραμματισμού κατά την αναζήτηση του πολλαπλασιαστή Lagrange σε κάθε κόμβο
+MAX_ITERATIONS = 30
+
+# Μέγιστος αριθμός κόμβων του branch and bound που κλείνει το duality gap της Lagrangian χαλάρωσης
+MAX_NODES = 2000
+
+# Εκτιμώμενος αριθμός επιλύσεων του δυναμικού προγραμματισμού ανά πρόβλημα με duality gap, για την εκτίμηση του κόστους του (estimate)
+# (μέσος όρος του branch and bound που κλείνει το gap σε προβλήματα του random_generator με 200 έως 400 έργα)
+EXPECTED_ITERATIONS = 400
+
+# Κλάση Dimension που περιγράφει έναν περιορισμό χωρητικότητας (κεφάλαιο, προσωπικό ή αριθμός έργων): το όνομά του, τα βάρη των έργων και
+# την πραγματική χωρητικότητα, δηλαδή το μικρότερο από το δεξί μέλος και το μέγιστο άθροισμα βαρών που μπορεί να επιτευχθεί
+class Dimension:
+    __slots__ = ("name", "weights", "capacity")
+
+    def __init__(self, name, weights, capacity):
+        self.name = name
+        self.weights = weights
+        self.capacity = capacity
+
+# Συνάρτηση max_count για τον μέγιστο αριθμό έργων με βάρη weights που χωράνε στην χωρητικότητα capacity (τα έργα με το μικρότερο βάρος)
+def max_count(weights, capacity):
+
+    return int(np.searchsorted(np.cumsum(np.sort(weights)), capacity, side="right"))
+
+# Συνάρτηση dimensions για την δημιουργία των τριών περιορισμών χωρητικότητας των έργων που μπορούν να επιλεγούν
+# Η χωρητικότητα του αριθμού έργων περιορίζεται στον μέγιστο αριθμό έργων που χωράει στο κεφάλαιο και στο προσωπικό (τα έργα με το
+# μικρότερο κόστος ή προσωπικό), που συνήθως είναι πολύ μικρότερος από το P
+def dimensions(F, S, P, cost, staff):
+
+    count = min(P, len(cost), max_count(cost, F), max_count(staff, S))
+    return [Dimension("cost", cost, int(min(F, cost.sum()))),
+            Dimension("staff", staff, int(min(S, staff.sum()))),
+            Dimension("count", np.ones(len(cost), dtype=cost.dtype), int(count))]
+
+# Συνάρτηση split_dimensions για την επιλογή των δύο περιορισμών με τον μικρότερο πίνακα καταστάσεων, πάνω στους οποίους εκτελείται ο
+# δυναμικός προγραμματισμός, και του τρίτου περιορισμού, ο οποίος χαλαρώνεται με πολλαπλασιαστή Lagrange
+def split_dimensions(dims):
+
+    relaxed = min(range(3), key=lambda i: np.prod([dims[j].capacity + 1 for j in range(3) if j != i], dtype=float))
+    return [dims[j] for j in range(3) if j != relaxed], dims[relaxed]
+
+# Συνάρτηση relaxation_exact για τον έλεγχο ότι ο χαλαρωμένος περιορισμός d3 δεν μπορεί να παραβιαστεί από καμία λύση που σέβεται τους
+# περιορισμούς d1 και d2: τα έργα με το μεγαλύτερο βάρος στον d3, όσα το πολύ χωράνε στους d1 και d2, δεν ξεπερνούν την χωρητικότητα του
+# Τότε η πρώτη επίλυση του δυναμικού προγραμματισμού (λ = 0) δίνει την βέλτιστη λύση, χωρίς duality gap
+def relaxation_exact(d1, d2, d3):
+
+    count = min(max_count(d1.weights, d1.capacity), max_count(d2.weights, d2.capacity))
+    return float(np.sort(d3.weights)[::-1][:count].sum()) <= d3.capacity
+
+# Συνάρτηση estimate για την εκτίμηση του κόστους του δυναμικού προγραμματισμού για ένα πρόβλημα: επιστρέφει τον αριθμό των καταστάσεων,
+# τον αριθμό των ενημερώσεων καταστάσεων (καταστάσεις επί έργα επί τον αριθμό των επιλύσεων, μία αν η χαλάρωση είναι ακριβής, αλλιώς
+# EXPECTED_ITERATIONS για το branch and bound που κλείνει το duality gap), την μνήμη σε bytes (ο πίνακας τιμών και ένα bit απόφασης ανά
+# κατάσταση και έργο για την ανακατασκευή της λύσης) και αν η χαλάρωση είναι ακριβής (relaxation_exact)
+def estimate(N, F, S, P, performance, cost, staff):
+
+    keep = ~ps.oversized_projects(F, S, P, performance, cost, staff)
+    (d1, d2), d3 = split_dimensions(dimensions(F, S, P, np.asarray(cost)[keep], np.asarray(staff)[keep]))
+    states = (d1.capacity + 1) * (d2.capacity + 1)
+    items = int(keep.sum())
+    exact = relaxation_exact(d1, d2, d3)
+    solves = 1 if exact else EXPECTED_ITERATIONS
+    return states, states * items * solves, states * 8 * 3 + states * items // 8, exact
+
+# Συνάρτηση knapsack_2d για την επίλυση του προβλήματος σακιδίου με δύο περιορισμούς χωρητικότητας (βάρη w1, w2 και χωρητικότητες c1, c2)
+# και αποδόσεις profit, με δυναμικό προγραμματισμό πάνω σε έναν πίνακα τιμών (c1 + 1) x (c2 + 1) που ενημερώνεται επί τόπου για κάθε έργο
+# (rolling array). Οι αποφάσεις κάθε έργου αποθηκεύονται ως πίνακας bits (np.packbits), ώστε η βέλτιστη λύση να ανακατασκευάζεται με
+# μνήμη ένα bit ανά κατάσταση και έργο. Επιστρέφει την βέλτιστη τιμή και την λύση (πίνακας boolean)
+def knapsack_2d(profit, w1, w2, c1, c2):
+
+    value = np.zeros((c1 + 1, c2 + 1))
+    decisions = []
+    for p, u, v in zip(profit, w1, w2):
+        candidate = value[:c1 + 1 - u, :c2 + 1 - v] + p
+        take = candidate > value[u:, v:]
+        np.maximum(value[u:, v:], candidate, out=value[u:, v:])
+        decisions.append((np.packbits(take, axis=None), take.shape))
+
+    # Ανακατασκευή της λύσης από την κατάσταση (c1, c2), με αντίστροφη σειρά έργων
+    x = np.zeros(len(profit), dtype=bool)
+    a, b = c1, c2
+    for i in range(len(profit) - 1, -1, -1):
+        u, v = w1[i], w2[i]
+        if a < u or b < v:
+            continue
+        bits, shape = decisions[i]
+        index = (a - u) * shape[1] + (b - v)
+        if bits[index >> 3] >> (7 - (index & 7)) & 1:
+            x[i] = True
+            a, b = a - u, b - v
+    return float(value[c1, c2]), x
+
+# Συνάρτηση dynamic_programming για την ακριβή επίλυση του προβλήματος με δυναμικό προγραμματισμό στους δύο περιορισμούς με τον μικρότερο
+# πίνακα καταστάσεων και Lagrangian χαλάρωση του τρίτου: για κάθε πολλαπλασιαστή λ >= 0, η λύση του knapsack_2d με αποδόσεις
+# performance - λ * w3 δίνει άνω όριο (Lagrangian bound) και, αν σέβεται τον τρίτο περιορισμό, εφικτή λύση. Ο πολλαπλασιαστής επιλέγεται με
+# τομή των γραμμών της (κυρτής, τμηματικά γραμμικής) Lagrangian συνάρτησης στα δύο άκρα του διαστήματος αναζήτησης
+# Αφού οι αποδόσεις είναι ακέραιες, η λύση είναι βέλτιστη όταν η τιμή της ισούται με το ακέραιο μέρος του bound. Για να κλείσει το duality
+# gap, εκτελείται branch and bound (αναζήτηση κατά βάθος) στα έργα στα οποία διαφέρουν οι λύσεις των δύο άκρων, με το Lagrangian bound κάθε
+# κόμβου (τα έργα που έχουν σταθεροποιηθεί στο 1 μειώνουν τις χωρητικότητες). Αν εξαντληθούν οι max_nodes κόμβοι, επιστρέφεται η καλύτερη
+# εφικτή λύση με status FEASIBLE. Επιστρέφει αντικείμενο limits.Result, με αριθμό κόμβων τον αριθμό των επιλύσεων του δυναμικού
+# προγραμματισμού
+def dynamic_programming(N, F, S, P, performance, cost, staff, max_nodes=MAX_NODES):
+
+    start = time.perf_counter()
+    performance, cost, staff = np.asarray(performance), np.asarray(cost), np.asarray(staff)
+
+    # Απόρριψη των έργων που δεν μπορούν να επιλεγούν
+    items = np.flatnonzero(~ps.oversized_projects(F, S, P, performance, cost, staff))
+    p = performance[items].astype(float)
+    (d1, d2), d3 = split_dimensions(dimensions(F, S, P, cost[items], staff[items]))
+    w1, w2, w3 = d1.weights.astype(np.int64), d2.weights.astype(np.int64), d3.weights.astype(float)
+
+    # Δεδομένα για την συμπλήρωση των εφικτών λύσεων με την greedy_fill των ευρετικών
+    A = np.vstack((cost[items], staff[items], np.ones(len(items)))).astype(float)
+    b = np.array([F, S, P], dtype=float)
+
+    best_obj, best_x = 0.0, np.zeros(len(items))
+    iterations = 0
+
+    # Συνάρτηση repair για την μετατροπή μιας λύσης της χαλάρωσης που παραβιάζει τον τρίτο περιορισμό σε εφικτή, με αφαίρεση των επιλεγμένων
+    # έργων με αύξουσα σειρά του λόγου απόδοσης προς βάρος, μέχρι να χωρέσουν
+    def repair(x):
+        selected = np.flatnonzero(x > 0.5)
+        selected = selected[np.argsort(p[selected] / np.maximum(w3[selected], TOLERANCE), kind="stable")]
+        excess = np.cumsum(w3[selected]) >= float(w3 @ x) - d3.capacity - TOLERANCE
+        x = x.copy()
+        x[selected[:int(np.argmax(excess)) + 1]] = 0
+        return x
+
+    # Συνάρτηση lagrangian για την επίλυση της Lagrangian χαλάρωσης ενός κόμβου (ελεύθερα έργα free, έργα ones στο 1 και υπόλοιπες
+    # χωρητικότητες c1, c2) με πολλαπλασιαστή lam. Επιστρέφει την λύση, την απόδοση της και την διαφορά (subgradient) του δεξιού μέλους του
+    # τρίτου περιορισμού από το βάρος της, ώστε η Lagrangian συνάρτηση του κόμβου να είναι απόδοση + διαφορά * lam
+    def lagrangian(lam, free, ones, c1, c2):
+        nonlocal best_obj, best_x, iterations
+        iterations += 1
+
+        # Μόνο τα έργα με θετική απόδοση στην χαλάρωση, που χωράνε στις υπόλοιπες χωρητικότητες, μπορούν να βελτιώσουν την λύση της
+        use = free[(p[free] - lam * w3[free] > TOLERANCE) & (w1[free] <= c1) & (w2[free] <= c2)]
+        value, take = knapsack_2d(p[use] - lam * w3[use], w1[use], w2[use], c1, c2)
+        x = np.zeros(len(items))
+        x[ones] = 1
+        x[use[take]] = 1
+
+        slack = d3.capacity - float(w3 @ x)
+        filled = heur.greedy_fill(p, A, b, x if slack >= 0 else repair(x))
+        if p @ filled > best_obj:
+            best_obj, best_x = float(p @ filled), filled
+        return x, float(p @ x), slack
+
+    # Συνάρτηση solve_node για τον υπολογισμό του Lagrangian bound ενός κόμβου με σταθεροποιημένα έργα fixed (-1 για τα ελεύθερα έργα, 0 ή
+    # 1), ξεκινώντας από τον πολλαπλασιαστή lam του πατέρα του, μέχρι να αποδειχθεί ότι ο κόμβος δεν βελτιώνει την καλύτερη λύση
+    # Επιστρέφει το bound, τον πολλαπλασιαστή του και τις λύσεις των δύο άκρων του διαστήματος αναζήτησης (None αν ο κόμβος δεν χρειάζεται
+    # branching)
+    def solve_node(fixed, lam):
+        free, ones = np.flatnonzero(fixed < 0), np.flatnonzero(fixed > 0)
+        c1, c2 = d1.capacity - int(w1[ones].sum()), d2.capacity - int(w2[ones].sum())
+        if c1 < 0 or c2 < 0 or float(w3[ones].sum()) > d3.capacity + TOLERANCE:
+            return -np.inf, lam, None
+        if not len(free):
+            return float(p[ones].sum()), lam, None
+
+        # Λύση με τον πολλαπλασιαστή του πατέρα: αν σέβεται τον τρίτο περιορισμό με συμπληρωματική χαλαρότητα, είναι βέλτιστη για τον κόμβο
+        x, profit, slack = lagrangian(lam, free, ones, c1, c2)
+        bound, best_lam = profit + slack * lam, lam
+        if slack >= 0 and slack * lam <= TOLERANCE:
+            return bound, best_lam, None
+        if np.floor(bound + TOLERANCE) <= best_obj:
+            return bound, best_lam, None
+
+        # Το άλλο άκρο του διαστήματος αναζήτησης: με λ = 0 ο τρίτος περιορισμός αγνοείται, και με λ πάνω από τον μέγιστο λόγο απόδοσης
+        # προς βάρος κανένα ελεύθερο έργο δεν έχει θετική απόδοση
+        if slack < 0:
+            lo = (lam, profit, slack, x)
+            x = (fixed > 0).astype(float)
+            hi_lam = max(lam, float(np.max(p[free] / np.maximum(w3[free], TOLERANCE)))) + 1.0
+            hi = (hi_lam, float(p @ x), d3.capacity - float(w3 @ x), x)
+        else:
+            hi = (lam, profit, slack, x)
+            x, profit, slack = lagrangian(0.0, free, ones, c1, c2)
+            lo = (0.0, profit, slack, x)
+            if profit < bound:
+                bound, best_lam = profit, 0.0
+            if slack >= 0:
+                return bound, best_lam, None
+        if hi[1] + hi[2] * hi[0] < bound:
+            bound, best_lam = hi[1] + hi[2] * hi[0], hi[0]
+
+        for iteration in range(MAX_ITERATIONS):
+            if np.floor(bound + TOLERANCE) <= best_obj:
+                break
+
+            # Τομή των γραμμών profit + slack * λ στα δύο άκρα
+            lam = (hi[1] - lo[1]) / (lo[2] - hi[2])
+            if not lo[0] < lam < hi[0]:
+                break
+            line = lo[1] + lo[2] * lam
+            x, profit, slack = lagrangian(lam, free, ones, c1, c2)
+            value = profit + slack * lam
+            if value < bound:
+                bound, best_lam = value, lam
+            if value <= line + TOLERANCE:
+                break
+            if slack < 0:
+                lo = (lam, profit, slack, x)
+            else:
+                hi = (lam, profit, slack, x)
+        return bound, best_lam, (lo[3], hi[3])
+
+    # Αναζήτηση κατά βάθος: κάθε κόμβος της στοίβας είναι (σταθεροποιημένα έργα, bound και πολλαπλασιαστής του πατέρα)
+    root_bound = np.inf
+    stack = [(np.full(len(items), -1, dtype=np.int8), np.inf, 0.0)]
+    nodes = 0
+    while stack and nodes < max_nodes:
+        fixed, parent_bound, parent_lam = stack.pop()
+        if np.floor(parent_bound + TOLERANCE) <= best_obj:
+            continue
+        nodes += 1
+        bound, lam, ends = solve_node(fixed, parent_lam)
+        if nodes == 1:
+            root_bound = bound
+        if ends is None or np.floor(bound + TOLERANCE) <= best_obj:
+            continue
+
+        # Branching στο ελεύθερο έργο με το μεγαλύτερο βάρος στον τρίτο περιορισμό, από αυτά στα οποία διαφέρουν οι λύσεις των δύο άκρων
+        # (ή από τα έργα της λύσης που παραβιάζει τον περιορισμό). Πρώτα εξετάζεται ο κλάδος της εφικτής λύσης
+        lo_x, hi_x = ends
+        candidates = np.flatnonzero((fixed < 0) & (lo_x != hi_x))
+        if not len(candidates):
+            candidates = np.flatnonzero((fixed < 0) & (lo_x > 0.5))
+        j = candidates[np.argmax(w3[candidates])]
+        first = int(hi_x[j] > 0.5)
+        for value in (1 - first, first):
+            child = fixed.copy()
+            child[j] = value
+            stack.append((child, bound, lam))
+
+    # Αν η αναζήτηση ολοκληρώθηκε, η καλύτερη λύση είναι βέλτιστη, αλλιώς το bound είναι το μεγαλύτερο bound των ανοιχτών κόμβων
+    if stack:
+        bound = min(root_bound, max(parent_bound for fixed, parent_bound, parent_lam in stack))
+    else:
+        bound = min(root_bound, best_obj)
+    x = np.zeros(N)
+    x[items] = best_x
+    status = lim.OPTIMAL if best_obj >= np.floor(bound + TOLERANCE) else lim.FEASIBLE
+    return lim.Result(status, best_obj, x, bound, ns.relative_gap(best_obj, min(bound, np.floor(bound + TOLERANCE))), iterations,
+                      time.perf_counter() - start)
@@ -0,0 +1,147 @@
+import numpy as np
+
+# Ανοχή για τον έλεγχο εφικτότητας των περιορισμών
+TOLERANCE = 1e-9
+
+# Συνάρτηση problem_data για την ανάγνωση των συντελεστών της αντικειμενικής συνάρτησης (c), των περιορισμών (A) και των δεξιών μελών (b)
+# από το μοντέλο, είτε πρόκειται για μοντέλο του Gurobi είτε για μοντέλο του lp_relaxation. Χρησιμοποιούνται μόνο οι περιορισμοί <=
+def problem_data(model):
+
+    if hasattr(model, "A") and hasattr(model, "b") and hasattr(model, "c"):
+        return np.array(model.c, dtype=float), np.array(model.A, dtype=float), np.array(model.b, dtype=float)
+
+    constrs = model.getConstrs()
+    c = np.array(model.getAttr("Obj", model.getVars()), dtype=float)
+    A = model.getA().toarray()
+    b = np.array(model.getAttr("RHS", constrs), dtype=float)
+    rows = np.array([sense == "<" for sense in model.getAttr("Sense", constrs)], dtype=bool)
+    return c, A[rows], b[rows]
+
+# Συνάρτηση ratio για τον υπολογισμό του λόγου απόδοσης προς κατανάλωση πόρων κάθε έργου
+# Η κατανάλωση πόρων είναι το άθροισμα των συντελεστών των περιορισμών, κανονικοποιημένων με τα δεξιά μέλη (κεφάλαιο, προσωπικό, αριθμός έργων)
+def ratio(c, A, b):
+
+    # Οι περιορισμοί με μηδενικό δεξί μέλος αποκλείουν τα έργα με θετικό συντελεστή (άπειρη κατανάλωση)
+    normalized = A / np.where(b > 0, b, 1.0)[:, None]
+    normalized = np.where((b <= 0)[:, None] & (A > 0), np.inf, normalized)
+    usage = normalized.sum(axis=0)
+    with np.errstate(divide="ignore"):
+        return np.where(usage > 0, c / usage, np.inf)
+
+# Συνάρτηση objective για τον υπολογισμό της τιμής της αντικειμενικής συνάρτησης μιας λύσης
+def objective(c, x):
+
+    return float(c @ x)
+
+# Συνάρτηση greedy_fill για την προσθήκη έργων σε μια εφικτή λύση x, με φθίνουσα σειρά του λόγου απόδοσης προς κατανάλωση πόρων, όσο
+# χωράνε στα διαθέσιμα όρια. Αν δεν δοθεί x, ξεκινά από την κενή λύση. Επιστρέφει None αν η αρχική λύση δεν είναι εφικτή
+def greedy_fill(c, A, b, x=None, order=None):
+
+    x = np.zeros(len(c)) if x is None else np.array(x, dtype=float)
+    slack = b - A @ x
+    if np.any(slack < -TOLERANCE):
+        return None
+
+    if order is None:
+        order = np.argsort(-ratio(c, A, b), kind="stable")
+    candidates = order[(x[order] < 0.5) & (c[order] > 0)]
+
+    while len(candidates):
+
+        # Απόρριψη των έργων που δεν χωράνε (τα διαθέσιμα όρια μόνο μειώνονται, επομένως δεν θα χωρέσουν ούτε αργότερα)
+        candidates = candidates[np.all(A[:, candidates] <= slack[:, None] + TOLERANCE, axis=0)]
+        if not len(candidates):
+            break
+
+        # Προσθήκη του μεγαλύτερου προθέματος των υποψηφίων που χωράει ολόκληρο, και απόρριψη του πρώτου έργου που δεν χωράει
+        used = np.cumsum(A[:, candidates], axis=1)
+        fits = np.all(used <= slack[:, None] + TOLERANCE, axis=0)
+        k = len(candidates) if fits.all() else int(np.argmin(fits))
+        if k > 0:
+            x[candidates[:k]] = 1
+            slack = slack - used[:, k - 1]
+        candidates = candidates[k + 1:]
+
+    return x
+
+# Συνάρτηση lp_rounding για την δημιουργία ακέραιας λύσης από την λύση της χαλάρωσης LP: οι μη ακέραιες μεταβλητές στρογγυλοποιούνται προς
+# τα κάτω (η λύση παραμένει εφικτή, αφού όλοι οι συντελεστές είναι μη αρνητικοί) και έπειτα προστίθενται έργα με την greedy_fill
+def lp_rounding(c, A, b, x_lp):
+
+    x = np.floor(np.asarray(x_lp, dtype=float) + 1e-6)
+    return greedy_fill(c, A, b, np.clip(x, 0, 1))
+
+# Συνάρτηση local_search για την βελτίωση μιας εφικτής λύσης με ανταλλαγές (swap) ενός επιλεγμένου έργου με ένα μη επιλεγμένο μεγαλύτερης
+# απόδοσης που χωράει στα όρια μετά την αφαίρεση του πρώτου, και προσθήκη έργων που χωράνε (1-opt)
+# Για να παραμένει γρήγορη, εξετάζονται μόνο τα max_selected επιλεγμένα έργα με την μικρότερη απόδοση και τα max_unselected μη επιλεγμένα
+# έργα με την μεγαλύτερη απόδοση
+def local_search(c, A, b, x, max_rounds=50, max_selected=200, max_unselected=1000):
+
+    x = greedy_fill(c, A, b, x)
+    if x is None:
+        return None
+
+    for _ in range(max_rounds):
+
+        slack = b - A @ x
+        selected = np.flatnonzero(x > 0.5)
+        unselected = np.flatnonzero(x < 0.5)
+        if not len(selected) or not len(unselected):
+            break
+
+        selected = selected[np.argsort(c[selected], kind="stable")[:max_selected]]
+        unselected = unselected[np.argsort(-c[unselected], kind="stable")[:max_unselected]]
+
+        # Κέρδος και εφικτότητα κάθε ανταλλαγής (επιλεγμένο i, μη επιλεγμένο j)
+        gain = c[unselected][None, :] - c[selected][:, None]
+        available = slack[:, None] + A[:, selected]
+        feasible = np.all(A[:, unselected][:, None, :] <= available[:, :, None] + TOLERANCE, axis=0)
+        gain = np.where(feasible, gain, -np.inf)
+
+        best = np.unravel_index(np.argmax(gain), gain.shape)
+        if gain[best] <= TOLERANCE:
+            break
+
+        x[selected[best[0]]] = 0
+        x[unselected[best[1]]] = 1
+        x = greedy_fill(c, A, b, x)
+
+    return x
+
+# Συνάρτηση root_heuristics για την εκτέλεση των ευρετικών στην ρίζα: greedy fill με τον λόγο απόδοσης προς κατανάλωση πόρων και
+# στρογγυλοποίηση της λύσης της χαλάρωσης LP (αν δοθεί), η καθεμία ακολουθούμενη από τοπική αναζήτηση
+# Επιστρέφει λίστα με τις λύσεις που βρέθηκαν, ως (όνομα ευρετικής, τιμή αντικειμενικής συνάρτησης, λύση)
+def root_heuristics(c, A, b, x_lp=None):
+
+    results = []
+
+    x = greedy_fill(c, A, b)
+    if x is not None:
+        results.append(("greedy", objective(c, x), x))
+        x = local_search(c, A, b, x)
+        results.append(("greedy+local_search", objective(c, x), x))
+
+    if x_lp is not None:
+        results.extend(node_heuristics(c, A, b, x_lp))
+
+    return results
+
+# Συνάρτηση node_heuristics για την εκτέλεση των ευρετικών στην λύση της χαλάρωσης LP ενός κόμβου: στρογγυλοποίηση και τοπική αναζήτηση
+def node_heuristics(c, A, b, x_lp, max_rounds=10):
+
+    results = []
+
+    x = lp_rounding(c, A, b, x_lp)
+    if x is not None:
+        results.append(("lp_rounding", objective(c, x), x))
+        x = local_search(c, A, b, x, max_rounds=max_rounds)
+        results.append(("lp_rounding+local_search", objective(c, x), x))
+
+    return results
+
+# Συνάρτηση best_result για την επιλογή της καλύτερης λύσης (μεγαλύτερης τιμής) από τα αποτελέσματα των ευρετικών
+def best_result(results):
+
+    if not results:
+        return None
+    return max(results, key=lambda result: result[1])
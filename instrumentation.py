@@ -0,0 +1,143 @@
+import json
+import sys
+import time
+from collections import Counter
+
+# Αποτελέσματα (outcomes) των κόμβων που καταμετρώνται: μη εφικτός, ακέραια λύση, απόρριψη λόγω ορίου (μετά την επίλυση της χαλάρωσης LP),
+# branching, και απόρριψη χωρίς επίλυση (όταν η τιμή της χαλάρωσης LP του πατέρα δεν βελτιώνει πλέον την καλύτερη λύση)
+INFEASIBLE = "infeasible"
+INTEGER = "integer"
+PRUNED = "pruned"
+BRANCHED = "branched"
+DISCARDED = "discarded"
+OUTCOMES = (INFEASIBLE, INTEGER, PRUNED, BRANCHED, DISCARDED)
+
+# Φάσεις του αλγορίθμου που χρονομετρούνται: επίλυση της χαλάρωσης LP (ανανέωση ορίων και βάσης, optimize, ανάγνωση της λύσης), branching
+# (έλεγχος ακεραιότητας, επιλογή μεταβλητής και δημιουργία των παιδιών), ευρετικές, περικοπές (διαχωρισμός και επανεπίλυση), Lagrangian
+# bounding (βήματα subgradient πριν την χαλάρωση LP) και οργάνωση (ουρά, όρια, ενημέρωση της καλύτερης λύσης)
+LP = "lp"
+BRANCHING = "branching"
+HEURISTICS = "heuristics"
+CUTS = "cuts"
+LAGRANGIAN = "lagrangian"
+BOOKKEEPING = "bookkeeping"
+PHASES = (LP, BRANCHING, HEURISTICS, CUTS, LAGRANGIAN, BOOKKEEPING)
+
+# Κλάση Metrics για την καταμέτρηση των κόμβων ανά αποτέλεσμα, την χρονομέτρηση των φάσεων και την αποστολή γεγονότων (events) στους sinks
+# Τα γεγονότα των κόμβων στέλνονται δειγματοληπτικά (ένα κάθε sample_every κόμβους), ενώ οι μετρητές και οι χρόνοι καταγράφουν όλους τους
+# κόμβους. Οι αλγόριθμοι καλούν τις μεθόδους μόνο όταν έχει δοθεί αντικείμενο Metrics, επομένως χωρίς αυτό το κόστος είναι μηδενικό
+class Metrics:
+
+    def __init__(self, sinks=(), sample_every=1):
+
+        self.sinks = list(sinks)
+        self.sample_every = max(1, int(sample_every))
+        self.counts = dict.fromkeys(OUTCOMES, 0)
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    # Συνάρτηση mark για την απόδοση του χρόνου από το προηγούμενο mark στην φάση phase
+    def mark(self, phase):
+
+        now = time.perf_counter()
+        self.times[phase] += now - self._last
+        self._last = now
+
+    # Συνάρτηση node για την καταμέτρηση ενός κόμβου με αποτέλεσμα outcome και την αποστολή του γεγονότος στους sinks (δειγματοληπτικά)
+    def node(self, outcome, **fields):
+
+        self.counts[outcome] += 1
+        if self.sinks and self.counts[outcome] % self.sample_every == 0:
+            self.emit("node", outcome=outcome, **fields)
+
+    # Συνάρτηση emit για την αποστολή ενός γεγονότος σε όλους τους sinks (π.χ. βελτίωση της καλύτερης λύσης, που στέλνεται πάντα)
+    def emit(self, event, **fields):
+
+        record = {"event": event, "time": round(time.perf_counter() - self.start, 6)}
+        record.update(fields)
+        for sink in self.sinks:
+            sink.write(record, self)
+
+    # Συνάρτηση summary για την σύνοψη των μετρητών και των χρόνων
+    def summary(self):
+
+        return {"nodes": sum(self.counts[outcome] for outcome in OUTCOMES if outcome != DISCARDED),
+                "outcomes": dict(self.counts),
+                "times": {phase: round(value, 6) for phase, value in self.times.items()},
+                "elapsed": round(time.perf_counter() - self.start, 6)}
+
+    # Συνάρτηση close για την αποστολή της σύνοψης και το κλείσιμο των sinks
+    def close(self):
+
+        self.emit("summary", **self.summary())
+        for sink in self.sinks:
+            sink.close()
+
+# Κλάση CounterSink που μετράει στην μνήμη τα γεγονότα που λαμβάνει, ανά είδος γεγονότος και αποτέλεσμα κόμβου
+class CounterSink:
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def write(self, record, metrics):
+        self.counts[(record["event"], record.get("outcome"))] += 1
+
+    def close(self):
+        pass
+
+# Κλάση JsonLinesSink που γράφει κάθε γεγονός ως μία γραμμή JSON σε αρχείο (path) ή σε ανοιχτό stream
+class JsonLinesSink:
+
+    def __init__(self, path_or_stream):
+
+        self._owned = isinstance(path_or_stream, str)
+        self.stream = open(path_or_stream, "w") if self._owned else path_or_stream
+
+    def write(self, record, metrics):
+        self.stream.write(json.dumps(record, default=float) + "\n")
+
+    def close(self):
+        if self._owned:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+# Κλάση ProgressSink που εκτυπώνει μια γραμμή προόδου (κόμβοι ανά αποτέλεσμα, όρια, gap και χρόνος) το πολύ μία φορά κάθε interval δευτερόλεπτα
+# Η γραμμή ενημερώνεται μόνο όταν φτάσει γεγονός, επομένως με μεγάλο sample_every η συχνότητα της εξαρτάται και από τον ρυθμό των κόμβων
+class ProgressSink:
+
+    def __init__(self, interval=5.0, stream=None):
+
+        self.interval = interval
+        self.stream = sys.stderr if stream is None else stream
+        self._next = time.perf_counter() + interval
+
+    def write(self, record, metrics):
+
+        now = time.perf_counter()
+        if now < self._next and record["event"] != "summary":
+            return
+        self._next = now + self.interval
+        counts = ", ".join(f"{outcome} {metrics.counts[outcome]}" for outcome in OUTCOMES)
+        bounds = ""
+        if "lower_bound" in record:
+            bounds = f" | bounds [{record['lower_bound']}, {record['upper_bound']}]"
+        if "gap" in record:
+            bounds += f" | gap {record['gap']:.2%}"
+        print(f"[{now - metrics.start:9.1f}s] {counts}{bounds}", file=self.stream, flush=True)
+
+    def close(self):
+        pass
+
+# Κλάση TextSink που εκτυπώνει κάθε γεγονός σε μια γραμμή (για debuging, στην θέση των παλαιότερων μηνυμάτων DEBUG_MODE)
+class TextSink:
+
+    def __init__(self, stream=None):
+        self.stream = sys.stdout if stream is None else stream
+
+    def write(self, record, metrics):
+        print(" ".join(f"{key}={value}" for key, value in record.items()), file=self.stream)
+
+    def close(self):
+        self.stream.flush()
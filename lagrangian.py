@@ -0,0 +1,62 @@
+import numpy as np
+
+# Προεπιλεγμένος αριθμός βημάτων subgradient ανά κόμβο
+ITERATIONS = 5
+
+# Αρχικός συντελεστής θ του βήματος Polyak, και μετά από πόσα βήματα χωρίς βελτίωση του bound υποδιπλασιάζεται
+STEP_SCALE = 1.0
+STEP_PATIENCE = 3
+
+# Ανοχή για την σύγκριση του Lagrangian bound με την καλύτερη λύση
+TOLERANCE = 1e-6
+
+# Συνάρτηση lagrangian_bound για τον υπολογισμό της Lagrangian χαλάρωσης του προβλήματος max c*x υπό A*x <= b, lb <= x <= ub, όπου όλοι οι
+# περιορισμοί A*x <= b (κεφάλαιο, προσωπικό, αριθμός έργων) χαλαρώνονται με πολλαπλασιαστές multipliers >= 0. Το υποπρόβλημα που απομένει
+# λύνεται με έναν έλεγχο προσήμου για κάθε έργο: x_j = ub_j αν c_j - y*A_j > 0, αλλιώς x_j = lb_j
+# Επιστρέφει το bound L(y) = y*b + sum((c - y*A) * x), την λύση x του υποπροβλήματος και το subgradient b - A*x
+def lagrangian_bound(c, A, b, lb, ub, multipliers):
+
+    reduced = c - multipliers @ A
+    x = np.where(reduced > 0, ub, lb)
+    return float(multipliers @ b + reduced @ x), x, b - A @ x
+
+# Συνάρτηση subgradient για την βελτίωση των πολλαπλασιαστών ενός κόμβου (όρια lb, ub), ξεκινώντας από τους πολλαπλασιαστές multipliers
+# (π.χ. του πατέρα του), με το πολύ iterations βήματα subgradient με βήμα Polyak θ * (L(y) - incumbent) / ||g||^2 προς την τιμή incumbent της
+# καλύτερης λύσης. Η αναζήτηση σταματά μόλις το bound αποδείξει ότι ο κόμβος δεν βελτιώνει την καλύτερη λύση
+# Επιστρέφει το καλύτερο (μικρότερο) bound και τους πολλαπλασιαστές του
+def subgradient(c, A, b, lb, ub, multipliers, incumbent, iterations=ITERATIONS):
+
+    y = np.maximum(np.asarray(multipliers, dtype=float), 0.0)
+
+    # Αν τα κάτω όρια (τα έργα που έχουν επιλεγεί) παραβιάζουν ήδη έναν περιορισμό, ο κόμβος είναι μη εφικτός και η Lagrangian συνάρτηση
+    # δεν είναι φραγμένη από κάτω
+    if np.any(A @ lb > b + TOLERANCE):
+        return -np.inf, y
+
+    best_bound, best_y = np.inf, y
+    scale = STEP_SCALE
+    stalled = 0
+
+    for iteration in range(max(1, iterations)):
+        bound, x, g = lagrangian_bound(c, A, b, lb, ub, y)
+        if bound < best_bound - TOLERANCE:
+            best_bound, best_y = bound, y
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= STEP_PATIENCE:
+                scale /= 2
+                stalled = 0
+
+        # Ο κόμβος απορρίπτεται, ή η λύση του υποπροβλήματος είναι εφικτή με συμπληρωματική χαλαρότητα (τότε το bound είναι βέλτιστο)
+        norm = float(g @ g)
+        if best_bound <= incumbent + TOLERANCE or norm == 0.0 or not np.isfinite(incumbent):
+            break
+        if np.all(g >= 0) and abs(float(y @ g)) <= TOLERANCE:
+            break
+
+        # Βήμα προς την κατεύθυνση που μειώνει την L(y), με προβολή στους μη αρνητικούς πολλαπλασιαστές
+        step = scale * max(bound - incumbent, TOLERANCE) / norm
+        y = np.maximum(y - step * g, 0.0)
+
+    return best_bound, best_y
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+import node_selection as ns
+
+# Λόγοι τερματισμού της αναζήτησης: απόδειξη βελτιστότητας, μη εφικτό πρόβλημα, ή εξάντληση ενός από τα όρια (χρόνος, κόμβοι, μνήμη
+# ανοιχτών κόμβων, gap). FEASIBLE σημαίνει ότι βρέθηκε λύση χωρίς απόδειξη βελτιστότητας, χωρίς να εξαντληθεί κάποιο όριο
+OPTIMAL = "optimal"
+INFEASIBLE = "infeasible"
+FEASIBLE = "feasible"
+TIME_LIMIT = "time_limit"
+NODE_LIMIT = "node_limit"
+MEMORY_LIMIT = "memory_limit"
+GAP_LIMIT = "gap_limit"
+
+# Κλάση Limits με τα όρια τερματισμού της αναζήτησης (None για κανένα όριο): χρόνος (σε δευτερόλεπτα από την δημιουργία του αντικειμένου ή
+# την κλήση της start), αριθμός κόμβων, μνήμη των ανοιχτών κόμβων (σε MB), απόλυτο και σχετικό gap μεταξύ της καλύτερης λύσης και του
+# global dual bound
+class Limits:
+
+    def __init__(self, time_limit=None, node_limit=None, memory_limit=None, absolute_gap=None, relative_gap=None):
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.memory_limit = memory_limit
+        self.absolute_gap = absolute_gap
+        self.relative_gap = relative_gap
+        self.start()
+
+    # Συνάρτηση start για την έναρξη της χρονομέτρησης
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    # Συνάρτηση check για τον έλεγχο των ορίων με τον αριθμό των κόμβων nodes, την μνήμη (σε bytes) των ανοιχτών κόμβων open_memory,
+    # την τιμή της καλύτερης λύσης incumbent και το global dual bound bound. Επιστρέφει τον λόγο τερματισμού ή None
+    def check(self, nodes, open_memory, incumbent, bound):
+
+        if self.time_limit is not None and time.perf_counter() - self.start_time >= self.time_limit:
+            return TIME_LIMIT
+        if self.node_limit is not None and nodes >= self.node_limit:
+            return NODE_LIMIT
+        if self.memory_limit is not None and open_memory >= self.memory_limit * 2**20:
+            return MEMORY_LIMIT
+        if bound is not None and np.isfinite(incumbent) and np.isfinite(bound):
+            if self.absolute_gap is not None and abs(bound - incumbent) <= self.absolute_gap:
+                return GAP_LIMIT
+            if self.relative_gap is not None and ns.relative_gap(incumbent, bound) <= self.relative_gap:
+                return GAP_LIMIT
+        return None
+
+# Κλάση Result με το αποτέλεσμα μιας αναζήτησης: λόγος τερματισμού (status), τιμή και λύση της καλύτερης λύσης (None αν δεν βρέθηκε),
+# global dual bound που αποδείχθηκε, σχετικό gap, αριθμός κόμβων και χρόνος εκτέλεσης (σε δευτερόλεπτα)
+class Result:
+    __slots__ = ("status", "objective", "solution", "bound", "gap", "nodes", "time")
+
+    def __init__(self, status, objective, solution, bound, gap, nodes, time):
+        self.status = status
+        self.objective = objective
+        self.solution = solution
+        self.bound = bound
+        self.gap = gap
+        self.nodes = nodes
+        self.time = time
+
+    def __repr__(self):
+        return (f"Result(status={self.status!r}, objective={self.objective}, bound={self.bound}, gap={self.gap}, nodes={self.nodes}, "
+                f"time={self.time:.3f})")
@@ -0,0 +1,577 @@
+import numpy as np
+
+# Κωδικοί κατάστασης της λύσης (ίδιες τιμές με τους κωδικούς GRB.OPTIMAL, GRB.INFEASIBLE κλπ του Gurobi, ώστε οι έλεγχοι
+# model.status != GRB.OPTIMAL των αλγορίθμων branch and bound να λειτουργούν χωρίς αλλαγές)
+OPTIMAL = 2
+INFEASIBLE = 3
+UNBOUNDED = 5
+ITERATION_LIMIT = 7
+
+# Κωδικοί βάσης (ίδιες τιμές με τα χαρακτηριστικά VBasis και CBasis του Gurobi)
+BASIC = 0
+NONBASIC_LOWER = -1
+NONBASIC_UPPER = -2
+
+# Ανοχή για τον έλεγχο εφικτότητας και για τον έλεγχο προσήμου των reduced costs
+FEASIBILITY_TOL = 1e-7
+OPTIMALITY_TOL = 1e-9
+
+# Προεπιλεγμένος μέγιστος αριθμός επαναλήψεων του dual simplex
+MAX_ITERATIONS = 1000
+
+# Κλάση GRB με τους κωδικούς κατάστασης, για χρήση στην θέση του gurobipy.GRB όταν το gurobipy δεν είναι εγκατεστημένο
+class GRB:
+    OPTIMAL = OPTIMAL
+    INFEASIBLE = INFEASIBLE
+    UNBOUNDED = UNBOUNDED
+    ITERATION_LIMIT = ITERATION_LIMIT
+    MAXIMIZE = -1
+
+# Συνάρτηση dual_simplex που υλοποιεί τον dual simplex με φραγμένες μεταβλητές (bounded dual simplex) για το πρόβλημα
+#   min cost*x  υπό  K*x = b,  lo <= x <= hi
+# όπου ο πίνακας K περιλαμβάνει ήδη τις slack μεταβλητές των περιορισμών (K = [A | I]).
+# Ο έλεγχος λόγου (ratio test) γίνεται με αλλαγή ορίων (bound flipping): τα σημεία καμπής ταξινομούνται και οι μεταβλητές αλλάζουν όριο
+# όσο μειώνεται η μη εφικτότητα της γραμμής που φεύγει από την βάση, όπως στο ταξινομημένο fractional knapsack. Έτσι, με λίγες γραμμές
+# (3 για το capital budgeting) αρκούν λίγες επαναλήψεις, η καθεμία από τις οποίες είναι λίγες διανυσματικές πράξεις NumPy
+def dual_simplex(K, b, cost, lo, hi, basic=None, at_upper=None, max_iter=MAX_ITERATIONS):
+
+    m, n = K.shape
+    boxed = np.isfinite(hi)
+    fixed = hi - lo <= FEASIBILITY_TOL
+
+    # Αρχική βάση: είτε η βάση που δόθηκε (warm start) είτε η βάση των slack μεταβλητών
+    if basic is None or at_upper is None or len(basic) != m:
+        basic = np.arange(n - m, n)
+        at_upper = np.zeros(n, dtype=bool)
+    else:
+        basic = np.array(basic, dtype=np.int64)
+        at_upper = np.array(at_upper, dtype=bool)
+
+    for iteration in range(max_iter):
+
+        # Υπολογισμός του αντιστρόφου της βάσης (m x m), των δυϊκών τιμών y και των reduced costs d
+        try:
+            B_inv = np.linalg.inv(K[:, basic])
+        except np.linalg.LinAlgError:
+            # Στην περίπτωση ιδιάζουσας βάσης επιστρέφουμε στην βάση των slack μεταβλητών
+            basic = np.arange(n - m, n)
+            at_upper[:] = False
+            B_inv = np.linalg.inv(K[:, basic])
+        y = cost[basic] @ B_inv
+        d = cost - y @ K
+
+        is_basic = np.zeros(n, dtype=bool)
+        is_basic[basic] = True
+        nonbasic = ~is_basic
+
+        # Αποκατάσταση της δυϊκής εφικτότητας για τις μη βασικές μεταβλητές: οι μεταβλητές με d < 0 πηγαίνουν στο άνω όριο και
+        # οι μεταβλητές με d > 0 στο κάτω όριο. Αν μια μεταβλητή με d < 0 δεν έχει άνω όριο, το πρόβλημα δεν είναι φραγμένο
+        if np.any(nonbasic & ~boxed & (d < -OPTIMALITY_TOL)):
+            if np.array_equal(basic, np.arange(n - m, n)):
+                return UNBOUNDED, None, basic, at_upper, iteration
+            basic = np.arange(n - m, n)
+            at_upper[:] = False
+            continue
+        at_upper[nonbasic & boxed & (d < -OPTIMALITY_TOL)] = True
+        at_upper[nonbasic & (d > OPTIMALITY_TOL)] = False
+        at_upper[~boxed] = False
+        at_upper[basic] = False
+
+        # Υπολογισμός των τιμών των μη βασικών μεταβλητών (στα όριά τους) και έπειτα των βασικών μεταβλητών
+        x = np.where(at_upper, hi, lo)
+        x[basic] = 0.0
+        x[basic] = B_inv @ (b - K @ x)
+
+        # Επιλογή της γραμμής που φεύγει από την βάση: η βασική μεταβλητή με την μεγαλύτερη παραβίαση των ορίων της
+        x_B = x[basic]
+        below = lo[basic] - x_B
+        above = x_B - hi[basic]
+        violation = np.maximum(below, above)
+        r = int(np.argmax(violation))
+
+        # Στην περίπτωση που δεν υπάρχει παραβίαση, η λύση είναι βέλτιστη
+        if violation[r] <= FEASIBILITY_TOL:
+            return OPTIMAL, x, basic, at_upper, iteration
+
+        # Υπολογισμός της γραμμής r του πίνακα B^-1 * K
+        alpha = B_inv[r] @ K
+        leaving = basic[r]
+        to_lower = below[r] > above[r]
+
+        # Υποψήφιες μεταβλητές για είσοδο στην βάση: οι μη βασικές και μη σταθερές μεταβλητές που, αλλάζοντας όριο, μειώνουν
+        # την παραβίαση της γραμμής r
+        if to_lower:
+            delta = below[r]
+            candidates = nonbasic & ~fixed & ((~at_upper & (alpha < -OPTIMALITY_TOL)) | (at_upper & (alpha > OPTIMALITY_TOL)))
+        else:
+            delta = above[r]
+            candidates = nonbasic & ~fixed & ((~at_upper & (alpha > OPTIMALITY_TOL)) | (at_upper & (alpha < -OPTIMALITY_TOL)))
+
+        candidate_idx = np.flatnonzero(candidates)
+
+        # Στην περίπτωση που δεν υπάρχει υποψήφια μεταβλητή, το πρόβλημα είναι μη εφικτό
+        if len(candidate_idx) == 0:
+            return INFEASIBLE, None, basic, at_upper, iteration
+
+        # Ταξινόμηση των σημείων καμπής |d_j| / |alpha_j| και υπολογισμός της αθροιστικής μείωσης της παραβίασης, καθώς οι
+        # υποψήφιες μεταβλητές αλλάζουν όριο η μία μετά την άλλη
+        abs_alpha = np.abs(alpha[candidate_idx])
+        ratios = np.abs(d[candidate_idx]) / abs_alpha
+        order = np.argsort(ratios, kind="stable")
+        widths = abs_alpha[order] * (hi[candidate_idx[order]] - lo[candidate_idx[order]])
+        covered = np.cumsum(widths)
+
+        # Η μεταβλητή που μπαίνει στην βάση είναι η πρώτη για την οποία η αθροιστική μείωση καλύπτει την παραβίαση, ενώ όλες οι
+        # προηγούμενες αλλάζουν όριο. Αν ούτε όλες μαζί δεν την καλύπτουν, το πρόβλημα είναι μη εφικτό
+        k = int(np.searchsorted(covered, delta - FEASIBILITY_TOL))
+        if k >= len(order):
+            return INFEASIBLE, None, basic, at_upper, iteration
+
+        flipped = candidate_idx[order[:k]]
+        at_upper[flipped] = ~at_upper[flipped]
+        entering = candidate_idx[order[k]]
+
+        # Ενημέρωση της βάσης: η μεταβλητή που φεύγει πηγαίνει στο όριο που παραβίαζε
+        basic[r] = entering
+        at_upper[entering] = False
+        at_upper[leaving] = not to_lower
+
+    return ITERATION_LIMIT, None, basic, at_upper, max_iter
+
+# Συνάρτηση batch_dual_simplex που εκτελεί τον dual simplex της dual_simplex ταυτόχρονα για ένα μπλοκ k προβλημάτων (γραμμές των πινάκων),
+# με πράξεις NumPy σε πίνακες 2 διαστάσεων αντί για k διαδοχικές επιλύσεις. Τα όρια lo, hi έχουν διάσταση (k, n), ενώ οι K, b και cost είναι
+# είτε κοινοί για όλα τα προβλήματα (διάστασης (m, n), (m,) και (n,), π.χ. κόμβοι του ίδιου δέντρου) είτε διαφορετικοί για κάθε πρόβλημα
+# (διάστασης (k, m, n), (k, m) και (k, n), π.χ. προβλήματα του ίδιου μεγέθους). Σε κάθε επανάληψη συνεχίζουν μόνο τα προβλήματα που δεν
+# έχουν ολοκληρωθεί
+# Επιστρέφει για κάθε πρόβλημα την κατάσταση, τις τιμές των μεταβλητών (NaN για τα μη βέλτιστα), την βάση και τον αριθμό των επαναλήψεων
+def batch_dual_simplex(K, b, cost, lo, hi, basic=None, at_upper=None, max_iter=MAX_ITERATIONS):
+
+    k, n = lo.shape
+    m = K.shape[-2]
+    shared = K.ndim == 2
+    slack_basis = np.arange(n - m, n)
+
+    # Αρχική βάση κάθε προβλήματος: είτε η βάση που δόθηκε (warm start) είτε η βάση των slack μεταβλητών
+    if basic is None or at_upper is None:
+        basic = np.tile(slack_basis, (k, 1))
+        at_upper = np.zeros((k, n), dtype=bool)
+    else:
+        basic = np.array(basic, dtype=np.int64)
+        at_upper = np.array(at_upper, dtype=bool)
+
+    status = np.full(k, ITERATION_LIMIT, dtype=np.int64)
+    x = np.full((k, n), np.nan)
+    iterations = np.zeros(k, dtype=np.int64)
+    active = np.arange(k)
+
+    for iteration in range(max_iter):
+
+        if len(active) == 0:
+            break
+        rows = np.arange(len(active))
+        K_a = K if shared else K[active]
+        cost_a = cost if shared else cost[active]
+        lo_a, hi_a = lo[active], hi[active]
+        basic_a, at_upper_a = basic[active], at_upper[active]
+        boxed = np.isfinite(hi_a)
+        fixed = hi_a - lo_a <= FEASIBILITY_TOL
+
+        # Οι πίνακες βάσης (m x m) όλων των προβλημάτων. Στην περίπτωση ιδιάζουσας βάσης επιστρέφουμε στην βάση των slack μεταβλητών
+        B = K_a[:, basic_a].transpose(1, 0, 2) if shared else np.take_along_axis(K_a, basic_a[:, None, :], axis=2)
+        singular = np.abs(np.linalg.det(B)) < 1e-12
+        if np.any(singular):
+            basic_a[singular] = slack_basis
+            at_upper_a[singular] = False
+            B[singular] = np.eye(m)
+        B_inv = np.linalg.inv(B)
+
+        # Δυϊκές τιμές y και reduced costs d
+        cost_B = cost[basic_a] if shared else np.take_along_axis(cost_a, basic_a, axis=1)
+        y = np.einsum("ki,kij->kj", cost_B, B_inv)
+        d = cost_a - (y @ K if shared else np.einsum("ki,kin->kn", y, K_a))
+
+        is_basic = np.zeros((len(active), n), dtype=bool)
+        np.put_along_axis(is_basic, basic_a, True, axis=1)
+        nonbasic = ~is_basic
+
+        # Αποκατάσταση της δυϊκής εφικτότητας όπως στην dual_simplex: τα προβλήματα με μη φραγμένη μεταβλητή με d < 0 είναι μη φραγμένα
+        # αν έχουν την βάση των slack μεταβλητών, αλλιώς επιστρέφουν σε αυτήν και συνεχίζουν στην επόμενη επανάληψη
+        at_upper_a |= nonbasic & boxed & (d < -OPTIMALITY_TOL)
+        at_upper_a &= ~(nonbasic & (d > OPTIMALITY_TOL)) & boxed & nonbasic
+        restart = np.any(nonbasic & ~boxed & (d < -OPTIMALITY_TOL), axis=1)
+        if np.any(restart):
+            at_slack_basis = np.all(basic_a == slack_basis, axis=1)
+            status[active[restart & at_slack_basis]] = UNBOUNDED
+            basic_a[restart] = slack_basis
+            at_upper_a[restart] = False
+
+        # Υπολογισμός των τιμών των μη βασικών μεταβλητών (στα όριά τους) και έπειτα των βασικών μεταβλητών
+        x_a = np.where(at_upper_a, hi_a, lo_a)
+        np.put_along_axis(x_a, basic_a, 0.0, axis=1)
+        residual = (b - x_a @ K.T) if shared else (b[active] - np.einsum("kin,kn->ki", K_a, x_a))
+        x_B = np.einsum("kij,kj->ki", B_inv, residual)
+        np.put_along_axis(x_a, basic_a, x_B, axis=1)
+
+        # Επιλογή της γραμμής που φεύγει από την βάση σε κάθε πρόβλημα: η βασική μεταβλητή με την μεγαλύτερη παραβίαση των ορίων της
+        below = np.take_along_axis(lo_a, basic_a, axis=1) - x_B
+        above = x_B - np.take_along_axis(hi_a, basic_a, axis=1)
+        violation = np.maximum(below, above)
+        r = np.argmax(violation, axis=1)
+
+        # Τα προβλήματα χωρίς παραβίαση έχουν βέλτιστη λύση
+        optimal = (violation[rows, r] <= FEASIBILITY_TOL) & ~restart
+        status[active[optimal]] = OPTIMAL
+        x[active[optimal]] = x_a[optimal]
+
+        # Υπολογισμός της γραμμής r του πίνακα B^-1 * K κάθε προβλήματος που συνεχίζει
+        go = ~optimal & ~restart
+        alpha = B_inv[rows, r] @ K if shared else np.einsum("ki,kin->kn", B_inv[rows, r], K_a)
+        to_lower = below[rows, r] > above[rows, r]
+        delta = np.where(to_lower, below[rows, r], above[rows, r])
+
+        # Υποψήφιες μεταβλητές για είσοδο στην βάση (όπως στην dual_simplex, με το πρόσημο του alpha ανάλογα με την κατεύθυνση της παραβίασης)
+        signed_alpha = np.where(to_lower[:, None], -alpha, alpha)
+        candidates = (nonbasic & ~fixed & ((~at_upper_a & (signed_alpha > OPTIMALITY_TOL)) | (at_upper_a & (signed_alpha < -OPTIMALITY_TOL)))
+                      & go[:, None])
+        num_candidates = candidates.sum(axis=1)
+
+        # Ταξινόμηση των σημείων καμπής κάθε γραμμής (οι μη υποψήφιες μεταβλητές στο τέλος) και αθροιστική μείωση της παραβίασης
+        abs_alpha = np.abs(alpha)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(candidates, np.abs(d) / abs_alpha, np.inf)
+            widths = np.where(candidates, abs_alpha * (hi_a - lo_a), 0.0)
+        order = np.argsort(ratios, axis=1, kind="stable")
+        covered = np.cumsum(np.take_along_axis(widths, order, axis=1), axis=1)
+        position = np.sum(covered < (delta - FEASIBILITY_TOL)[:, None], axis=1)
+
+        # Τα προβλήματα για τα οποία ούτε όλες οι υποψήφιες μεταβλητές μαζί δεν καλύπτουν την παραβίαση είναι μη εφικτά
+        infeasible = go & (position >= num_candidates)
+        status[active[infeasible]] = INFEASIBLE
+        go &= ~infeasible
+
+        # Αλλαγή ορίου των μεταβλητών πριν από το σημείο καμπής της μεταβλητής που μπαίνει στην βάση και ενημέρωση της βάσης
+        flipped = np.zeros((len(active), n), dtype=bool)
+        np.put_along_axis(flipped, order, np.arange(n)[None, :] < position[:, None], axis=1)
+        at_upper_a ^= flipped & go[:, None]
+        moving = np.flatnonzero(go)
+        r_moving = r[moving]
+        entering = order[moving, position[moving]]
+        leaving = basic_a[moving, r_moving]
+        basic_a[moving, r_moving] = entering
+        at_upper_a[moving, entering] = False
+        at_upper_a[moving, leaving] = ~to_lower[moving]
+
+        basic[active] = basic_a
+        at_upper[active] = at_upper_a
+        iterations[active] += ~optimal & ~infeasible
+        active = active[status[active] == ITERATION_LIMIT]
+
+    return status, x, basic, at_upper, iterations
+
+# Κλάση Var που αντιπροσωπεύει μια μεταβλητή του μοντέλου CapitalBudgetingLP (αντίστοιχη του gurobipy.Var)
+class Var:
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        self.index = index
+
+    # Η σύγκριση var <= τιμή δημιουργεί έναν περιορισμό άνω ορίου μιας μεταβλητής, ώστε να λειτουργεί η model.addConstr(var <= τιμή)
+    def __le__(self, rhs):
+        return ({self.index: 1.0}, float(rhs))
+
+# Κλάση Constr που αντιπροσωπεύει έναν περιορισμό του μοντέλου CapitalBudgetingLP (αντίστοιχη του gurobipy.Constr)
+class Constr:
+    __slots__ = ("index", "name")
+
+    def __init__(self, index, name=""):
+        self.index = index
+        self.name = name
+
+# Κλάση Params με τις παραμέτρους της επίλυσης (αντίστοιχη του model.Params του Gurobi): IterationLimit ο μέγιστος αριθμός επαναλήψεων του
+# dual simplex (άπειρο για το προεπιλεγμένο όριο MAX_ITERATIONS)
+class Params:
+    __slots__ = ("IterationLimit",)
+
+    def __init__(self):
+        self.IterationLimit = np.inf
+
+# Κλάση CapitalBudgetingLP που υλοποιεί την χαλάρωση LP του capital budgeting με NumPy και μπορεί να χρησιμοποιηθεί στην θέση του
+# μοντέλου του Gurobi στους αλγορίθμους branch and bound (υποστηρίζει τις μεθόδους optimize, getVars, getConstrs, getAttr, setAttr,
+# addConstr και update και τα χαρακτηριστικά status, ObjVal και Params)
+class CapitalBudgetingLP:
+
+    def __init__(self, performance, cost, staff, F, S, P, num_vars=None):
+
+        N = len(performance)
+        # Ο αριθμός των μεταβλητών (μία για κάθε έργο, ενώ τυχόν επιπλέον μεταβλητές δεν εμφανίζονται στους περιορισμούς)
+        self.num_vars = N if num_vars is None else num_vars
+
+        # Πίνακας A με τους συντελεστές των περιορισμών κεφαλαίου, προσωπικού και αριθμού έργων και πίνακας b με τα δεξιά μέλη
+        A = np.zeros((3, self.num_vars))
+        A[0, :N] = cost
+        A[1, :N] = staff
+        A[2, :N] = 1
+        self.A = A
+        self.b = np.array([F, S, P], dtype=float)
+
+        # Συντελεστές της αντικειμενικής συνάρτησης (μεγιστοποίηση)
+        self.c = np.zeros(self.num_vars)
+        self.c[:N] = performance
+
+        # Άνω και κάτω όρια των μεταβλητών
+        self.lb = np.zeros(self.num_vars)
+        self.ub = np.ones(self.num_vars)
+        self.ub[N:] = np.inf
+
+        self._vars = [Var(i) for i in range(self.num_vars)]
+        self._constrs = [Constr(i) for i in range(3)]
+        self._build()
+
+        self.status = None
+        self.ObjVal = None
+        self.IterCount = 0
+        self.Params = Params()
+        self.x = None
+
+        # Η βάση της τελευταίας επίλυσης, που χρησιμοποιείται ως warm start στην επόμενη
+        self._basic = None
+        self._at_upper = None
+
+    # Συνάρτηση _build για την δημιουργία του πίνακα K = [A | I] και των ορίων των slack μεταβλητών
+    def _build(self):
+
+        m = self.A.shape[0]
+        self._K = np.hstack([self.A, np.eye(m)])
+        self._cost = np.concatenate([-self.c, np.zeros(m)])
+        self._slack_lo = np.zeros(m)
+        self._slack_hi = np.full(m, np.inf)
+        self._basic = None
+        self._at_upper = None
+
+    # Συνάρτηση optimize για την επίλυση της χαλάρωσης LP με τα τρέχοντα όρια
+    def optimize(self):
+
+        lo = np.concatenate([self.lb, self._slack_lo])
+        hi = np.concatenate([self.ub, self._slack_hi])
+
+        max_iter = MAX_ITERATIONS if np.isinf(self.Params.IterationLimit) else int(self.Params.IterationLimit)
+        status, x, basic, at_upper, iterations = dual_simplex(self._K, self.b, self._cost, lo, hi, self._basic, self._at_upper, max_iter)
+
+        self.status = status
+        self.IterCount = iterations
+        self._basic = basic
+        self._at_upper = at_upper
+
+        if status == OPTIMAL:
+            self.x = x[:self.num_vars]
+            self.ObjVal = float(self.c @ self.x)
+        else:
+            self.x = None
+            self.ObjVal = None
+
+    # Συνάρτηση update (δεν απαιτείται ενημέρωση, υπάρχει για συμβατότητα με το μοντέλο του Gurobi)
+    def update(self):
+        pass
+
+    def getVars(self):
+        return self._vars
+
+    def getConstrs(self):
+        return self._constrs
+
+    # Συνάρτηση _indices για την μετατροπή μιας λίστας μεταβλητών ή περιορισμών σε πίνακα δεικτών
+    def _indices(self, items, all_items):
+
+        if items is all_items:
+            return slice(None)
+        return np.fromiter((item.index for item in items), dtype=np.int64)
+
+    # Συνάρτηση getAttr για την ανάγνωση των χαρακτηριστικών X, RC, Pi, LB, UB, Obj, VBasis και CBasis
+    def getAttr(self, name, items=None):
+
+        if name == "X":
+            return self.x[self._indices(items, self._vars)].tolist()
+        if name == "RC":
+            return self._reduced_costs()[self._indices(items, self._vars)].tolist()
+        if name == "Pi":
+            return self._duals()[self._indices(items, self._constrs)].tolist()
+        if name == "LB":
+            return self.lb[self._indices(items, self._vars)].tolist()
+        if name == "UB":
+            return self.ub[self._indices(items, self._vars)].tolist()
+        if name == "Obj":
+            return self.c[self._indices(items, self._vars)].tolist()
+        if name in ("VBasis", "CBasis"):
+            vbasis, cbasis = self._basis_codes()
+            if name == "VBasis":
+                return vbasis[self._indices(items, self._vars)].tolist()
+            return cbasis[self._indices(items, self._constrs)].tolist()
+        raise AttributeError(f"Unknown attribute {name}")
+
+    # Συνάρτηση setAttr για την ενημέρωση των χαρακτηριστικών LB, UB, VBasis και CBasis
+    def setAttr(self, name, items, values):
+
+        if name == "LB":
+            self.lb[self._indices(items, self._vars)] = values
+        elif name == "UB":
+            self.ub[self._indices(items, self._vars)] = values
+        elif name == "VBasis":
+            self._pending_vbasis = np.asarray(values)
+            self._set_basis_codes()
+        elif name == "CBasis":
+            self._pending_cbasis = np.asarray(values)
+            self._set_basis_codes()
+        else:
+            raise AttributeError(f"Unknown attribute {name}")
+
+    # Συνάρτηση _duals για τον υπολογισμό των δυϊκών τιμών y των περιορισμών από την βάση της τελευταίας επίλυσης, με την σύμβαση του Gurobi
+    # για πρόβλημα μεγιστοποίησης (y >= 0 για τους περιορισμούς <=)
+    def _duals(self):
+
+        if self.x is None:
+            raise AttributeError("Unable to retrieve attribute 'Pi'")
+        objective = np.concatenate([self.c, np.zeros(self.A.shape[0])])
+        return np.linalg.solve(self._K[:, self._basic].T, objective[self._basic])
+
+    # Συνάρτηση _reduced_costs για τον υπολογισμό των reduced costs των μεταβλητών από την βάση της τελευταίας επίλυσης, με την σύμβαση του
+    # Gurobi για πρόβλημα μεγιστοποίησης (c_j - y*A_j, μη θετικό για μεταβλητές στο κάτω όριο και μη αρνητικό για μεταβλητές στο άνω όριο)
+    def _reduced_costs(self):
+
+        if self.x is None:
+            raise AttributeError("Unable to retrieve attribute 'RC'")
+        return self.c - self._duals() @ self.A
+
+    # Συνάρτηση _basis_codes για την μετατροπή της εσωτερικής βάσης σε κωδικούς VBasis και CBasis
+    def _basis_codes(self):
+
+        n = self.num_vars
+        m = self.A.shape[0]
+        codes = np.full(n + m, NONBASIC_LOWER, dtype=np.int64)
+        if self._basic is not None:
+            codes[self._at_upper] = NONBASIC_UPPER
+            codes[self._basic] = BASIC
+        return codes[:n], codes[n:]
+
+    # Συνάρτηση _set_basis_codes για την ανάθεση της βάσης από κωδικούς VBasis και CBasis, όταν έχουν δοθεί και οι δύο
+    def _set_basis_codes(self):
+
+        vbasis = getattr(self, "_pending_vbasis", None)
+        cbasis = getattr(self, "_pending_cbasis", None)
+        if vbasis is None or cbasis is None:
+            return
+        codes = np.concatenate([vbasis, cbasis])
+        basic = np.flatnonzero(codes == BASIC)
+        if len(basic) == self.A.shape[0]:
+            self._basic = basic
+            self._at_upper = codes == NONBASIC_UPPER
+        self._pending_vbasis = None
+        self._pending_cbasis = None
+
+    # Συνάρτηση addConstr για την προσθήκη ενός περιορισμού της μορφής sum(coeffs[i] * x[i]) <= rhs
+    def addConstr(self, constr, name=""):
+
+        coeffs, rhs = constr
+        row = np.zeros(self.num_vars)
+        for i, a in coeffs.items():
+            row[i] = a
+        self.A = np.vstack([self.A, row])
+        self.b = np.append(self.b, rhs)
+        new_constr = Constr(len(self._constrs), name)
+        self._constrs.append(new_constr)
+
+        # Η βάση της τελευταίας επίλυσης παραμένει βάση με την slack μεταβλητή του νέου περιορισμού βασική (warm start)
+        basic, at_upper = self._basic, self._at_upper
+        self._build()
+        if basic is not None:
+            self._basic = np.append(basic, len(at_upper))
+            self._at_upper = np.append(at_upper, False)
+        return new_constr
+
+    # Συνάρτηση remove για την αφαίρεση περιορισμών από το μοντέλο
+    def remove(self, constrs):
+
+        if isinstance(constrs, Constr):
+            constrs = [constrs]
+        removed = {c.index for c in constrs}
+        keep = [i for i in range(self.A.shape[0]) if i not in removed]
+        n = self.num_vars
+
+        # Αν οι slack μεταβλητές όλων των περιορισμών που αφαιρούνται είναι βασικές, η υπόλοιπη βάση παραμένει βάση (warm start)
+        basic, at_upper = self._basic, self._at_upper
+        if basic is not None and all(n + i in basic for i in removed):
+            position = np.full(n + self.A.shape[0], -1, dtype=np.int64)
+            position[:n] = np.arange(n)
+            position[n + np.array(keep, dtype=np.int64)] = n + np.arange(len(keep))
+            basic = position[basic]
+            basic = basic[basic >= 0]
+            at_upper = at_upper[np.concatenate([np.arange(n), n + np.array(keep, dtype=np.int64)])]
+        else:
+            basic = at_upper = None
+
+        self.A = self.A[keep]
+        self.b = self.b[keep]
+        self._constrs = [c for c in self._constrs if c.index not in removed]
+        for i, c in enumerate(self._constrs):
+            c.index = i
+        self._build()
+        self._basic, self._at_upper = basic, at_upper
+
+# Συνάρτηση solve_relaxation για την επίλυση της χαλάρωσης LP απευθείας από τους πίνακες του προβλήματος, χωρίς την δημιουργία μοντέλου
+# Επιστρέφει την κατάσταση, την τιμή της αντικειμενικής συνάρτησης και τις τιμές των μεταβλητών
+def solve_relaxation(performance, cost, staff, F, S, P, lb=None, ub=None):
+
+    model = CapitalBudgetingLP(performance, cost, staff, F, S, P)
+    if lb is not None:
+        model.lb[:] = lb
+    if ub is not None:
+        model.ub[:] = ub
+    model.optimize()
+    return model.status, model.ObjVal, model.x
+
+# Συνάρτηση solve_relaxation_batch για την επίλυση της χαλάρωσης LP ενός μπλοκ k προβλημάτων μεγιστοποίησης c*x υπό A*x <= b, lb <= x <= ub
+# με την batch_dual_simplex. Τα όρια lb, ub έχουν διάσταση (k, n) (μία γραμμή ανά κόμβο, με τις σταθεροποιημένες μεταβλητές ως lb = ub),
+# ενώ οι c, A, b είναι είτε κοινοί (κόμβοι του ίδιου προβλήματος) είτε με μία γραμμή/πίνακα ανά πρόβλημα (προβλήματα του ίδιου μεγέθους)
+# Αν δοθεί βάση (πίνακες vbasis (k, n) και cbasis (k, m) με κωδικούς VBasis και CBasis, π.χ. η βάση του πατέρα κάθε κόμβου), χρησιμοποιείται
+# ως warm start, ενώ οι γραμμές χωρίς έγκυρη βάση ξεκινούν από την βάση των slack μεταβλητών
+# Επιστρέφει για κάθε πρόβλημα την κατάσταση, την τιμή της αντικειμενικής συνάρτησης (-άπειρο για τα μη βέλτιστα), τις τιμές των μεταβλητών
+# και την βέλτιστη βάση ως πίνακες int8 vbasis και cbasis
+def solve_relaxation_batch(c, A, b, lb, ub, vbasis=None, cbasis=None, max_iter=MAX_ITERATIONS):
+
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    lb = np.atleast_2d(np.asarray(lb, dtype=float))
+    ub = np.atleast_2d(np.asarray(ub, dtype=float))
+    k, n = lb.shape
+    m = A.shape[-2]
+
+    # Πίνακας K = [A | I] και όρια των slack μεταβλητών, κοινά ή ανά πρόβλημα
+    if A.ndim == 2:
+        K = np.hstack([A, np.eye(m)])
+        cost = np.concatenate([-c, np.zeros(m)])
+    else:
+        K = np.concatenate([A, np.broadcast_to(np.eye(m), (k, m, m))], axis=2)
+        cost = np.hstack([-np.broadcast_to(c, (k, n)), np.zeros((k, m))])
+    lo = np.hstack([lb, np.zeros((k, m))])
+    hi = np.hstack([ub, np.full((k, m), np.inf)])
+
+    # Μετατροπή των κωδικών βάσης σε θέσεις βασικών μεταβλητών και μεταβλητές στο άνω όριο
+    basic = at_upper = None
+    if vbasis is not None and cbasis is not None:
+        codes = np.hstack([np.asarray(vbasis).reshape(k, n), np.asarray(cbasis).reshape(k, m)])
+        is_basic = codes == BASIC
+        valid = is_basic.sum(axis=1) == m
+        basic = np.tile(np.arange(n, n + m), (k, 1))
+        basic[valid] = np.nonzero(is_basic[valid])[1].reshape(-1, m)
+        at_upper = (codes == NONBASIC_UPPER) & valid[:, None]
+
+    status, x, basic, at_upper, iterations = batch_dual_simplex(K, b, cost, lo, hi, basic, at_upper, max_iter)
+
+    optimal = status == OPTIMAL
+    x = x[:, :n]
+    objective = np.full(k, -np.inf)
+    objective[optimal] = np.einsum("kn,kn->k", np.broadcast_to(c, (k, n))[optimal], x[optimal])
+
+    codes = np.where(at_upper, NONBASIC_UPPER, NONBASIC_LOWER).astype(np.int8)
+    np.put_along_axis(codes, basic, BASIC, axis=1)
+    return status, objective, x, codes[:, :n], codes[:, n:]
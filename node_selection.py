@@ -0,0 +1,236 @@
+import heapq
+from collections import deque
+
+import numpy as np
+
+# Διαθέσιμες στρατηγικές επιλογής κόμβων
+STRATEGIES = ("depth-first", "best-bound", "best-estimate", "hybrid")
+
+# Κλάση BoundTracker που παρακολουθεί τα bounds των ανοιχτών κόμβων σε ένα heap, ώστε το καλύτερο bound (το global dual bound) να
+# υπολογίζεται σε O(log n) ανά ενημέρωση. Οι αφαιρέσεις γίνονται "τεμπέλικα": καταγράφονται σε ένα λεξικό και τα αντίστοιχα στοιχεία
+# αφαιρούνται από το heap μόνο όταν φτάσουν στην κορυφή. Οι κόμβοι χωρίς bound (None) θεωρούνται μη φραγμένοι
+class BoundTracker:
+
+    def __init__(self, isMax=True):
+        self.isMax = isMax
+        self.sign = -1.0 if isMax else 1.0
+        self.heap = []
+        self.removed = {}
+        self.unbounded = 0
+
+    def add(self, bound):
+        if bound is None:
+            self.unbounded += 1
+        else:
+            heapq.heappush(self.heap, self.sign * bound)
+
+    def remove(self, bound):
+        if bound is None:
+            self.unbounded -= 1
+        else:
+            key = self.sign * bound
+            self.removed[key] = self.removed.get(key, 0) + 1
+
+    # Η καλύτερη τιμή bound μεταξύ των ανοιχτών κόμβων (None αν δεν υπάρχουν ανοιχτοί κόμβοι)
+    def best(self):
+        if self.unbounded:
+            return np.inf if self.isMax else -np.inf
+        heap = self.heap
+        removed = self.removed
+        while heap and heap[0] in removed:
+            key = heapq.heappop(heap)
+            if removed[key] == 1:
+                del removed[key]
+            else:
+                removed[key] -= 1
+        return self.sign * heap[0] if heap else None
+
+# Κλάση DepthFirstQueue που υλοποιεί την αναζήτηση κατά βάθος (στοίβα LIFO, όπως η αρχική deque των αλγορίθμων branch and bound)
+class DepthFirstQueue:
+
+    def __init__(self, isMax=True):
+        self.isMax = isMax
+        self.stack = deque()
+        self.bounds = BoundTracker(isMax)
+
+    def push(self, node, bound=None, estimate=None):
+        self.stack.append((node, bound))
+        self.bounds.add(bound)
+
+    def pop(self):
+        node, bound = self.stack.pop()
+        self.bounds.remove(bound)
+        return node, bound
+
+    # Ο επόμενος κόμβος της ουράς (node, bound), χωρίς αφαίρεση
+    def peek(self):
+        return self.stack[-1]
+
+    # Συνάρτηση rebound για τον υπολογισμό νέων bounds των count επόμενων κόμβων της ουράς μαζί, με την συνάρτηση bound_block(nodes, bounds)
+    # που επιστρέφει τα νέα bounds και για κάθε κόμβο αν παραμένει στην ουρά. Οι κόμβοι που παραμένουν κρατούν την σειρά τους
+    # Επιστρέφει τους κόμβους που αφαιρέθηκαν ως λίστα (node, bound)
+    def rebound(self, count, bound_block):
+        entries = [self.stack.pop() for _ in range(min(count, len(self.stack)))]
+        new_bounds, keep = bound_block([node for node, _ in entries], [bound for _, bound in entries])
+        removed = []
+        for (node, bound), new_bound, kept in reversed(list(zip(entries, new_bounds, keep))):
+            self.bounds.remove(bound)
+            if kept:
+                self.stack.append((node, new_bound))
+                self.bounds.add(new_bound)
+            else:
+                removed.append((node, bound))
+        return removed
+
+    # Η καλύτερη τιμή bound μεταξύ των ανοιχτών κόμβων (global dual bound)
+    def best_bound(self):
+        return self.bounds.best()
+
+    # Ενημέρωση για την εύρεση νέας καλύτερης λύσης (δεν επηρεάζει την αναζήτηση κατά βάθος)
+    def on_incumbent(self, obj):
+        pass
+
+    def __len__(self):
+        return len(self.stack)
+
+    def __iter__(self):
+        return iter(self.stack)
+
+# Κλάση PriorityQueue που υλοποιεί μια ουρά προτεραιότητας (heap) με κλειδί που υπολογίζεται από την συνάρτηση key
+# Σε περίπτωση ισοβαθμίας προτιμάται ο κόμβος που εισήχθη τελευταίος, ώστε να συνεχίζεται η κατάδυση στο ίδιο υποδέντρο
+class PriorityQueue:
+
+    def __init__(self, isMax=True):
+        self.isMax = isMax
+        self.heap = []
+        self.pushes = 0
+        self.bounds = BoundTracker(isMax)
+
+    # Συνάρτηση key για τον υπολογισμό του κλειδιού (μικρότερο κλειδί = μεγαλύτερη προτεραιότητα)
+    def key(self, bound, estimate):
+        raise NotImplementedError
+
+    def push(self, node, bound=None, estimate=None):
+        self.pushes += 1
+        heapq.heappush(self.heap, (self.key(bound, estimate), -self.pushes, node, bound))
+        self.bounds.add(bound)
+
+    def pop(self):
+        _, _, node, bound = heapq.heappop(self.heap)
+        self.bounds.remove(bound)
+        return node, bound
+
+    def peek(self):
+        return self.heap[0][2], self.heap[0][3]
+
+    # Οι κόμβοι που παραμένουν επανεισάγονται με το ίδιο κλειδί, ώστε η σειρά επιλογής να μην αλλάζει
+    def rebound(self, count, bound_block):
+        entries = [heapq.heappop(self.heap) for _ in range(min(count, len(self.heap)))]
+        new_bounds, keep = bound_block([entry[2] for entry in entries], [entry[3] for entry in entries])
+        removed = []
+        for (key, order, node, bound), new_bound, kept in zip(entries, new_bounds, keep):
+            self.bounds.remove(bound)
+            if kept:
+                heapq.heappush(self.heap, (key, order, node, new_bound))
+                self.bounds.add(new_bound)
+            else:
+                removed.append((node, bound))
+        return removed
+
+    def best_bound(self):
+        return self.bounds.best()
+
+    def on_incumbent(self, obj):
+        pass
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        return ((entry[2], entry[3]) for entry in self.heap)
+
+# Κλάση BestBoundQueue που επιλέγει τον κόμβο με το καλύτερο bound (την τιμή της χαλάρωσης LP του πατέρα)
+class BestBoundQueue(PriorityQueue):
+
+    def key(self, bound, estimate):
+        if bound is None:
+            return -np.inf
+        return -bound if self.isMax else bound
+
+# Κλάση BestEstimateQueue που επιλέγει τον κόμβο με την καλύτερη εκτίμηση της τιμής της ακέραιας λύσης του υποδέντρου
+class BestEstimateQueue(PriorityQueue):
+
+    def key(self, bound, estimate):
+        if estimate is None:
+            estimate = bound
+        if estimate is None:
+            return -np.inf
+        return -estimate if self.isMax else estimate
+
+# Κλάση HybridQueue που κάνει αναζήτηση κατά βάθος μέχρι να βρεθεί η πρώτη ακέραια λύση και έπειτα συνεχίζει με best-bound
+class HybridQueue:
+
+    def __init__(self, isMax=True):
+        self.isMax = isMax
+        self.queue = DepthFirstQueue(isMax)
+
+    def push(self, node, bound=None, estimate=None):
+        self.queue.push(node, bound, estimate)
+
+    def pop(self):
+        return self.queue.pop()
+
+    def peek(self):
+        return self.queue.peek()
+
+    def rebound(self, count, bound_block):
+        return self.queue.rebound(count, bound_block)
+
+    def best_bound(self):
+        return self.queue.best_bound()
+
+    # Με την εύρεση της πρώτης ακέραιας λύσης, οι ανοιχτοί κόμβοι μεταφέρονται σε ουρά best-bound
+    def on_incumbent(self, obj):
+        if isinstance(self.queue, DepthFirstQueue):
+            best_bound_queue = BestBoundQueue(self.isMax)
+            for node, bound in self.queue:
+                best_bound_queue.push(node, bound)
+            self.queue = best_bound_queue
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+# Συνάρτηση create_node_queue για την δημιουργία της ουράς ανοιχτών κόμβων για την στρατηγική που επιλέγεται
+def create_node_queue(strategy="depth-first", isMax=True):
+
+    if strategy == "depth-first":
+        return DepthFirstQueue(isMax)
+    if strategy == "best-bound":
+        return BestBoundQueue(isMax)
+    if strategy == "best-estimate":
+        return BestEstimateQueue(isMax)
+    if strategy == "hybrid":
+        return HybridQueue(isMax)
+    raise ValueError(f"Unknown node selection strategy: {strategy}")
+
+# Συνάρτηση relative_gap για τον υπολογισμό της σχετικής απόστασης (gap) μεταξύ της καλύτερης λύσης (incumbent) και του global dual bound
+# (bound), ως προς την τιμή της καλύτερης λύσης. Επιστρέφει άπειρο όταν δεν υπάρχει ακόμα λύση ή bound
+def relative_gap(incumbent, bound):
+
+    if incumbent is None or bound is None or not np.isfinite(incumbent) or not np.isfinite(bound):
+        return np.inf
+    return abs(bound - incumbent) / max(abs(incumbent), 1e-10)
+
+# Συνάρτηση estimate_node για την εκτίμηση της τιμής της καλύτερης ακέραιας λύσης στο υποδέντρο ενός κόμβου
+# Από την τιμή της χαλάρωσης LP αφαιρείται, για κάθε μη ακέραια μεταβλητή, η ελάχιστη μεταβολή της αντικειμενικής συνάρτησης που
+# προκύπτει από την στρογγυλοποίηση της προς τον πλησιέστερο ακέραιο
+def estimate_node(x_obj, x_candidate, integer_var, obj_coeffs, isMax=True):
+
+    x = np.asarray(x_candidate, dtype=float)
+    frac = x - np.floor(x)
+    mask = np.asarray(integer_var, dtype=bool) & (frac > 1e-6) & (frac < 1 - 1e-6)
+    penalty = float(np.sum(np.minimum(frac[mask], 1 - frac[mask]) * np.abs(np.asarray(obj_coeffs, dtype=float)[mask])))
+    return x_obj - penalty if isMax else x_obj + penalty
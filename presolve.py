@@ -0,0 +1,115 @@
+import numpy as np
+import problems as pr
+import lp_relaxation as lp
+import heuristics as heur
+
+# Ανοχή για τον έλεγχο των reduced costs και της σύγκρισης με την καλύτερη λύση
+TOLERANCE = 1e-6
+
+# Κλάση Presolve που αποθηκεύει το αποτέλεσμα του presolve: τις θέσεις των έργων που παραμένουν ελεύθερα (free), τις θέσεις των έργων που
+# σταθεροποιήθηκαν στο 1 (fixed_one) και στο 0 (fixed_zero), την σταθερή απόδοση των έργων που σταθεροποιήθηκαν στο 1 (offset) και την
+# καλύτερη λύση των ευρετικών που χρησιμοποιήθηκε για το reduced-cost fixing (incumbent)
+class Presolve:
+    __slots__ = ("num_projects", "free", "fixed_one", "fixed_zero", "offset", "incumbent")
+
+    def __init__(self, num_projects, free, fixed_one, fixed_zero, offset, incumbent):
+        self.num_projects = num_projects
+        self.free = free
+        self.fixed_one = fixed_one
+        self.fixed_zero = fixed_zero
+        self.offset = offset
+        self.incumbent = incumbent
+
+    # Συνάρτηση expand για την μετατροπή μιας λύσης του μειωμένου προβλήματος σε λύση του αρχικού (μία τιμή για κάθε έργο)
+    def expand(self, x):
+
+        full = np.zeros(self.num_projects)
+        full[self.free] = np.asarray(x, dtype=float)[:len(self.free)]
+        full[self.fixed_one] = 1
+        return full
+
+    # Συνάρτηση objective για την μετατροπή της τιμής της αντικειμενικής συνάρτησης του μειωμένου προβλήματος σε τιμή του αρχικού
+    def objective(self, obj):
+
+        return obj + self.offset
+
+# Συνάρτηση oversized_projects για τον εντοπισμό των έργων που δεν μπορούν να επιλεγούν, επειδή το κόστος ή το προσωπικό τους ξεπερνά από
+# μόνο του το διαθέσιμο κεφάλαιο ή προσωπικό (ή P < 1), και των έργων με μη θετική απόδοση, που δεν βελτιώνουν καμία λύση
+def oversized_projects(F, S, P, performance, cost, staff):
+
+    return (np.asarray(cost) > F) | (np.asarray(staff) > S) | (P < 1) | (np.asarray(performance) <= 0)
+
+# Συνάρτηση reduced_cost_fixing για τον εντοπισμό των μεταβλητών που μπορούν να σταθεροποιηθούν στο τρέχον όριό τους με βάση τα reduced costs
+# rc της λύσης x της χαλάρωσης LP (τιμή lp_obj) και την τιμή incumbent της καλύτερης λύσης: η αλλαγή μιας μη βασικής μεταβλητής στο άλλο
+# της όριο χειροτερεύει το όριο LP κατά |rc|, επομένως αν το όριο που προκύπτει δεν βελτιώνει την καλύτερη λύση η μεταβλητή σταθεροποιείται
+# Με keep_incumbent = True η σύγκριση είναι αυστηρή, ώστε και οι λύσεις ίσες με την καλύτερη να παραμένουν εφικτές
+# Επιστρέφει δύο πίνακες boolean, για τις μεταβλητές που σταθεροποιούνται στο κάτω και στο άνω όριό τους αντίστοιχα
+def reduced_cost_fixing(rc, x, lb, ub, lp_obj, incumbent, isMax=True, keep_incumbent=False):
+
+    rc = np.abs(np.asarray(rc, dtype=float))
+    x = np.asarray(x, dtype=float)
+    lb = np.asarray(lb, dtype=float)
+    ub = np.asarray(ub, dtype=float)
+
+    # Όριο LP μετά την αλλαγή της μεταβλητής στο άλλο της όριο, σε σύγκριση με την καλύτερη λύση
+    tolerance = -TOLERANCE if keep_incumbent else TOLERANCE
+    if isMax:
+        dominated = lp_obj - rc <= incumbent + tolerance
+    else:
+        dominated = lp_obj + rc >= incumbent - tolerance
+
+    candidates = dominated & (rc > TOLERANCE) & (ub - lb > TOLERANCE)
+    at_lower = candidates & (x <= lb + TOLERANCE)
+    at_upper = candidates & (x >= ub - TOLERANCE)
+    return at_lower, at_upper
+
+# Συνάρτηση presolve_capital_budgeting για την μείωση του προβλήματος πριν τον αλγόριθμο branch and bound: αφαιρούνται τα έργα που δεν
+# χωράνε, λύνεται η χαλάρωση LP και εκτελούνται οι ευρετικές στην ρίζα, και με την καλύτερη λύση τους σταθεροποιούνται έργα με reduced-cost
+# fixing. Τα έργα που σταθεροποιήθηκαν στο 1 αφαιρούνται από τα διαθέσιμα όρια F, S και P
+# Επιστρέφει τα δεδομένα του μειωμένου προβλήματος (N, F, S, P, performance, cost, staff) και το αντικείμενο Presolve
+def presolve_capital_budgeting(N, F, S, P, performance, cost, staff):
+
+    performance = np.asarray(performance)
+    cost = np.asarray(cost)
+    staff = np.asarray(staff)
+
+    fixed_zero = oversized_projects(F, S, P, performance, cost, staff)
+    fixed_one = np.zeros(N, dtype=bool)
+    incumbent = None
+    candidates = np.flatnonzero(~fixed_zero)
+
+    if len(candidates):
+        # Επίλυση της χαλάρωσης LP των έργων που χωράνε και εκτέλεση των ευρετικών στην λύση της
+        model = lp.CapitalBudgetingLP(performance[candidates], cost[candidates], staff[candidates], F, S, P)
+        model.optimize()
+        if model.status == lp.OPTIMAL:
+            c, A, b = heur.problem_data(model)
+            result = heur.best_result(heur.root_heuristics(c, A, b, model.x))
+            if result is not None:
+                incumbent = result[1]
+                rc = model.getAttr("RC", model.getVars())
+                at_lower, at_upper = reduced_cost_fixing(rc, model.x, model.lb, model.ub, model.ObjVal, incumbent,
+                                                         keep_incumbent=True)
+                fixed_zero[candidates[at_lower]] = True
+                fixed_one[candidates[at_upper]] = True
+
+    # Τουλάχιστον ένα έργο παραμένει ελεύθερο, ώστε το μειωμένο μοντέλο να μην είναι κενό (η σταθεροποίηση του είναι έγκυρη αλλά όχι απαραίτητη)
+    free = np.flatnonzero(~fixed_zero & ~fixed_one)
+    if not len(free) and N > 0:
+        keep = np.flatnonzero(fixed_zero)[:1] if fixed_zero.any() else np.flatnonzero(fixed_one)[:1]
+        fixed_zero[keep] = False
+        fixed_one[keep] = False
+        free = keep
+
+    reduction = Presolve(N, free, np.flatnonzero(fixed_one), np.flatnonzero(fixed_zero), float(performance[fixed_one].sum()),
+                         incumbent)
+    reduced = (len(free), int(F - cost[fixed_one].sum()), int(S - staff[fixed_one].sum()), int(P - fixed_one.sum()),
+               performance[free], cost[free], staff[free])
+    return reduced, reduction
+
+# Συνάρτηση build_presolved_model για την ανάγνωση του αρχείου προβλήματος, το presolve και την δημιουργία του μοντέλου του μειωμένου
+# προβλήματος με την μηχανή LP που επιλέγεται. Επιστρέφει τα ίδια στοιχεία με την problems.build_model και το αντικείμενο Presolve
+def build_presolved_model(filename, engine="gurobi"):
+
+    reduced, reduction = presolve_capital_budgeting(*pr.read_data_capital_budgeting(filename))
+    return pr.build_model_from_arrays(*reduced, engine=engine) + (reduction,)
@@ -1,44 +1,142 @@
 import numpy as np 
-import gurobipy as gp
-from gurobipy import GRB
+import os
+import re
+import time
+import warnings
+import lp_relaxation as lp
+
+# Το gurobipy είναι απαραίτητο μόνο για την συνάρτηση capital_budgeting, η capital_budgeting_numpy λειτουργεί και χωρίς αυτό
+try:
+    import gurobipy as gp
+    from gurobipy import GRB
+except ImportError:
+    gp = None
+    GRB = lp.GRB
+
+# Δήλωση global μεταβλητών
+DATA_CACHE = False    # True για αποθήκευση των δεδομένων κάθε αρχείου προβλήματος σε αρχείο cache (.npz) δίπλα του, για γρηγορότερη ανάγνωση
+parse_time = 0.0      # χρόνος (σε δευτερόλεπτα) της τελευταίας ανάγνωσης αρχείου προβλήματος
+
+# Κανονικές εκφράσεις για την ανάγνωση των παραμέτρων (π.χ. 'param N := 9000;') και της επικεφαλίδας του πίνακα των έργων
+PARAM_PATTERN = re.compile(r"param\s+([NFSP])\s*:=\s*(-?\d+)\s*;")
+TABLE_PATTERN = re.compile(r"param\s*:\s*performance\s+cost\s+staff\s*:=")
+
+# Συνάρτηση find_problem_files για την ανάγνωση των path όλων των αρχείων προβλημάτων (.dat), εντός ενός φακέλου και των υποφακέλων του
+def find_problem_files(folder):
+
+    problems = []
+    for root, dirs, files in os.walk(folder):
+        for file in files:
+            if file.endswith(".dat"):
+                problems.append(os.path.join(root, file))
+    return problems
+
+# Συνάρτηση parse_data_capital_budgeting για την ανάγνωση δεδομένων από το αρχείο με ένα πέρασμα
+# Οι παράμετροι N, F, S και P διαβάζονται από την επικεφαλίδα και ο πίνακας των έργων (γραμμές "i performance cost staff" μέχρι το ;)
+# μετατρέπεται απευθείας σε πίνακα ακεραίων NumPy, χωρίς ενδιάμεσες λίστες
+def parse_data_capital_budgeting(filename):
+
+    # Ανάγνωση ολόκληρου του αρχείου
+    with open(filename, "rt") as f:
+        text = f.read()
+
+    return parse_data_text(text, filename)
+
+# Συνάρτηση parse_data_text για την ανάγνωση των δεδομένων από το κείμενο text ενός αρχείου προβλήματος (π.χ. που στάλθηκε στην υπηρεσία
+# επίλυσης), με το όνομα filename στα μηνύματα σφάλματος
+def parse_data_text(text, filename="<data>"):
+
+    # Ανάγνωση των παραμέτρων N, F, S και P
+    params = dict(PARAM_PATTERN.findall(text))
+    missing = [name for name in ("N", "F", "S", "P") if name not in params]
+    if missing:
+        raise ValueError(f"{filename}: missing parameters {', '.join(missing)}")
+    N, F, S, P = (int(params[name]) for name in ("N", "F", "S", "P"))
+
+    # Εντοπισμός του πίνακα των έργων, μετά την σειρά 'param: performance cost staff :=' και μέχρι το ;
+    header = TABLE_PATTERN.search(text)
+    if header is None:
+        raise ValueError(f"{filename}: missing 'param: performance cost staff :=' table")
+    table_end = text.find(";", header.end())
+    if table_end == -1:
+        table_end = len(text)
+
+    # Μετατροπή του πίνακα σε πίνακα ακεραίων με 4 στήλες (αριθμός έργου, performance, cost, staff)
+    # (όταν συναντήσει μη αριθμητικό κείμενο, η np.fromstring προειδοποιεί με DeprecationWarning, το οποίο μετατρέπεται σε σφάλμα, ή σε νεότερες
+    # εκδόσεις του numpy προκαλεί ValueError χωρίς το όνομα του αρχείου)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(text[header.end():table_end], dtype=np.int64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            raise ValueError(f"{filename}: project table contains non-integer values") from None
+    if len(values) % 4 != 0:
+        raise ValueError(f"{filename}: project table rows must have 4 columns")
+    project_data = values.reshape(-1, 4)
+
+    # Έλεγχος ότι ο αριθμός των γραμμών του πίνακα ταυτίζεται με το N
+    if len(project_data) != N:
+        raise ValueError(f"{filename}: N = {N} but the project table has {len(project_data)} rows")
+
+    # Εξαγωγή των στηλών στις οποίες ανήκουν τα δεδομένα performance, cost και staff των έργων (συνεχείς πίνακες)
+    performance = np.ascontiguousarray(project_data[:, 1])
+    cost = np.ascontiguousarray(project_data[:, 2])
+    staff = np.ascontiguousarray(project_data[:, 3])
+
+    return N, F, S, P, performance, cost, staff
+
+# Συνάρτηση cache_filename για το όνομα του αρχείου cache (.npz) που αντιστοιχεί σε ένα αρχείο προβλήματος
+def cache_filename(filename):
+
+    return filename + ".npz"
+
+# Συνάρτηση load_cache για την ανάγνωση των δεδομένων από το αρχείο cache, εφόσον υπάρχει και αντιστοιχεί στην τρέχουσα έκδοση του αρχείου
+# προβλήματος (ίδιο mtime και μέγεθος). Αλλιώς επιστρέφει None
+def load_cache(filename):
+
+    cache_file = cache_filename(filename)
+    if not os.path.exists(cache_file):
+        return None
+
+    stat = os.stat(filename)
+    try:
+        with np.load(cache_file) as data:
+            if int(data["mtime_ns"]) != stat.st_mtime_ns or int(data["size"]) != stat.st_size:
+                return None
+            N, F, S, P = (int(v) for v in data["params"])
+            return N, F, S, P, data["performance"], data["cost"], data["staff"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+# Συνάρτηση save_cache για την εγγραφή των δεδομένων στο αρχείο cache, μαζί με το mtime και το μέγεθος του αρχείου προβλήματος
+def save_cache(filename, N, F, S, P, performance, cost, staff):
+
+    stat = os.stat(filename)
+    cache_file = cache_filename(filename)
+    tmp_file = cache_file + ".tmp.npz"
+    np.savez(tmp_file, params=np.array([N, F, S, P], dtype=np.int64), performance=performance, cost=cost, staff=staff,
+             mtime_ns=np.int64(stat.st_mtime_ns), size=np.int64(stat.st_size))
+    os.replace(tmp_file, cache_file)
 
 # Συνάρτηση read_data_capital_budgeting για την ανάγνωση δεδομένων από το αρχείο
-def read_data_capital_budgeting(filename):
+# Αν cache = True (ή DATA_CACHE = True), τα δεδομένα διαβάζονται από το αρχείο cache (.npz) όταν αυτό αντιστοιχεί στο αρχείο προβλήματος, αλλιώς
+# γίνεται ανάγνωση του κειμένου και εγγραφή του cache. Ο χρόνος ανάγνωσης αποθηκεύεται στην global μεταβλητή parse_time
+def read_data_capital_budgeting(filename, cache=None):
 
-    # Άνοιγμα του αρχείου και αποθήκευση του στην λίστα lines (όπως είναι, γραμμή προς γραμμή)
-    with open(filename, "rt") as f:
-        lines = f.readlines()
-    
-    # Αφαίρεση κενών γραμμών και περιττών κενών από την λίστα lines
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # Ανάγνωση των παραμέτρων N, F, S και P από την λίστα lines
-    N = int(lines[0].split(":=")[1].strip().split(";")[0])
-    F = int(lines[1].split(":=")[1].strip().split(";")[0])
-    S = int(lines[2].split(":=")[1].strip().split(";")[0])
-    P = int(lines[3].split(":=")[1].strip().split(";")[0])
-    
-    # Εντοπισμός της γραμμής όπου ορίζονται οι παράμετροι performance, cost και staff για το κάθε έργο 
-    # (η γραμμή μετά την σειρά 'param: performance cost staff :=')
-    data_start_index = lines.index('param: performance cost staff :=') + 1
-
-    # Ανάγνωση της κάθε γραμμής δεδομένων (των δεδομένων του κάθε έργου) και αποθήκευση τους στην λίστα project_data (γραμμή προς γραμμή), 
-    # όσο δεν συναντάται το ;
-    project_data = []
-    for line in lines[data_start_index:]:
-        if line.strip() == ";":
-            break  # End of data
-        project_data.append(list(map(int, line.split())))
-
-    # Μετατροπή της λίστας project_data σε πίνακα
-    project_data = np.array(project_data)
-    
-    # Εξαγωγή των στηλών στις οποίες ανήκουν τα δεδομένα performance, cost και staff των έργων και αποθήκευση τους σε πίνακες
-    performance = project_data[:, 1]
-    cost = project_data[:, 2]
-    staff = project_data[:, 3]
-    
-    return N, F, S, P, performance, cost, staff
+    global parse_time
+    start = time.perf_counter()
+
+    if cache is None:
+        cache = DATA_CACHE
+
+    data = load_cache(filename) if cache else None
+    if data is None:
+        data = parse_data_capital_budgeting(filename)
+        if cache:
+            save_cache(filename, *data)
+
+    parse_time = time.perf_counter() - start
+    return data
 
 # Συνάρτηση capital_budgeting για την δημιουργία του μοντέλου
 def capital_budgeting(filename):
@@ -46,37 +144,35 @@ def capital_budgeting(filename):
     # Κλήση της συνάρτησης read_data_capital_budgeting για την ανάγνωση δεδομένων από το αρχείο
     N, F, S, P, performance, cost, staff = read_data_capital_budgeting(filename)
 
-    # Ορισμός των μεταβλητών (N έργα + 1 για το z)
-    num_vars = N + 1  
+    return capital_budgeting_from_arrays(N, F, S, P, performance, cost, staff)
 
-    # Αρχικοποίηση του μοντέλου
-    model = gp.Model()
+# Συνάρτηση capital_budgeting_from_arrays για την δημιουργία του μοντέλου του Gurobi απευθείας από τους πίνακες NumPy των δεδομένων, με το
+# matrix API του Gurobi (addMVar), χωρίς βρόχους Python ανά έργο
+def capital_budgeting_from_arrays(N, F, S, P, performance, cost, staff):
 
-    # Ορισμός άνω και κάτω ορίων για τις μεταβλητές 
-    # (τα κάτω όρια είναι 0 για τα έργα και το z, τα άνω όρια είναι 1 για τα έργα και άπειρο για το z)
-    ub = [1 if i < num_vars-1 else np.inf for i in range(num_vars) ] 
-    lb = [0 for i in range(num_vars) ]  
+    # Ορισμός των μεταβλητών (μία για κάθε έργο)
+    num_vars = N
 
-    # Εισαγωγή μεταβλητών στο μοντέλο (έργα + z) με τα άνω και τα κάτω όρια τους 
-    x = model.addVars(num_vars, lb=lb, ub=ub, vtype=GRB.CONTINUOUS, name="x")
+    # Αρχικοποίηση του μοντέλου
+    model = gp.Model()
 
-    # Περιορισμός για το διαθέσιμο κεφάλαιο
-    model.addConstr(gp.quicksum(cost[i] * x[i] for i in range(N)) <= F)
+    # Ορισμός άνω (1) και κάτω (0) ορίων για τις μεταβλητές
+    ub = np.ones(num_vars)
+    lb = np.zeros(num_vars)
 
-    # Περιορισμός για το διαθέσιμο προσωπικό
-    model.addConstr(gp.quicksum(staff[i] * x[i] for i in range(N)) <= S)
+    # Εισαγωγή των μεταβλητών στο μοντέλο με τα άνω και τα κάτω όρια τους
+    x = model.addMVar(num_vars, lb=lb, ub=ub, vtype=GRB.CONTINUOUS, name="x")
 
-    # Περιορισμός για τον μέγιστο αριθμό έργων που μπορούν να υλοποιηθούν
-    model.addConstr(gp.quicksum(x[i] for i in range(N)) <= P)
-    
-    # Ορισμός πίνακα c με τους συντελεστές της αντικειμενικής συνάρτησης
-    c = [performance[i] for i in range(num_vars - 1)] + [0]
+    # Περιορισμοί για το διαθέσιμο κεφάλαιο, το διαθέσιμο προσωπικό και τον μέγιστο αριθμό έργων που μπορούν να υλοποιηθούν, 
+    # ως ένας πίνακας συντελεστών 3 x N
+    A = np.vstack([cost, staff, np.ones(num_vars)]).astype(float)
+    model.addMConstr(A, x, GRB.LESS_EQUAL, np.array([F, S, P], dtype=float))
 
-    # Αντικειμενική συνάρτηση
-    model.setObjective(gp.quicksum(performance[i] * x[i] for i in range(N)))
+    # Πίνακας c με τους συντελεστές της αντικειμενικής συνάρτησης
+    c = np.asarray(performance, dtype=float)
 
-    # Μεγιστοποίηση αντικειμενικής συνάρτησης
-    model.ModelSense = GRB.MAXIMIZE 
+    # Αντικειμενική συνάρτηση (μεγιστοποίηση)
+    model.setObjective(c @ x, GRB.MAXIMIZE)
 
     # Χρήση του Dual Simplex αλγορίθμου του Gurobi
     model.Params.method = 1  
@@ -84,11 +180,51 @@ def capital_budgeting(filename):
     # Ενημέρωση του μοντέλου
     model.update()
 
-    # Ορισμός των μεταβλητών που πρέπει να έχουν ακέραιες τιμές
-    # (τα έργα πρέπει υποχρεωτικά να παίρνουν ακέραιες τιμές, επομένως True, ενώ το z δεν είναι υποχρεωτικό να παίρνει ακέραια τιμή, επομένως False)
-    integer_var = [True if i < num_vars-1 else False for i in range(num_vars)] 
+    # Ορισμός των μεταβλητών που πρέπει να έχουν ακέραιες τιμές (όλα τα έργα)
+    integer_var = np.ones(num_vars, dtype=bool)
+
+    return model, ub, lb, integer_var, num_vars, c
+
+# Συνάρτηση capital_budgeting_numpy για την δημιουργία του μοντέλου με την μηχανή LP του lp_relaxation (NumPy) αντί του Gurobi
+# Επιστρέφει τα ίδια στοιχεία με την συνάρτηση capital_budgeting, ώστε να μπορεί να χρησιμοποιηθεί στην θέση της
+def capital_budgeting_numpy(filename):
+
+    # Κλήση της συνάρτησης read_data_capital_budgeting για την ανάγνωση δεδομένων από το αρχείο
+    N, F, S, P, performance, cost, staff = read_data_capital_budgeting(filename)
+
+    return capital_budgeting_numpy_from_arrays(N, F, S, P, performance, cost, staff)
+
+# Συνάρτηση capital_budgeting_numpy_from_arrays για την δημιουργία του μοντέλου του lp_relaxation απευθείας από τους πίνακες των δεδομένων
+def capital_budgeting_numpy_from_arrays(N, F, S, P, performance, cost, staff):
+
+    # Ορισμός των μεταβλητών (μία για κάθε έργο)
+    num_vars = N
+
+    # Δημιουργία του μοντέλου
+    model = lp.CapitalBudgetingLP(performance, cost, staff, F, S, P)
+
+    # Ορισμός άνω και κάτω ορίων και των μεταβλητών που πρέπει να έχουν ακέραιες τιμές, όπως στην συνάρτηση capital_budgeting_from_arrays
+    ub = np.ones(num_vars)
+    lb = np.zeros(num_vars)
+    integer_var = np.ones(num_vars, dtype=bool)
+    c = np.asarray(performance, dtype=float)
+
+    return model, ub, lb, integer_var, num_vars, c
+
+# Συνάρτηση build_model για την δημιουργία του μοντέλου με την μηχανή LP που επιλέγεται ("gurobi" ή "numpy")
+def build_model(filename, engine="gurobi"):
+
+    if engine == "numpy":
+        return capital_budgeting_numpy(filename)
+    if engine == "gurobi":
+        return capital_budgeting(filename)
+    raise ValueError(f"Unknown LP engine: {engine}")
+
+# Συνάρτηση build_model_from_arrays για την δημιουργία του μοντέλου από τους πίνακες των δεδομένων με την μηχανή LP που επιλέγεται
+def build_model_from_arrays(N, F, S, P, performance, cost, staff, engine="gurobi"):
 
-    # Εμφάνιση του μοντέλου
-    model.display()  
-    
-    return model, ub, lb, integer_var, num_vars, c
\ No newline at end of file
+    if engine == "numpy":
+        return capital_budgeting_numpy_from_arrays(N, F, S, P, performance, cost, staff)
+    if engine == "gurobi":
+        return capital_budgeting_from_arrays(N, F, S, P, performance, cost, staff)
+    raise ValueError(f"Unknown LP engine: {engine}")
\ No newline at end of file
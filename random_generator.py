@@ -1,49 +1,95 @@
+import argparse
+import multiprocessing as mp
 import os
-import random
+
+import numpy as np
+
+import problems as pr
+
+# Αριθμός γραμμών του πίνακα των έργων που μορφοποιούνται και γράφονται μαζί στα αρχεία προβλημάτων
+WRITE_CHUNK = 65536
+
+# Συνάρτηση generate_instance για την τυχαία ανάθεση τιμών στις παραμέτρους performance, cost και staff N έργων, με μία κλήση της NumPy
+# (απόδοση στο [1, 100], κόστος στο [1, F] και προσωπικό στο [1, S]) από την γεννήτρια rng
+def generate_instance(rng, N, F, S):
+
+    values = rng.integers(1, np.array([101, F + 1, S + 1]), size=(N, 3))
+    return values[:, 0], values[:, 1], values[:, 2]
+
+# Συνάρτηση write_data_file για την εγγραφή ενός αρχείου προβλήματος (.dat), με μία μορφοποίηση και μία εγγραφή για κάθε τμήμα WRITE_CHUNK
+# γραμμών του πίνακα των έργων, ώστε η μνήμη να μην εξαρτάται από τον αριθμό των έργων
+# Αν binary = True, γράφεται και το αρχείο cache (.npz) του problems δίπλα στο αρχείο, ώστε η πρώτη ανάγνωση να μην χρειάζεται parsing
+def write_data_file(filename, N, F, S, P, performance, cost, staff, binary=False):
+
+    with open(filename, "w") as f:
+        f.write(f"param N := {N};\nparam F := {F};\nparam S := {S};\nparam P := {P};\n\nparam: performance cost staff :=\n")
+        for first in range(0, N, WRITE_CHUNK):
+            last = min(first + WRITE_CHUNK, N)
+            rows = np.column_stack((np.arange(first + 1, last + 1), performance[first:last], cost[first:last], staff[first:last]))
+            f.write("%d %d %d %d\n" * (last - first) % tuple(rows.ravel().tolist()))
+        f.write(";\n")
+    if binary:
+        pr.save_cache(filename, N, F, S, P, np.ascontiguousarray(performance), np.ascontiguousarray(cost),
+                      np.ascontiguousarray(staff))
+
+# Συνάρτηση generate_class για την δημιουργία του φακέλου μιας κλάσης με problems_per_class αρχεία προβλημάτων, από την ακολουθία σπόρων
+# seed_sequence της κλάσης. Οι παράμετροι N, F, S και P είναι κοινές για όλα τα αρχεία της κλάσης, ενώ κάθε αρχείο έχει δική του γεννήτρια
+def generate_class(folder, cls, problems_per_class, seed_sequence, num_projects=(8000, 9000), binary=False):
+
+    # Δημιουργία φακέλου κλάσης εφόσον δεν υπάρχει, αλλιώς εγγραφή από πάνω
+    class_folder = os.path.join(folder, f"class_{cls}")
+    os.makedirs(class_folder, exist_ok=True)
+
+    # Τυχαία ανάθεση τιμών στις παραμέτρους N, F, S και P
+    class_seed, *problem_seeds = seed_sequence.spawn(problems_per_class + 1)
+    rng = np.random.default_rng(class_seed)
+    N = int(rng.integers(num_projects[0], num_projects[1] + 1)) # Αριθμός έργων
+    F = int(rng.integers(1, 100001))                             # Διαθέσιμο κεφάλαιο
+    S = int(rng.integers(1, 1001))                               # Διαθέσιμο προσωπικό
+    P = int(rng.integers(1, N + 1))                              # Μέγιστος αριθμός έργων που μπορούν να υλοποιηθούν
+
+    # Δημιουργία ενός αρχείου προβλήματος για κάθε σπόρο
+    for prob, problem_seed in enumerate(problem_seeds, start=1):
+        performance, cost, staff = generate_instance(np.random.default_rng(problem_seed), N, F, S)
+        write_data_file(os.path.join(class_folder, f"problem_{prob}.dat"), N, F, S, P, performance, cost, staff, binary)
 
 # Συνάρτηση generate_data_files για την δημιουργία φακέλων κλάσεων από αρχεία προβλημάτων, εντός ενός φακέλου
-def generate_data_files(num_classes, problems_per_class, folder):
+# Κάθε κλάση παίρνει δική της ακολουθία σπόρων από τον σπόρο seed, επομένως τα αρχεία είναι ίδια για τον ίδιο σπόρο ανεξάρτητα από τον
+# αριθμό των διεργασιών num_workers που δημιουργούν τις κλάσεις παράλληλα. Με seed = None επιλέγεται τυχαίος σπόρος, ο οποίος επιστρέφεται
+def generate_data_files(num_classes, problems_per_class, folder, seed=None, num_workers=None, num_projects=(8000, 9000), binary=False):
 
     # Δημιουργία φακέλου εφόσον δεν υπάρχει, αλλιώς εγγραφή από πάνω
     os.makedirs(folder, exist_ok=True)
 
-    # Βρόχος για δημιουργία ενός φακέλου κλάσης στην κάθε επανάληψη
-    for cls in range(1, num_classes + 1):
-
-        # Δημιουργία φακέλου κλάσης εφόσον δεν υπάρχει, αλλιώς εγγραφή από πάνω
-        class_folder = os.path.join(folder, f"class_{cls}")
-        os.makedirs(class_folder, exist_ok=True)
-
-        # Τυχαία ανάθεση τιμών στις παραμέτρους N, F, S και P
-        N = random.randint(8000, 9000) # Αριθμός έργων (για εκτέλεση του branch_and_bound περίπου 5 με 6 ώρες)
-        F = random.randint(1, 100000)  # Διαθέσιμο κεφάλαιο 
-        S = random.randint(1, 1000)    # Διαθέσιμο προσωπικό 
-        P = random.randint(1, N)       # Μέγιστος αριθμός έργων που μπορούν να υλοποιηθούν 
- 
-        # Βρόχος για δημιουργία ενός αρχείου προβλήματος στην κάθε επανάληψη
-        for prob in range(1, problems_per_class + 1):
-
-            # Δημιουργία αρχείου προβλήματος και άνοιγμα του κάθε αρχείου
-            filename = os.path.join(class_folder, f"problem_{prob}.dat")
-            with open(filename, "w") as f:
-                
-                # Εγγραφή των παραμέτρων N, F, S και P στο αρχείο 
-                f.write(f"param N := {N};\n")
-                f.write(f"param F := {F};\n")
-                f.write(f"param S := {S};\n")
-                f.write(f"param P := {P};\n\n")
-                
-                # Τυχαία ανάθεση τιμών στις παραμέτρους perfomance, cost και staff και εγγραφή τους στο αρχείο
-                f.write("param: performance cost staff :=\n")
-                for i in range(1, N + 1):
-                    performance = random.randint(1, 100)  # Απόδοση
-                    cost = random.randint(1, F)           # Κόστος
-                    staff = random.randint(1, S)          # Προσωπικό
-                    f.write(f"{i} {performance} {cost} {staff}\n")
-                f.write(";\n")
-    
+    seed_sequence = np.random.SeedSequence(seed)
+    jobs = [(folder, cls, problems_per_class, class_sequence, num_projects, binary)
+            for cls, class_sequence in enumerate(seed_sequence.spawn(num_classes), start=1)]
+
+    if num_workers is None:
+        num_workers = os.cpu_count()
+    if num_workers > 1 and num_classes > 1:
+        with mp.Pool(min(num_workers, num_classes)) as pool:
+            pool.starmap(generate_class, jobs)
+    else:
+        for job in jobs:
+            generate_class(*job)
+
     # Ενημέρωση για την επιτυχή δημιουργία
-    print(f"Generated {num_classes * problems_per_class} problems in {folder}/")
+    print(f"Generated {num_classes * problems_per_class} problems in {folder}/ (seed {seed_sequence.entropy})")
+    return seed_sequence.entropy
+
+if __name__ == "__main__":
+
+    # Δημιουργία 10 φακέλων κλάσεων από 10 αρχεία προβλημάτων στον καθένα, εντός του φακέλου problems (από προεπιλογή)
+    parser = argparse.ArgumentParser(description="Generate random capital budgeting problem files")
+    parser.add_argument("folder", nargs="?", default="problems")
+    parser.add_argument("--classes", type=int, default=10)
+    parser.add_argument("--problems", type=int, default=10, help="problem files per class")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--projects", nargs=2, type=int, default=[8000, 9000], metavar=("MIN", "MAX"),
+                        help="range of the number of projects N")
+    parser.add_argument("--binary", action="store_true", help="also write the .npz cache of every problem file")
+    args = parser.parse_args()
 
-# Κλήση της συνάρτησης generate_data_files για την δημιουργία 10 φακέλων κλάσεων από 10 αρχεία προβλημάτων στον καθένα, εντός του φακέλου problems
-generate_data_files(10, 10, "problems")
\ No newline at end of file
+    generate_data_files(args.classes, args.problems, args.folder, args.seed, args.workers, tuple(args.projects), args.binary)
@@ -0,0 +1,124 @@
+import hashlib
+import json
+
+import numpy as np
+
+# Μέγιστος αριθμός λύσεων που κρατά το pool (οι καλύτερες ως προς την τιμή της αντικειμενικής συνάρτησης)
+POOL_SIZE = 10
+
+# Κλάση PoolSolution με μια λύση του pool: οι μεταβλητές με τιμή 1 ως bitset (np.packbits, ένα bit ανά μεταβλητή), η τιμή της αντικειμενικής
+# συνάρτησης, το βάθος του κόμβου και ο χρόνος (σε δευτερόλεπτα από την αρχή της αναζήτησης) που βρέθηκε, η πηγή της ("branch_and_bound" ή
+# όνομα ευρετικής) και το hash του bitset για τον εντοπισμό των διπλότυπων
+# Οι μεταβλητές θεωρούνται δυαδικές (όπως τα έργα του capital budgeting), επομένως η λύση ανακατασκευάζεται πλήρως από το bitset
+class PoolSolution:
+    __slots__ = ("objective", "bits", "num_vars", "depth", "time", "source", "key")
+
+    def __init__(self, objective, bits, num_vars, depth, time, source, key):
+        self.objective = objective
+        self.bits = bits
+        self.num_vars = num_vars
+        self.depth = depth
+        self.time = time
+        self.source = source
+        self.key = key
+
+    # Οι θέσεις των μεταβλητών με τιμή 1 (τα έργα που επιλέγονται)
+    def selected(self):
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.num_vars))
+
+    # Η λύση ως πλήρης πίνακας τιμών των μεταβλητών
+    def x(self):
+        return np.unpackbits(self.bits, count=self.num_vars).astype(float)
+
+    def __repr__(self):
+        return f"PoolSolution(objective={self.objective}, selected={len(self.selected())}, depth={self.depth}, source={self.source!r})"
+
+# Συνάρτηση solution_key για το hash (σταθερό μεταξύ εκτελέσεων, ώστε να ισχύει και μετά από συνέχιση από checkpoint) του bitset μιας λύσης
+def solution_key(bits):
+
+    return hashlib.blake2b(bits.tobytes(), digest_size=8).digest()
+
+# Κλάση SolutionPool που κρατά τις capacity καλύτερες διαφορετικές λύσεις που βρίσκει η αναζήτηση, ταξινομημένες από την καλύτερη (θέση 0)
+# προς την χειρότερη. Οι λύσεις που υπάρχουν ήδη στο pool (ίδιο hash) και οι λύσεις που δεν είναι καλύτερες από την χειρότερη ενός γεμάτου
+# pool απορρίπτονται. Το found μετρά όλες τις λύσεις που δόθηκαν στην add
+class SolutionPool:
+
+    def __init__(self, isMax=True, capacity=POOL_SIZE):
+        self.isMax = isMax
+        self.capacity = capacity
+        self.solutions = []
+        self.keys = set()
+        self.found = 0
+
+    def __len__(self):
+        return len(self.solutions)
+
+    def __iter__(self):
+        return iter(self.solutions)
+
+    def __getitem__(self, index):
+        return self.solutions[index]
+
+    # Συνάρτηση sort_key για το κλειδί ταξινόμησης μιας τιμής obj (μικρότερο για καλύτερη τιμή)
+    def sort_key(self, obj):
+        return -obj if self.isMax else obj
+
+    # Συνάρτηση add για την προσθήκη της λύσης x (τιμή obj) που βρέθηκε σε κόμβο βάθους depth τη χρονική στιγμή time από την πηγή source
+    # Επιστρέφει True αν η λύση κρατήθηκε στο pool
+    def add(self, x, obj, depth, time, source="branch_and_bound"):
+
+        self.found += 1
+        x = np.asarray(x, dtype=float)
+        bits = np.packbits(x > 0.5)
+        key = solution_key(bits)
+        if key in self.keys:
+            return False
+        if len(self.solutions) >= self.capacity and self.sort_key(obj) >= self.sort_key(self.solutions[-1].objective):
+            return False
+
+        # Εισαγωγή μετά τις λύσεις με ίδια ή καλύτερη τιμή, ώστε μεταξύ ίσων τιμών να προηγείται η λύση που βρέθηκε πρώτη
+        position = len(self.solutions)
+        while position > 0 and self.sort_key(self.solutions[position - 1].objective) > self.sort_key(obj):
+            position -= 1
+        self.solutions.insert(position, PoolSolution(float(obj), bits, len(x), depth, time, source, key))
+        self.keys.add(key)
+        if len(self.solutions) > self.capacity:
+            self.keys.discard(self.solutions.pop().key)
+        return True
+
+    # Η καλύτερη λύση του pool (None αν το pool είναι άδειο)
+    def best(self):
+        return self.solutions[0] if self.solutions else None
+
+    # Συνάρτηση expanded για την δημιουργία ενός pool με τις λύσεις μετά την μετατροπή τους με τις συναρτήσεις expand (λύση) και objective
+    # (τιμή), π.χ. από λύσεις του προβλήματος μετά το presolve σε λύσεις του αρχικού προβλήματος
+    def expanded(self, expand, objective):
+
+        pool = SolutionPool(self.isMax, self.capacity)
+        for solution in self.solutions:
+            pool.add(expand(solution.x()), objective(solution.objective), solution.depth, solution.time, solution.source)
+        pool.found = self.found
+        return pool
+
+    # Συνάρτηση to_dict για την αναπαράσταση του pool με τις θέσεις των επιλεγμένων έργων κάθε λύσης (για εξαγωγή σε JSON)
+    def to_dict(self):
+
+        return {"sense": "max" if self.isMax else "min", "found": self.found,
+                "solutions": [{"objective": solution.objective, "selected": solution.selected().tolist(), "depth": solution.depth,
+                               "time": round(solution.time, 6), "source": solution.source} for solution in self.solutions]}
+
+    # Συνάρτηση save για την εξαγωγή του pool στο αρχείο filename: σε συμπιεσμένο αρχείο NumPy αν η κατάληξη είναι .npz (τα bitsets ως πίνακας
+    # uint8 με μία γραμμή ανά λύση), αλλιώς σε JSON με τις θέσεις των επιλεγμένων έργων
+    def save(self, filename):
+
+        if filename.endswith(".npz"):
+            num_vars = self.solutions[0].num_vars if self.solutions else 0
+            np.savez_compressed(filename, num_vars=num_vars, found=self.found, isMax=self.isMax,
+                                bits=np.array([solution.bits for solution in self.solutions], dtype=np.uint8).reshape(len(self), -1),
+                                objective=np.array([solution.objective for solution in self.solutions], dtype=float),
+                                depth=np.array([solution.depth for solution in self.solutions], dtype=np.int64),
+                                time=np.array([solution.time for solution in self.solutions], dtype=float),
+                                source=np.array([solution.source for solution in self.solutions], dtype=str))
+        else:
+            with open(filename, "w") as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
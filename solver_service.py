@@ -0,0 +1,495 @@
+import argparse
+import asyncio
+import importlib
+import itertools
+import json
+import multiprocessing as mp
+import multiprocessing.connection
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+import branching as br
+import limits as lim
+import node_selection as ns
+import presolve as ps
+import problems as pr
+
+# Υπηρεσία επίλυσης: ένας asyncio server (Unix socket ή TCP στο localhost) που δέχεται προβλήματα capital budgeting, τα μοιράζει σε διεργασίες
+# επίλυσης (workers) που παραμένουν ενεργές μεταξύ των εργασιών, και στέλνει στον client γεγονότα προόδου μέχρι το αποτέλεσμα
+# Το πρωτόκολλο είναι ένα αντικείμενο JSON ανά γραμμή προς κάθε κατεύθυνση. Αιτήματα του client:
+#   {"op": "submit", "engine": "branch_and_bound" ή "pyomo", "instance": {...}, "time_limit": 60, "branching": "pseudocost", "tag": ...}
+#   {"op": "cancel", "job": <αριθμός εργασίας>}
+#   {"op": "ping"}
+# όπου το instance είναι {"dat": <κείμενο αρχείου .dat>}, {"path": <αρχείο .dat του server>} ή πίνακες JSON
+# {"F": ..., "S": ..., "P": ..., "performance": [...], "cost": [...], "staff": [...]}
+# Γεγονότα του server (όλα με τον αριθμό εργασίας "job" και το "tag" του αιτήματος, αν δόθηκε): "queued", "started", "progress" (κόμβοι,
+# καλύτερη λύση, bound, gap), "incumbent" (νέα καλύτερη λύση), και τέλος "done" (κατάσταση, λύση, bound, κόμβοι, χρόνος) ή "error"
+# Οι εργασίες μιας σύνδεσης που κλείνει ακυρώνονται
+
+# Δήλωση global μεταβλητών
+SOCKET_PATH = "capital_budgeting.sock" # διαδρομή του Unix socket της υπηρεσίας (σε συστήματα χωρίς Unix sockets χρησιμοποιείται TCP με --port)
+HOST = "127.0.0.1"    # διεύθυνση της υπηρεσίας όταν χρησιμοποιείται TCP
+NUM_WORKERS = os.cpu_count() # αριθμός των διεργασιών επίλυσης
+ENGINES = ("branch_and_bound", "pyomo") # αλγόριθμοι επίλυσης: branch and bound του 2-branch_and_bound.py ή το γρήγορο Pyomo του 1-pyomo.py
+PROGRESS_INTERVAL = 0.5 # κάθε πόσα δευτερόλεπτα στέλνεται γεγονός προόδου κατά την αναζήτηση branch and bound
+CANCEL_GRACE = 2.0    # δευτερόλεπτα αναμονής για τον τερματισμό μιας εργασίας που ακυρώθηκε, πριν την διακοπή και επανεκκίνηση του worker
+EVENT_POLL_INTERVAL = 0.1 # μέγιστος χρόνος αναμονής (σε δευτερόλεπτα) για γεγονότα των workers, πριν ανανεωθεί η λίστα των pipes τους
+MAX_REQUEST_SIZE = 2**26 # μέγιστο μέγεθος (σε bytes) μιας γραμμής αιτήματος (π.χ. με το κείμενο ενός μεγάλου αρχείου .dat)
+CANCELLED = "cancelled" # κατάσταση μιας εργασίας που ακυρώθηκε
+
+# Συνάρτηση finite για την μετατροπή μιας τιμής σε float για το JSON (None για τιμές που λείπουν ή δεν είναι πεπερασμένες)
+def finite(value):
+
+    if value is None or not np.isfinite(value):
+        return None
+    return float(value)
+
+# Συνάρτηση read_instance για την ανάγνωση των δεδομένων (N, F, S, P, performance, cost, staff) ενός προβλήματος από το instance ενός αιτήματος
+def read_instance(instance):
+
+    if "dat" in instance:
+        return pr.parse_data_text(instance["dat"], "<request>")
+    if "path" in instance:
+        return pr.read_data_capital_budgeting(instance["path"])
+
+    missing = [name for name in ("F", "S", "P", "performance", "cost", "staff") if name not in instance]
+    if missing:
+        raise ValueError(f"instance: missing fields {', '.join(missing)}")
+    performance, cost, staff = (np.asarray(instance[name], dtype=np.int64).ravel() for name in ("performance", "cost", "staff"))
+    N = len(performance)
+    if len(cost) != N or len(staff) != N or int(instance.get("N", N)) != N:
+        raise ValueError(f"instance: N = {instance.get('N', N)} but the arrays have {N}, {len(cost)} and {len(staff)} projects")
+    return N, int(instance["F"]), int(instance["S"]), int(instance["P"]), performance, cost, staff
+
+# Κλάση ProgressLimits που επεκτείνει τα όρια τερματισμού της αναζήτησης (limits.Limits) με την ακύρωση της εργασίας (cancel, multiprocessing.Event)
+# και την αποστολή ενός γεγονότος προόδου με την συνάρτηση emit κάθε interval δευτερόλεπτα. Η check καλείται από τον branch and bound πριν από
+# κάθε κόμβο. Οι τιμές αφορούν το μειωμένο πρόβλημα του presolve και μετατρέπονται με την σταθερή απόδοση offset των έργων που σταθεροποιήθηκαν
+class ProgressLimits(lim.Limits):
+
+    def __init__(self, emit, cancel, offset=0.0, time_limit=None, interval=PROGRESS_INTERVAL):
+        self.emit = emit
+        self.cancel = cancel
+        self.offset = offset
+        self.interval = interval
+        super().__init__(time_limit)
+
+    def start(self):
+        super().start()
+        self.next_progress = self.start_time + self.interval
+
+    def check(self, nodes, open_memory, incumbent, bound):
+
+        if self.cancel.is_set():
+            return CANCELLED
+        now = time.perf_counter()
+        if now >= self.next_progress:
+            self.next_progress = now + self.interval
+            incumbent_value, bound_value = incumbent + self.offset, None if bound is None else bound + self.offset
+            self.emit({"event": "progress", "nodes": nodes, "incumbent": finite(incumbent_value), "bound": finite(bound_value),
+                       "gap": finite(ns.relative_gap(incumbent_value, bound_value)), "elapsed": now - self.start_time})
+        return super().check(nodes, open_memory, incumbent, bound)
+
+# Συνάρτηση solve_branch_and_bound για την επίλυση του προβλήματος data μιας εργασίας job με τον branch and bound του module bb, μετά το presolve
+# Επιστρέφει το γεγονός "done" της εργασίας
+def solve_branch_and_bound(bb, data, job, emit, cancel):
+
+    reduced, reduction = ps.presolve_capital_budgeting(*data)
+    model, ub, lb, integer_var, num_vars, c = pr.build_model_from_arrays(*reduced, engine=bb.LP_ENGINE)
+    bb.isMax = True
+
+    def on_incumbent(obj, x, source, nodes):
+        emit({"event": "incumbent", "objective": finite(reduction.objective(obj)), "source": source, "nodes": nodes})
+
+    limits = ProgressLimits(emit, cancel, reduction.offset, job.get("time_limit"))
+    bb.branch_and_bound(model, ub, lb, integer_var, limits=limits, incumbent_callback=on_incumbent, branching=job.get("branching"))
+    result = bb.result
+    selected = None if result.solution is None else np.flatnonzero(reduction.expand(result.solution) > 0.5).tolist()
+    objective = None if result.objective is None else reduction.objective(result.objective)
+    bound = None if result.bound is None else reduction.objective(result.bound)
+    return {"event": "done", "status": result.status, "objective": finite(objective), "bound": finite(bound),
+            "gap": finite(ns.relative_gap(objective, bound)), "nodes": result.nodes, "time": result.time, "selected": selected}
+
+# Συνάρτηση solve_pyomo για την επίλυση του προβλήματος data με το αντικείμενο PersistentPyomo (ένας persistent solver ανά μέγεθος N, που
+# διατηρείται μεταξύ των εργασιών του worker), με χρονικό όριο time_limit δευτερόλεπτα. Επιστρέφει το γεγονός "done" της εργασίας
+def solve_pyomo(persistent, data, time_limit=None):
+
+    start = time.perf_counter()
+    status, objective, selected = persistent.solve_data(data, time_limit)
+    return {"event": "done", "status": status, "objective": objective, "bound": None, "gap": None, "nodes": None,
+            "time": time.perf_counter() - start, "selected": None if selected is None else selected.tolist()}
+
+# Συνάρτηση worker_main που εκτελείται σε κάθε διεργασία επίλυσης: τα modules, η άδεια του Gurobi και ο persistent solver του Pyomo φορτώνονται
+# μία φορά, και έπειτα εκτελούνται οι εργασίες της ουράς jobs (μέχρι το None). Τα γεγονότα στέλνονται στο δικό του pipe connection events
+# ως (worker, εργασία, γεγονός) και η ακύρωση της τρέχουσας εργασίας γίνεται με το cancel. Η έξοδος της διεργασίας απορρίπτεται
+def worker_main(index, jobs, events, cancel, lp_engine=None, engines=ENGINES):
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+
+    bb = importlib.import_module("2-branch_and_bound")
+    if lp_engine is not None:
+        bb.LP_ENGINE = lp_engine
+    # Δημιουργία ενός μοντέλου ενός έργου, ώστε η άδεια και το περιβάλλον του Gurobi να φορτωθούν πριν την πρώτη εργασία
+    pr.build_model_from_arrays(1, 1, 1, 1, [1], [1], [1], engine=bb.LP_ENGINE)
+    persistent = importlib.import_module("1-pyomo").PersistentPyomo() if "pyomo" in engines else None
+    events.send((index, None, {"event": "ready"}))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+
+        def emit(event, job_id=job["job"]):
+            events.send((index, job_id, event))
+
+        emit({"event": "started", "worker": index, "pid": os.getpid()})
+        try:
+            data = read_instance(job["instance"])
+            if job["engine"] == "pyomo":
+                emit(solve_pyomo(persistent, data, job.get("time_limit")))
+            else:
+                emit(solve_branch_and_bound(bb, data, job, emit, cancel))
+        except Exception as e:
+            emit({"event": "error", "message": f"{type(e).__name__}: {e}"})
+
+# Κλάση Job με μια εργασία της υπηρεσίας: αριθμός, αίτημα, η σύνδεση (writer) στην οποία στέλνονται τα γεγονότα και ο worker που την εκτελεί
+class Job:
+    __slots__ = ("id", "request", "writer", "worker", "finished")
+
+    def __init__(self, job_id, request, writer):
+        self.id = job_id
+        self.request = request
+        self.writer = writer
+        self.worker = None
+        self.finished = False
+
+# Κλάση Worker με μια διεργασία επίλυσης, την ουρά εργασιών της, το pipe connection από το οποίο διαβάζονται τα γεγονότα της (None όταν
+# έκλεισε), το Event ακύρωσης και την εργασία που εκτελεί (None αν είναι ελεύθερη)
+class Worker:
+    __slots__ = ("process", "jobs", "events", "cancel", "job")
+
+    def __init__(self, process, jobs, events, cancel):
+        self.process = process
+        self.jobs = jobs
+        self.events = events
+        self.cancel = cancel
+        self.job = None
+
+# Συνάρτηση receive_events (εκτελείται σε thread) για την αναμονή έως timeout δευτερόλεπτα για γεγονότα στα pipe connections connections
+# Επιστρέφει τα γεγονότα που διαβάστηκαν και τα connections που έκλεισαν (π.χ. επειδή ο worker τους τερμάτισε ή διακόπηκε)
+def receive_events(connections, timeout):
+
+    items, closed = [], []
+    for connection in mp.connection.wait(connections, timeout):
+        try:
+            items.append(connection.recv())
+        except (EOFError, OSError):
+            closed.append(connection)
+    return items, closed
+
+# Κλάση SolverService που υλοποιεί τον server: οι εργασίες μπαίνουν σε ουρά FIFO και ανατίθενται στους ελεύθερους workers, τα γεγονότα των
+# workers προωθούνται στις συνδέσεις των εργασιών, και οι workers που τερματίζουν (ή διακόπτονται μετά από ακύρωση) ξεκινούν ξανά
+# Κάθε worker στέλνει τα γεγονότα του στο δικό του pipe, ώστε η διακοπή ενός worker κατά την αποστολή να μην επηρεάζει τους υπόλοιπους
+class SolverService:
+
+    def __init__(self, num_workers=NUM_WORKERS, lp_engine=None, engines=ENGINES):
+        # Οι workers ξεκινούν με spawn, ώστε να μην αντιγράφεται (fork) η διεργασία του server με τα threads του asyncio
+        self.context = mp.get_context("spawn")
+        self.num_workers = num_workers
+        self.lp_engine = lp_engine
+        self.engines = engines
+        self.workers = []
+        self.pending = deque()
+        self.jobs = {}
+        self.ids = itertools.count(1)
+
+    # Συνάρτηση start_worker για την εκκίνηση (ή επανεκκίνηση) του worker στην θέση index
+    def start_worker(self, index):
+
+        jobs = self.context.Queue()
+        receiver, sender = self.context.Pipe(duplex=False)
+        cancel = self.context.Event()
+        process = self.context.Process(target=worker_main, args=(index, jobs, sender, cancel, self.lp_engine, self.engines),
+                                       daemon=True)
+        process.start()
+        # Το άκρο αποστολής κλείνει στον server, ώστε ο τερματισμός του worker να κλείνει το pipe
+        sender.close()
+        worker = Worker(process, jobs, receiver, cancel)
+        if index < len(self.workers):
+            self.workers[index] = worker
+        else:
+            self.workers.append(worker)
+
+    # Συνάρτηση send για την αποστολή ενός γεγονότος της εργασίας job στην σύνδεσή της (αν είναι ακόμα ανοιχτή)
+    def send(self, job, event):
+
+        message = {"job": job.id, **event}
+        if "tag" in job.request:
+            message["tag"] = job.request["tag"]
+        if not job.writer.is_closing():
+            job.writer.write((json.dumps(message) + "\n").encode())
+
+    # Συνάρτηση dispatch για την ανάθεση των εργασιών της ουράς στους ελεύθερους workers
+    def dispatch(self):
+
+        for index, worker in enumerate(self.workers):
+            if not self.pending:
+                break
+            if worker.job is None and worker.process.is_alive():
+                job = self.pending.popleft()
+                worker.cancel.clear()
+                worker.job = job
+                job.worker = index
+                request = job.request
+                worker.jobs.put({"job": job.id, "engine": request.get("engine", "branch_and_bound"), "instance": request["instance"],
+                                 "time_limit": request.get("time_limit"), "branching": request.get("branching")})
+
+    # Συνάρτηση finish για την ολοκλήρωση της εργασίας job, με το τελικό γεγονός event, και την ανάθεση της επόμενης εργασίας στον worker της
+    def finish(self, job, event):
+
+        self.send(job, event)
+        job.finished = True
+        self.jobs.pop(job.id, None)
+        if job.worker is not None and self.workers[job.worker].job is job:
+            self.workers[job.worker].job = None
+        self.dispatch()
+
+    # Συνάρτηση on_event για την προώθηση ενός γεγονότος του worker index για την εργασία job_id (τα γεγονότα εργασιών που έχουν ήδη
+    # ολοκληρωθεί, π.χ. μετά από ακύρωση, αγνοούνται)
+    def on_event(self, index, job_id, event):
+
+        job = self.jobs.get(job_id)
+        if job is None or job.worker != index or job.finished:
+            return
+        if event["event"] in ("done", "error"):
+            self.finish(job, event)
+        else:
+            self.send(job, event)
+
+    # Συνάρτηση pump_events για την ανάγνωση των γεγονότων από τα pipes των workers (σε thread, καθώς τα pipes του multiprocessing δεν είναι
+    # asyncio). Η λίστα των pipes ανανεώνεται σε κάθε αναμονή, ώστε να περιλαμβάνει τους workers που ξεκίνησαν ξανά
+    async def pump_events(self):
+
+        loop = asyncio.get_running_loop()
+        while True:
+            connections = [worker.events for worker in self.workers if worker.events is not None]
+            items, closed = await loop.run_in_executor(None, receive_events, connections, EVENT_POLL_INTERVAL)
+            for worker in self.workers:
+                if worker.events is not None and any(worker.events is connection for connection in closed):
+                    worker.events = None
+            for item in items:
+                self.on_event(*item)
+
+    # Συνάρτηση monitor για τον εντοπισμό των workers που τερμάτισαν απρόσμενα: η εργασία τους ολοκληρώνεται με σφάλμα και ξεκινούν ξανά
+    async def monitor(self):
+
+        while True:
+            await asyncio.sleep(0.5)
+            for index, worker in enumerate(self.workers):
+                if not worker.process.is_alive():
+                    if worker.job is not None:
+                        job = worker.job
+                        worker.job = None
+                        self.finish(job, {"event": "error", "message": f"worker exited with code {worker.process.exitcode}"})
+                    self.start_worker(index)
+            self.dispatch()
+
+    # Συνάρτηση cancel για την ακύρωση της εργασίας job: μια εργασία της ουράς αφαιρείται, ενώ σε μια εργασία που εκτελείται ο branch and bound
+    # τερματίζει στον επόμενο κόμβο. Αν η εργασία δεν τερματίσει μέσα σε CANCEL_GRACE δευτερόλεπτα (π.χ. επίλυση με το Pyomo), ο worker
+    # διακόπτεται και ξεκινά ξανά
+    def cancel(self, job):
+
+        if job.finished:
+            return
+        if job.worker is None:
+            self.pending.remove(job)
+            self.finish(job, {"event": "done", "status": CANCELLED})
+            return
+        self.workers[job.worker].cancel.set()
+        asyncio.get_running_loop().call_later(CANCEL_GRACE, self.kill_if_running, job)
+
+    # Συνάρτηση kill_if_running για την διακοπή του worker μιας εργασίας που ακυρώθηκε και δεν έχει τερματίσει
+    def kill_if_running(self, job):
+
+        if job.finished:
+            return
+        index = job.worker
+        worker = self.workers[index]
+        worker.process.terminate()
+        worker.process.join(1.0)
+        worker.job = None
+        self.start_worker(index)
+        self.finish(job, {"event": "done", "status": CANCELLED})
+
+    # Συνάρτηση handle_client για την εξυπηρέτηση μιας σύνδεσης: ανάγνωση των αιτημάτων (ένα αντικείμενο JSON ανά γραμμή) και ακύρωση των
+    # εργασιών της σύνδεσης όταν αυτή κλείσει
+    async def handle_client(self, reader, writer):
+
+        own = []
+
+        def reply(message):
+            writer.write((json.dumps(message) + "\n").encode())
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError) as e:
+                    reply({"event": "error", "message": f"{type(e).__name__}: {e}"})
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    reply({"event": "error", "message": f"invalid request: {e}"})
+                    continue
+
+                op = request.get("op")
+                if op == "submit":
+                    engine = request.get("engine", "branch_and_bound")
+                    if engine not in self.engines:
+                        reply({"event": "error", "message": f"unknown engine {engine!r}, expected one of {', '.join(self.engines)}"})
+                    elif not isinstance(request.get("instance"), dict):
+                        reply({"event": "error", "message": "submit needs an 'instance' object"})
+                    elif request.get("branching") is not None and request["branching"] not in br.RULES:
+                        reply({"event": "error", "message": f"unknown branching rule {request['branching']!r}"})
+                    else:
+                        job = Job(next(self.ids), request, writer)
+                        self.jobs[job.id] = job
+                        own.append(job)
+                        self.pending.append(job)
+                        self.send(job, {"event": "queued", "position": len(self.pending)})
+                        self.dispatch()
+                elif op == "cancel":
+                    job = self.jobs.get(request.get("job"))
+                    if job is None or job.writer is not writer:
+                        reply({"event": "error", "message": f"unknown job {request.get('job')!r}"})
+                    else:
+                        self.cancel(job)
+                elif op == "ping":
+                    reply({"event": "pong", "workers": len(self.workers), "running": sum(w.job is not None for w in self.workers),
+                           "queued": len(self.pending)})
+                else:
+                    reply({"event": "error", "message": f"unknown op {op!r}"})
+                # Ο client μπορεί να έχει κλείσει την σύνδεση πριν σταλούν οι απαντήσεις
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+        finally:
+            for job in own:
+                self.cancel(job)
+            writer.close()
+
+    # Συνάρτηση serve για την εκκίνηση των workers και του server, σε Unix socket (path) ή σε TCP (port)
+    async def serve(self, path=SOCKET_PATH, port=None):
+
+        for index in range(self.num_workers):
+            self.start_worker(index)
+        tasks = [asyncio.create_task(self.pump_events()), asyncio.create_task(self.monitor())]
+
+        if port is not None:
+            server = await asyncio.start_server(self.handle_client, HOST, port, limit=MAX_REQUEST_SIZE)
+        else:
+            if os.path.exists(path):
+                os.remove(path)
+            server = await asyncio.start_unix_server(self.handle_client, path, limit=MAX_REQUEST_SIZE)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            for worker in self.workers:
+                worker.jobs.put(None)
+            for worker in self.workers:
+                worker.process.join(1.0)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+            if port is None and os.path.exists(path):
+                os.remove(path)
+
+# Συνάρτηση connect για την σύνδεση σε μια υπηρεσία που εκτελείται, σε Unix socket (path) ή σε TCP (port)
+async def connect(path=SOCKET_PATH, port=None):
+
+    if port is not None:
+        return await asyncio.open_connection(HOST, port, limit=MAX_REQUEST_SIZE)
+    return await asyncio.open_unix_connection(path, limit=MAX_REQUEST_SIZE)
+
+# Συνάρτηση submit (client) για την υποβολή ενός προβλήματος instance στην υπηρεσία με τον αλγόριθμο engine και τις επιπλέον παραμέτρους
+# options (time_limit, branching, tag). Επιστρέφει (async generator) τα γεγονότα της εργασίας μέχρι το τελικό "done" ή "error". Αν ο
+# καταναλωτής σταματήσει νωρίτερα (ή ακυρωθεί), η σύνδεση κλείνει και η εργασία ακυρώνεται
+async def submit(instance, engine="branch_and_bound", path=SOCKET_PATH, port=None, **options):
+
+    reader, writer = await connect(path, port)
+    try:
+        writer.write((json.dumps({"op": "submit", "engine": engine, "instance": instance, **options}) + "\n").encode())
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("the solver service closed the connection")
+            event = json.loads(line)
+            yield event
+            if event["event"] in ("done", "error"):
+                break
+    finally:
+        writer.close()
+
+# Συνάρτηση instance_from_file για το instance ενός αρχείου προβλήματος: το κείμενο του αρχείου .dat, ή οι πίνακες ενός αρχείου JSON
+def instance_from_file(filename):
+
+    with open(filename, "rt") as f:
+        text = f.read()
+    if filename.endswith(".json"):
+        return json.loads(text)
+    return {"dat": text}
+
+# Συνάρτηση print_events (client της γραμμής εντολών) για την υποβολή των αρχείων προβλημάτων problems και την εκτύπωση των γεγονότων τους
+async def print_events(problems, engine, path, port, options):
+
+    async def run(prob_file):
+        async for event in submit(instance_from_file(prob_file), engine, path, port, tag=prob_file, **options):
+            print(json.dumps(event), flush=True)
+
+    await asyncio.gather(*(run(prob_file) for prob_file in problems))
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Local job service that solves capital budgeting problems on warm worker processes")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path of the service")
+    parser.add_argument("--port", type=int, default=None, help="use TCP on localhost instead of a Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="start the service")
+    serve.add_argument("--workers", type=int, default=NUM_WORKERS)
+    serve.add_argument("--lp-engine", choices=["gurobi", "numpy"], default=None, help="LP engine of the branch and bound workers")
+    serve.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES), help="engines the workers load at start-up")
+
+    client = commands.add_parser("submit", help="submit problem files (.dat or .json) and print their events")
+    client.add_argument("problems", nargs="+")
+    client.add_argument("--engine", choices=ENGINES, default="branch_and_bound")
+    client.add_argument("--time-limit", type=float, default=None)
+    client.add_argument("--branching", choices=br.RULES, default=None)
+    args = parser.parse_args()
+
+    if args.port is None and not hasattr(asyncio, "start_unix_server"):
+        sys.exit("Unix sockets are not available on this platform, use --port")
+
+    try:
+        if args.command == "serve":
+            service = SolverService(args.workers, args.lp_engine, tuple(args.engines))
+            print(f"Serving on {f'{HOST}:{args.port}' if args.port is not None else args.socket} with {args.workers} workers")
+            asyncio.run(service.serve(args.socket, args.port))
+        else:
+            options = {"time_limit": args.time_limit, "branching": args.branching}
+            asyncio.run(print_events(args.problems, args.engine, args.socket, args.port, options))
+    except KeyboardInterrupt:
+        pass